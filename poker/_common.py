@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals, absolute_import, division, print_function
 
+import os
+import sys
 import random
 import functools
+import tempfile
 from collections import Iterable
 import enum
 
@@ -10,21 +13,38 @@ import enum
 class _PokerEnumMeta(enum.EnumMeta):
     def __init__(self, clsname, bases, classdict):
         # make sure we only have tuple values, not single values
-        for member in self.__members__.values():
+        for ordinal, member in enumerate(self):
             values = member._value_
             if not isinstance(values, Iterable) or isinstance(values, basestring):
                 raise TypeError('{} = {!r}, should be iterable, not {}!'
                                 .format(member._name_, values, type(values)))
+            # position in definition order, for fast comparisons
+            member._ordinal = ordinal
             for alias in values:
                 if isinstance(alias, unicode):
                     alias = alias.upper()
                 self._value2member_map_.setdefault(alias, member)
 
+        # exact spellings too, so most lookups don't need case folding
+        for member in self:
+            for alias in member._value_:
+                if (isinstance(alias, unicode) and
+                        self._value2member_map_[alias.upper()] is member):
+                    self._value2member_map_.setdefault(alias, member)
+
     def __call__(cls, value):
         """Return the appropriate instance with any of the values listed. If values contains
         text types, those will be looked up in a case insensitive manner."""
-        if isinstance(value, unicode):
-            value = value.upper()
+        if value.__class__ is cls:
+            return value
+        try:
+            member = cls._value2member_map_.get(value)
+        except TypeError:   # unhashable
+            member = None
+        if member is None and isinstance(value, unicode):
+            member = cls._value2member_map_.get(value.upper())
+        if member is not None:
+            return member
         return super(_PokerEnumMeta, cls).__call__(value)
 
     def make_random(cls):
@@ -44,13 +64,12 @@ class _OrderableMixin(object):
 
     def __eq__(self, other):
         if self.__class__ is other.__class__:
-            return self._value_ == other._value_
+            return self._ordinal == other._ordinal
         return NotImplemented
 
     def __lt__(self, other):
         if self.__class__ is other.__class__:
-            names = self.__class__._member_names_
-            return names.index(self._name_) < names.index(other._name_)
+            return self._ordinal < other._ordinal
         return NotImplemented
 
     def __reduce_ex__(self, proto):
@@ -94,3 +113,33 @@ def _make_float(string):
 
 def _make_int(string):
     return int(string.strip().replace(',', ''))
+
+
+if hasattr(os, 'replace'):
+    _replace_file = os.replace
+elif sys.platform == 'win32':
+    def _replace_file(source, destination):
+        # os.rename fails on Windows if the destination exists
+        import ctypes
+        MOVEFILE_REPLACE_EXISTING = 0x1
+        if not ctypes.windll.kernel32.MoveFileExW(unicode(source), unicode(destination),
+                                                  MOVEFILE_REPLACE_EXISTING):
+            raise ctypes.WinError()
+else:
+    _replace_file = os.rename
+
+
+def _write_file_atomically(path, data):
+    """Write data to a temporary file next to path, then move it over path, so concurrent
+    readers never see a half written file.
+    """
+    path = unicode(path)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+    try:
+        with os.fdopen(fd, 'wb') as fp:
+            fp.write(data)
+        _replace_file(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
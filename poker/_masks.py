@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Bitmask helpers shared by the card, hand and deck modules.
+
+    A card mask has one bit for every card, the bit index is the card index
+    (rank index * 4 + suit index, the position in ``list(Card)``).
+"""
+
+from .card import Card
+
+
+def iter_bits(mask):
+    """Indexes of the set bits in ascending order."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+def get_card_mask(cards):
+    """Mask of cards.
+
+    :param cards: :class:`poker.card.Card`, :class:`poker.hand.Combo`, a string of cards
+                  (e.g. ``'AsKd7c'``) or an iterable of any of these
+    """
+    if isinstance(cards, Card):
+        return 1 << cards._index
+    elif isinstance(cards, unicode):
+        return get_card_mask([Card(cards[start:start + 2]) for start in range(0, len(cards), 2)])
+
+    mask = 0
+    # Combos are not iterable, but have their cards
+    for card in getattr(cards, 'cards', cards):
+        mask |= get_card_mask(card)
+    return mask
@@ -0,0 +1,344 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Board texture analysis and hand strength classification on boards.
+
+    Every texture feature is calculated at once from a rank bitmask and the number of different
+    suits and ranks. The textures of all the 22100 possible flops are precalculated on first use,
+    so classifying parsed flops is a dictionary lookup.
+
+    Hands are evaluated from four 13 bit rank masks (one per suit); pairs, trips, straights and
+    flushes are found with bitwise operations and lookup tables indexed by rank masks.
+"""
+
+import itertools
+import threading
+from collections import namedtuple, Counter
+from ._common import PokerEnum
+from .card import Card
+
+
+__all__ = ['BoardTexture', 'get_texture', 'MadeHand', 'HandStrength', 'RangeStrength',
+           'classify', 'classify_range']
+
+
+BoardTexture = namedtuple('BoardTexture', 'is_rainbow, is_monotone, is_triplet, has_pair, '
+                                          'has_straightdraw, has_gutshot, has_flushdraw')
+"""Named tuple of board texture features."""
+
+
+class MadeHand(PokerEnum):
+    """Made hand categories, from worst to best. Pairs and trips only count if they are made
+    with at least one of the hole cards, e.g. a pair on the board is not a pair for the player.
+    Straights and better count even if the board alone makes them.
+    """
+    __order__ = ('NO_MADE_HAND ACE_HIGH WEAK_PAIR MIDDLE_PAIR POCKET_PAIR_BELOW_TOP_PAIR '
+                 'TOP_PAIR OVERPAIR TWO_PAIR TRIPS SET STRAIGHT FLUSH FULL_HOUSE QUADS '
+                 'STRAIGHT_FLUSH')
+
+    NO_MADE_HAND = 'no made hand',
+    ACE_HIGH = 'ace high',
+    WEAK_PAIR = 'weak pair',
+    MIDDLE_PAIR = 'middle pair',
+    POCKET_PAIR_BELOW_TOP_PAIR = 'pocket pair below top pair',
+    TOP_PAIR = 'top pair',
+    OVERPAIR = 'overpair',
+    TWO_PAIR = 'two pair',
+    TRIPS = 'trips',
+    SET = 'set',
+    STRAIGHT = 'straight',
+    FLUSH = 'flush',
+    FULL_HOUSE = 'full house',
+    QUADS = 'quads',
+    STRAIGHT_FLUSH = 'straight flush',
+
+
+HandStrength = namedtuple('HandStrength', 'made_hand, has_flushdraw, has_oesd, has_gutshot')
+"""Named tuple of the made hand and the draws of a combo on a board.
+Open ended straight draws include double gutshots.
+"""
+
+RangeStrength = namedtuple('RangeStrength', 'combos, made_hands, flushdraws, oesds, gutshots')
+"""Named tuple of number of combos in a range on a board: all the combos not blocked by the
+board, per made hand category (Counter of :class:`MadeHand`) and with draws.
+"""
+
+
+# bit of every card in a 52 bit board mask, bit index = rank index * 4 + suit index
+_CARD_BITS = {card: 1 << card._index for card in Card}
+
+_flop_textures = None
+_flop_textures_lock = threading.Lock()
+
+
+def get_texture(cards):
+    """Texture of the board (any number of cards). Flops are looked up from a precalculated
+    table, other boards are calculated.
+    """
+    board_mask = 0
+    for card in cards:
+        board_mask |= _CARD_BITS[card]
+
+    if len(cards) == 3:
+        return _get_flop_textures()[board_mask]
+    return _make_texture(board_mask, len(cards))
+
+
+def _get_flop_textures():
+    global _flop_textures
+    if _flop_textures is None:
+        with _flop_textures_lock:
+            if _flop_textures is None:
+                _flop_textures = _make_flop_textures()
+    return _flop_textures
+
+
+def _make_flop_textures():
+    # there are only a few different textures, share the instances
+    textures = {}
+    flop_textures = {}
+    for bits in itertools.combinations(_CARD_BITS.values(), 3):
+        board_mask = sum(bits)
+        texture = _make_texture(board_mask, 3)
+        flop_textures[board_mask] = textures.setdefault(texture, texture)
+    return flop_textures
+
+
+def _make_texture(board_mask, num_cards):
+    rank_mask = suit_mask = 0
+    for index in range(52):
+        if board_mask >> index & 1:
+            rank_mask |= 1 << (index >> 2)
+            suit_mask |= 1 << (index & 3)
+    num_ranks, num_suits = bin(rank_mask).count('1'), bin(suit_mask).count('1')
+
+    # ranks of any two cards are 1-3 (straightdraw) or 1-4 (gutshot) apart
+    close_ranks = rank_mask >> 1 | rank_mask >> 2 | rank_mask >> 3
+
+    return BoardTexture(
+        is_rainbow=num_suits == num_cards,
+        is_monotone=num_suits <= 1,
+        is_triplet=num_ranks <= 1,
+        has_pair=num_ranks < num_cards,
+        has_straightdraw=rank_mask & close_ranks != 0,
+        has_gutshot=rank_mask & (close_ranks | rank_mask >> 4) != 0,
+        has_flushdraw=num_suits < num_cards,
+    )
+
+
+# Hand values: category << 20 | five 4 bit rank indexes for deciding between the same category
+_HIGH_CARD, _PAIR, _TWO_PAIR, _TRIPS, _STRAIGHT, _FLUSH, _FULL_HOUSE, _QUADS, _STRAIGHT_FLUSH = \
+    range(9)
+_ACE = 12
+
+
+def _make_tables():
+    topbit = [0] + [mask.bit_length() - 1 for mask in range(1, 1 << 13)]
+    popcount = [bin(mask).count('1') for mask in range(1 << 13)]
+
+    def top_ranks(mask, num):
+        code = 0
+        for _ in range(num):
+            top = topbit[mask]
+            code = code << 4 | top
+            mask &= ~(1 << top)
+        return code
+
+    top1 = topbit
+    top2 = [top_ranks(mask, 2) for mask in range(1 << 13)]
+    top3 = [top_ranks(mask, 3) for mask in range(1 << 13)]
+    top5 = [top_ranks(mask, 5) for mask in range(1 << 13)]
+
+    # highest rank of a straight + 1, 0 if no straight; wheel counts with 5 high
+    straight_masks = [(0b11111 << low, low + 5) for low in range(8, -1, -1)]
+    straight_masks.append((1 << _ACE | 0b1111, 4))
+    straights = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        for straight_mask, high in straight_masks:
+            if mask & straight_mask == straight_mask:
+                straights[mask] = high
+                break
+
+    # ranks completing a straight
+    straight_outs = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if popcount[mask] >= 3:
+            for rank in range(13):
+                if not mask >> rank & 1 and straights[mask | 1 << rank]:
+                    straight_outs[mask] |= 1 << rank
+
+    return topbit, popcount, top1, top2, top3, top5, straights, straight_outs
+
+
+_TOPBIT, _POPCOUNT, _TOP1, _TOP2, _TOP3, _TOP5, _STRAIGHTS, _STRAIGHT_OUTS = _make_tables()
+
+
+def _evaluate(suit_masks):
+    """Value of the best hand from the cards in suit_masks. Bigger value is better hand."""
+    clubs, diamonds, hearts, spades = suit_masks
+    ranks = clubs | diamonds | hearts | spades
+    pairs = ((clubs & diamonds) | (clubs & hearts) | (clubs & spades) | (diamonds & hearts) |
+             (diamonds & spades) | (hearts & spades))
+    trips = ((clubs & diamonds & hearts) | (clubs & diamonds & spades) |
+             (clubs & hearts & spades) | (diamonds & hearts & spades))
+    quads = clubs & diamonds & hearts & spades
+
+    flush = 0
+    for mask in suit_masks:
+        if _POPCOUNT[mask] >= 5:
+            flush = mask
+    if flush and _STRAIGHTS[flush]:
+        return _STRAIGHT_FLUSH << 20 | (_STRAIGHTS[flush] - 1) << 16
+
+    if quads:
+        quad = _TOPBIT[quads]
+        return _QUADS << 20 | quad << 16 | _TOP1[ranks & ~(1 << quad)] << 12
+
+    if trips:
+        trip = _TOPBIT[trips]
+        other_pairs = pairs & ~(1 << trip)
+        if other_pairs:
+            return _FULL_HOUSE << 20 | trip << 16 | _TOPBIT[other_pairs] << 12
+
+    if flush:
+        return _FLUSH << 20 | _TOP5[flush]
+
+    if _STRAIGHTS[ranks]:
+        return _STRAIGHT << 20 | (_STRAIGHTS[ranks] - 1) << 16
+
+    if trips:
+        return _TRIPS << 20 | trip << 16 | _TOP2[ranks & ~(1 << trip)] << 8
+
+    if pairs:
+        pair1 = _TOPBIT[pairs]
+        other_pairs = pairs & ~(1 << pair1)
+        if other_pairs:
+            pair2 = _TOPBIT[other_pairs]
+            kicker = _TOP1[ranks & ~(1 << pair1) & ~(1 << pair2)]
+            return _TWO_PAIR << 20 | pair1 << 16 | pair2 << 12 | kicker << 8
+        return _PAIR << 20 | pair1 << 16 | _TOP3[ranks & ~(1 << pair1)] << 4
+
+    return _TOP5[ranks]
+
+
+_MADE_HANDS = {
+    _STRAIGHT: MadeHand.STRAIGHT,
+    _FLUSH: MadeHand.FLUSH,
+    _FULL_HOUSE: MadeHand.FULL_HOUSE,
+    _QUADS: MadeHand.QUADS,
+    _STRAIGHT_FLUSH: MadeHand.STRAIGHT_FLUSH,
+}
+
+
+class _Classifier(object):
+    """Precalculated board values, for classifying many combos on the same board."""
+
+    def __init__(self, board):
+        self.board_mask = 0
+        self.suit_masks = [0, 0, 0, 0]
+        self.rank_counts = [0] * 13
+        for card in board:
+            index = card._index
+            self.board_mask |= 1 << index
+            self.suit_masks[index & 3] |= 1 << (index >> 2)
+            self.rank_counts[index >> 2] += 1
+
+        self.value = _evaluate(self.suit_masks)
+        self.has_draws = len(board) < 5
+        self.ranks = self.suit_masks[0] | self.suit_masks[1] | self.suit_masks[2] | \
+            self.suit_masks[3]
+        self.top_rank = _TOPBIT[self.ranks] if self.ranks else -1
+        second_ranks = self.ranks & ~(1 << self.top_rank) if self.ranks else 0
+        self.second_rank = _TOPBIT[second_ranks] if second_ranks else -1
+        self.straight_outs = _STRAIGHT_OUTS[self.ranks]
+
+    def is_blocked(self, combo):
+        return bool(_CARD_BITS[combo.first] & self.board_mask or
+                    _CARD_BITS[combo.second] & self.board_mask)
+
+    def classify(self, combo):
+        index1, index2 = combo.first._index, combo.second._index
+        rank1, rank2 = index1 >> 2, index2 >> 2
+        suit1, suit2 = index1 & 3, index2 & 3
+        suit_masks = list(self.suit_masks)
+        suit_masks[suit1] |= 1 << rank1
+        suit_masks[suit2] |= 1 << rank2
+
+        value = _evaluate(suit_masks)
+        category = value >> 20
+        # even if the board alone makes it, a pair with the board is not the best hand then
+        if category >= _STRAIGHT:
+            made_hand = _MADE_HANDS[category]
+        else:
+            made_hand = self._classify_pairs(rank1, rank2)
+
+        if not self.has_draws:
+            return HandStrength(made_hand, False, False, False)
+
+        has_flushdraw = category < _FLUSH and (_POPCOUNT[suit_masks[suit1]] == 4 or
+                                               _POPCOUNT[suit_masks[suit2]] == 4)
+        has_oesd = has_gutshot = False
+        if category < _STRAIGHT:
+            ranks = suit_masks[0] | suit_masks[1] | suit_masks[2] | suit_masks[3]
+            # the board alone can't make the straight
+            outs = _POPCOUNT[_STRAIGHT_OUTS[ranks] & ~self.straight_outs]
+            has_oesd, has_gutshot = outs >= 2, outs == 1
+
+        return HandStrength(made_hand, has_flushdraw, has_oesd, has_gutshot)
+
+    def _classify_pairs(self, rank1, rank2):
+        count1, count2 = self.rank_counts[rank1], self.rank_counts[rank2]
+
+        if rank1 == rank2:
+            if count1:
+                return MadeHand.SET
+            elif rank1 > self.top_rank:
+                return MadeHand.OVERPAIR
+            elif rank1 > self.second_rank:
+                return MadeHand.POCKET_PAIR_BELOW_TOP_PAIR
+            return MadeHand.WEAK_PAIR
+
+        if count1 >= 2 or count2 >= 2:
+            return MadeHand.TRIPS
+        elif count1 and count2:
+            return MadeHand.TWO_PAIR
+        elif count1 or count2:
+            pair_rank = rank1 if count1 else rank2
+            if pair_rank == self.top_rank:
+                return MadeHand.TOP_PAIR
+            elif pair_rank == self.second_rank:
+                return MadeHand.MIDDLE_PAIR
+            return MadeHand.WEAK_PAIR
+        elif _ACE in (rank1, rank2):
+            return MadeHand.ACE_HIGH
+        return MadeHand.NO_MADE_HAND
+
+
+def classify(combo, board):
+    """Made hand and draws of combo on the board (tuple of Cards, flop, turn or river).
+
+    :rtype: :class:`HandStrength`
+    """
+    return _Classifier(board).classify(combo)
+
+
+def classify_range(combos, board):
+    """Number of combos per made hand and draws on the board, like Flopzilla does.
+    Combos which contain a board card are skipped.
+
+    :rtype: :class:`RangeStrength`
+    """
+    classifier = _Classifier(board)
+    made_hands = Counter()
+    num_combos = flushdraws = oesds = gutshots = 0
+    for combo in combos:
+        if classifier.is_blocked(combo):
+            continue
+        strength = classifier.classify(combo)
+        num_combos += 1
+        made_hands[strength.made_hand] += 1
+        flushdraws += strength.has_flushdraw
+        oesds += strength.has_oesd
+        gutshots += strength.has_gutshot
+    return RangeStrength(num_combos, made_hands, flushdraws, oesds, gutshots)
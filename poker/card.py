@@ -6,7 +6,7 @@ from functools import total_ordering
 from ._common import PokerEnum, _ReprMixin
 
 
-__all__ = ['Suit', 'Rank', 'Card', 'FACE_RANKS', 'BROADWAY_RANKS']
+__all__ = ['Suit', 'Rank', 'Card', 'FACE_RANKS', 'BROADWAY_RANKS', 'canonize', 'permute_suits']
 
 
 class Suit(PokerEnum):
@@ -43,15 +43,17 @@ class Rank(PokerEnum):
         """Tells the numerical difference between two ranks."""
 
         # so we always get a Rank instance even if string were passed in
-        first, second = cls(first), cls(second)
-        rank_list = list(cls)
-        return abs(rank_list.index(first) - rank_list.index(second))
+        return abs(cls(first)._ordinal - cls(second)._ordinal)
 
 
 FACE_RANKS = Rank('J'), Rank('Q'), Rank('K')
 
 BROADWAY_RANKS = Rank('T'), Rank('J'), Rank('Q'), Rank('K'), Rank('A')
 
+_RANK_INDEXES = {rank: index for index, rank in enumerate(Rank)}
+_SUITS = tuple(Suit)
+_SUIT_INDEXES = {suit: index for index, suit in enumerate(_SUITS)}
+
 
 class _CardMeta(type):
     def __new__(metacls, clsname, bases, classdict):
@@ -64,8 +66,7 @@ class _CardMeta(type):
     def make_random(cls):
         """Returns a random Card instance."""
         self = object.__new__(cls)
-        self.rank = Rank.make_random()
-        self.suit = Suit.make_random()
+        self._set_rank_and_suit(Rank.make_random(), Suit.make_random())
         return self
 
     def __iter__(cls):
@@ -77,7 +78,7 @@ class Card(_ReprMixin):
     """Represents a Card, which consists a Rank and a Suit."""
 
     __metaclass__ = _CardMeta
-    __slots__ = ('rank', 'suit')
+    __slots__ = ('rank', 'suit', '_index')
 
     def __new__(cls, card):
         if isinstance(card, cls):
@@ -87,36 +88,46 @@ class Card(_ReprMixin):
             raise ValueError('length should be two in %r' % card)
 
         self = object.__new__(cls)
-        self.rank = Rank(card[0])
-        self.suit = Suit(card[1])
+        self._set_rank_and_suit(Rank(card[0]), Suit(card[1]))
         return self
 
+    def _set_rank_and_suit(self, rank, suit):
+        self.rank, self.suit = rank, suit
+        # dense index (0-51) in ascending order, the same as the position in list(Card),
+        # it's unique so it's a collision free hash
+        self._index = _RANK_INDEXES[rank] * 4 + _SUIT_INDEXES[suit]
+
     def __hash__(self):
-        return hash(self.rank) + hash(self.suit)
+        return self._index
 
     def __getstate__(self):
         return {'rank': self.rank, 'suit': self.suit}
 
     def __setstate__(self, state):
-        self.rank, self.suit = state['rank'], state['suit']
+        self._set_rank_and_suit(state['rank'], state['suit'])
 
     def __eq__(self, other):
         if self.__class__ is other.__class__:
-            return self.rank == other.rank and self.suit == other.suit
+            return self._index == other._index
         return NotImplemented
 
     def __lt__(self, other):
         if self.__class__ is not other.__class__:
             return NotImplemented
 
-        # with same ranks, suit counts
-        if self.rank == other.rank:
-            return self.suit < other.suit
-        return self.rank < other.rank
+        # ranks first, with same ranks, suit counts
+        return self._index < other._index
 
     def __unicode__(self):
         return '{}{}'.format(self.rank, self.suit)
 
+    def canonize(self):
+        """The Card with canonical suit and the suit permutation leading to it.
+        See :func:`canonize`.
+        """
+        cards, permutation = canonize((self,))
+        return cards[0], permutation
+
     @property
     def is_face(self):
         return self.rank in FACE_RANKS
@@ -124,3 +135,33 @@ class Card(_ReprMixin):
     @property
     def is_broadway(self):
         return self.rank in BROADWAY_RANKS
+
+
+# the suit with the most (highest) cards becomes spades, the next one hearts, etc.
+_CANONICAL_SUITS = _SUITS[::-1]
+
+
+def canonize(cards):
+    """Map cards to the canonical form of their suit isomorphic class.
+
+    Boards (or any card collections) which differ only in suit names, like ``AsKs7d`` and
+    ``AhKh7c``, play the same way and have the same canonical form (here ``AsKs7h``),
+    so it can be used as a cache key. There are 1755 canonical flops out of the 22100.
+    Returns the canonical cards as a tuple in descending order and the permutation as a
+    dict of all the four suits (original Suit -> canonical Suit), which can be used to map
+    other cards (e.g. hole cards on the board) the same way with :func:`permute_suits`.
+    """
+    masks = dict.fromkeys(_SUITS, 0)
+    for card in cards:
+        masks[card.suit] |= 1 << _RANK_INDEXES[card.rank]
+    # sort is stable, so suits with the same ranks are always mapped the same way
+    ordered_suits = sorted(_SUITS, key=masks.get, reverse=True)
+    permutation = dict(zip(ordered_suits, _CANONICAL_SUITS))
+    return tuple(sorted(permute_suits(cards, permutation), reverse=True)), permutation
+
+
+def permute_suits(cards, permutation):
+    """Cards with their suits replaced according to the permutation (Suit -> Suit dict)."""
+    all_cards = Card._all_cards
+    return tuple(all_cards[_RANK_INDEXES[card.rank] * 4 + _SUIT_INDEXES[permutation[card.suit]]]
+                 for card in cards)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Batch rendering of range charts: many 13x13 range grids in one HTML document,
+    with cells colored by weight (heatmap).
+"""
+
+import cgi
+from .hand import Range, Hand, _GRID
+
+
+__all__ = ['ranges_to_html', 'DEFAULT_COLOR', 'DEFAULT_CSS']
+
+
+DEFAULT_COLOR = 51, 102, 204
+"""RGB color of cells with full weight, lower weights are more transparent."""
+
+DEFAULT_CSS = (
+    'table.range{border-collapse:collapse;margin-bottom:1em}'
+    'table.range td{border:1px solid #ccc;width:2.5em;height:1.8em;text-align:center;'
+    'font:12px sans-serif}'
+)
+"""Style sheet of the HTML document."""
+
+
+def ranges_to_html(ranges, titles=None, color=DEFAULT_COLOR, css=DEFAULT_CSS):
+    """One HTML document with a range table for every range. The tables have the same classes
+    as :meth:`poker.hand.Range.to_html`, and the cells have a background color with opacity
+    by weight.
+
+    :param ranges: iterable of :class:`poker.hand.Range`\\ s, the weight of a hand is the part of
+                   its combos in the range; or mappings of :class:`poker.hand.Hand` or hand
+                   string to weight between 0 and 1, e.g. calling frequencies
+    :param titles: optional iterable of titles, one for every range
+    :param color: RGB tuple of full weight cells
+    :param str css: style sheet
+    :rtype: str
+    """
+    red, green, blue = color
+    styles = tuple(' style="background-color:rgba({},{},{},{:.2f})"'
+                   .format(red, green, blue, alpha / 100) for alpha in range(101))
+    titles = iter(titles) if titles is not None else None
+
+    html = ['<!DOCTYPE html><html><head><meta charset="utf-8"><style>', css,
+            '</style></head><body>']
+    for range_ in ranges:
+        if titles is not None:
+            html.extend(['<h2>', cgi.escape(unicode(next(titles))), '</h2>'])
+        _append_table(html, _get_weights(range_), styles)
+    html.append('</body></html>')
+    return ''.join(html)
+
+
+def _get_weights(range_):
+    """Weights of the cells of the grid, row by row."""
+    if isinstance(range_, Range):
+        mask = range_._mask
+        return [bin(mask & cell.mask).count('1') / cell.num_combos
+                for row in _GRID for cell in row]
+
+    weights = {Hand(hand): weight for hand, weight in range_.items()}
+    return [weights.get(cell.hand, 0) for row in _GRID for cell in row]
+
+
+def _append_table(html, weights, styles):
+    weights = iter(weights)
+    html.append('<table class="range">')
+    for row in _GRID:
+        html.append('<tr>')
+        for cell in row:
+            alpha = int(round(min(max(next(weights), 0), 1) * 100))
+            if alpha:
+                html.extend(['<td class="', cell.cssclass, '"', styles[alpha], '>',
+                             cell.name, '</td>'])
+            else:
+                html.append(cell.empty_html)
+        html.append('</tr>')
+    html.append('</table>')
@@ -35,8 +35,16 @@ def _print_values(*args):
 
 
 @click.group()
-def poker():
+@click.option('--cache-dir', envvar='POKER_CACHE_DIR', type=click.Path(file_okay=False),
+              help="Cache downloaded pages in this directory. [env: POKER_CACHE_DIR]")
+@click.option('--cache-ttl', envvar='POKER_CACHE_TTL', type=int, default=0,
+              help="Use cached pages without asking the website for this many seconds. "
+                   "[env: POKER_CACHE_TTL]")
+def poker(cache_dir, cache_ttl):
     """Main command for the poker framework."""
+    if cache_dir:
+        from .website._common import configure
+        configure(cache_dir=cache_dir, cache_ttl=cache_ttl)
 
 
 @poker.command('range', short_help="Prints the range in a formatted table in ASCII or HTML.")
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Deck of cards with the remaining cards as a 52 bit mask.
+
+    Bit index of a card is its index in ``list(Card)`` (rank index * 4 + suit index), so dealing
+    and excluding cards are bit operations and dealt cards can be handed over as masks or as
+    card indexes in NumPy arrays for Monte Carlo simulations.
+"""
+
+import random
+from .card import Card
+from ._masks import iter_bits, get_card_mask
+
+
+__all__ = ['Deck', 'get_mask', 'to_masks', 'FULL_MASK']
+
+
+FULL_MASK = (1 << 52) - 1
+"""Mask of all the 52 cards."""
+
+_CARDS = tuple(Card)
+# number of random keys generated at once in Deck.deal_many, bounds the memory usage
+_BATCH_SIZE = 1 << 20
+
+
+class Deck(object):
+    """Deck of the 52 cards without the dead cards.
+
+    :param dead: cards which are never dealt (see :func:`get_mask` for the accepted types)
+    :param seed: seed for the random number generator, for reproducible deals
+    """
+
+    def __init__(self, dead=(), seed=None):
+        self._dead_mask = get_mask(dead)
+        self._mask = FULL_MASK & ~self._dead_mask
+        self._random = random.Random(seed)
+
+    def __len__(self):
+        return bin(self._mask).count('1')
+
+    def __contains__(self, card):
+        return bool(self._mask >> Card(card)._index & 1)
+
+    def __iter__(self):
+        return iter(self.cards)
+
+    def __repr__(self):
+        return '<{} of {} cards>'.format(self.__class__.__name__, len(self)).encode('utf-8')
+
+    @property
+    def mask(self):
+        """Mask of the remaining cards."""
+        return self._mask
+
+    @property
+    def cards(self):
+        """Remaining cards in ascending order."""
+        return tuple(_CARDS[index] for index in iter_bits(self._mask))
+
+    def remove(self, cards):
+        """Take cards out of the deck (e.g. the board or known hole cards) until :meth:`reset`.
+        Cards not in the deck are ignored.
+        """
+        self._mask &= ~get_mask(cards)
+
+    def reset(self):
+        """Put back every dealt and removed card, except the dead ones."""
+        self._mask = FULL_MASK & ~self._dead_mask
+
+    def deal(self, num_cards=1, exclude=()):
+        """Deal random cards, they are removed from the deck.
+
+        :param int num_cards: number of cards
+        :param exclude: cards which shouldn't be dealt this time, but stay in the deck
+                        (e.g. blockers of a combo)
+        :return: tuple of :class:`poker.card.Card`\\ s in dealing order
+        """
+        return tuple(_CARDS[index] for index in self._deal_indexes(num_cards, exclude))
+
+    def deal_mask(self, num_cards=1, exclude=()):
+        """Same as :meth:`deal`, but the dealt cards are returned as a mask."""
+        mask = 0
+        for index in self._deal_indexes(num_cards, exclude):
+            mask |= 1 << index
+        return mask
+
+    def _deal_indexes(self, num_cards, exclude):
+        available = self._mask & ~get_mask(exclude)
+        num_available = bin(available).count('1')
+        if num_cards > num_available:
+            raise ValueError('Only {} cards can be dealt, not {}.'
+                             .format(num_available, num_cards))
+
+        if num_available >= 26:
+            # rejection sampling, at least every second card is available
+            random_, indexes, dealt = self._random.random, [], 0
+            while len(indexes) < num_cards:
+                index = int(random_() * 52)
+                if available >> index & 1 and not dealt >> index & 1:
+                    dealt |= 1 << index
+                    indexes.append(index)
+        else:
+            indexes = self._random.sample(list(iter_bits(available)), num_cards)
+            dealt = sum(1 << index for index in indexes)
+
+        self._mask &= ~dealt
+        return indexes
+
+    def deal_many(self, num_deals, num_cards, exclude=()):
+        """Independent deals from the remaining cards, e.g. boards for Monte Carlo simulations.
+        The deck is not changed. Needs NumPy.
+
+        :param int num_deals: number of deals
+        :param int num_cards: number of cards in every deal
+        :param exclude: cards which shouldn't be dealt
+        :return: ``numpy.ndarray`` of card indexes (``uint8``) with ``(num_deals, num_cards)``
+                 shape, see :func:`to_masks` for converting them to masks
+        """
+        import numpy as np
+
+        available = np.array(list(iter_bits(self._mask & ~get_mask(exclude))), dtype=np.uint8)
+        if num_cards > len(available):
+            raise ValueError('Only {} cards can be dealt, not {}.'
+                             .format(len(available), num_cards))
+
+        random_state = np.random.RandomState(self._random.getrandbits(32))
+        deals = np.empty((num_deals, num_cards), dtype=np.uint8)
+        batch_size = max(1, _BATCH_SIZE // len(available)) if len(available) else num_deals
+        for start in range(0, num_deals, batch_size):
+            stop = min(start + batch_size, num_deals)
+            # the positions of the smallest random keys are a random sample without replacement
+            keys = random_state.random_sample((stop - start, len(available)))
+            positions = np.argsort(keys, axis=1)[:, :num_cards]
+            deals[start:stop] = available[positions]
+        return deals
+
+
+def get_mask(cards):
+    """Mask of cards.
+
+    :param cards: :class:`poker.card.Card`, :class:`poker.hand.Combo`, a string of cards
+                  (e.g. ``'AsKd7c'``) or an iterable of any of these
+    """
+    return get_card_mask(cards)
+
+
+def to_masks(deals):
+    """Convert card indexes from :meth:`Deck.deal_many` to an array of card masks
+    (``uint64``, one per deal). Needs NumPy.
+    """
+    import numpy as np
+
+    bits = np.left_shift(np.uint64(1), deals.astype(np.uint64))
+    return np.bitwise_or.reduce(bits, axis=1)
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Exhaustive enumeration of runouts: every way the board can be completed with the cards which
+    are not on the board and not dead.
+
+    Runouts are NumPy arrays, either card indexes (index in ``list(Card)``) or 52 bit card masks
+    (``uint64``, same bits as :mod:`poker.deck`). Runouts which are the same up to renaming suits
+    (keeping the board and the dead cards in place) play the same way, so they can be collapsed
+    into one canonical runout with the size of the class as weight.
+
+    Needs NumPy.
+"""
+
+import itertools
+import numpy as np
+from .deck import get_mask, FULL_MASK
+
+
+__all__ = ['runout_cards', 'runouts', 'canonical_runouts', 'count_runouts']
+
+
+def runout_cards(board=(), dead=(), num_cards=None):
+    """All runouts as card indexes.
+
+    :param board: cards on the board (see :func:`poker.deck.get_mask` for the accepted types)
+    :param dead: cards which can't come, e.g. hole cards
+    :param int num_cards: number of cards to come, default is completing the board to 5 cards
+    :return: ``numpy.ndarray`` of card indexes (``uint8``) with ``(num_runouts, num_cards)``
+             shape, cards of a runout are in ascending order, runouts in lexicographic order
+    """
+    available, num_cards = _prepare(board, dead, num_cards)
+    return available[_combinations(len(available), num_cards)]
+
+
+def runouts(board=(), dead=(), num_cards=None):
+    """All runouts as masks of the cards to come (``numpy.ndarray`` of ``uint64``),
+    same order as :func:`runout_cards`. ``board_mask | runouts`` are the final boards.
+    """
+    return _to_masks(runout_cards(board, dead, num_cards))
+
+
+def canonical_runouts(board=(), dead=(), num_cards=None):
+    """Runouts collapsed by suit isomorphism.
+
+    Two runouts are equivalent if a renaming of the suits which doesn't change the board and
+    the dead cards (as sets) maps one to the other, e.g. on ``AsKs7s`` with no dead cards
+    the turns ``2h``, ``2d`` and ``2c`` are the same.
+
+    :return: tuple of the canonical runout masks (ascending ``uint64`` array) and their
+             weights (``int64`` array), the number of runouts in their class;
+             weights add up to :func:`count_runouts`
+    """
+    cards = runout_cards(board, dead, num_cards)
+    fixed_mask = get_mask(board), get_mask(dead)
+    canonical = _to_masks(cards)
+    for permutation in _SUIT_PERMUTATIONS[1:]:
+        if all(_permute_mask(mask, permutation) == mask for mask in fixed_mask):
+            canonical = np.minimum(canonical, _to_masks(permutation[cards]))
+    masks, weights = np.unique(canonical, return_counts=True)
+    return masks, weights.astype(np.int64)
+
+
+def count_runouts(board=(), dead=(), num_cards=None):
+    """Number of runouts, without enumerating them."""
+    available, num_cards = _prepare(board, dead, num_cards)
+    count = 1
+    for taken in range(num_cards):
+        count = count * (len(available) - taken) // (taken + 1)
+    return count
+
+
+def _prepare(board, dead, num_cards):
+    board_mask, dead_mask = get_mask(board), get_mask(dead)
+    if num_cards is None:
+        num_cards = max(5 - bin(board_mask).count('1'), 0)
+    remaining = FULL_MASK & ~board_mask & ~dead_mask
+    available = np.array([index for index in range(52) if remaining >> index & 1], dtype=np.uint8)
+    if num_cards > len(available):
+        raise ValueError('Only {} cards can come, not {}.'.format(len(available), num_cards))
+    return available, num_cards
+
+
+def _combinations(n, k):
+    """All k element subsets of range(n) as rows of indexes, in lexicographic order."""
+    combinations = np.zeros((1, 0), dtype=np.intp)
+    for column in range(k):
+        # every row is extended with every bigger index which still leaves room for the rest
+        starts = combinations[:, -1] + 1 if column else np.zeros(1, dtype=np.intp)
+        counts = np.maximum(n - (k - column - 1) - starts, 0)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        combinations = np.hstack([np.repeat(combinations, counts, axis=0),
+                                  (np.repeat(starts, counts) + offsets)[:, np.newaxis]])
+    return combinations
+
+
+def _to_masks(cards):
+    bits = np.left_shift(np.uint64(1), cards.astype(np.uint64))
+    return np.bitwise_or.reduce(bits, axis=1)
+
+
+def _permute_mask(mask, permutation):
+    permuted = 0
+    for index in range(52):
+        if mask >> index & 1:
+            permuted |= 1 << int(permutation[index])
+    return permuted
+
+
+def _make_suit_permutations():
+    """Card index -> permuted card index, for every permutation of the suits.
+    The first one is the identity.
+    """
+    ranks = np.arange(13).repeat(4)
+    suits = np.tile(np.arange(4), 13)
+    return [(ranks * 4 + np.array(permutation)[suits]).astype(np.uint8)
+            for permutation in itertools.permutations(range(4))]
+
+
+_SUIT_PERMUTATIONS = _make_suit_permutations()
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Heads-up preflop all-in equities.
+
+    The equities of every hand against every other hand (169 x 169) are precalculated exactly,
+    by evaluating every possible board, and shipped in a small binary file, which is memory
+    mapped on first use. An entry is the average equity over all the combo matchups of the two
+    hands which don't share a card.
+
+    Ranges are looked up by weighting the hands with their number of matchups, so card removal
+    between the hands is counted. The equity of a single combo matchup is approximated by the
+    equity of its hands though: shared suits are not taken into account, e.g. AhKh against QhJh
+    and against QsJs both have the AKs against QJs equity.
+    The table can be regenerated with ``python -m poker.equity`` (needs NumPy).
+"""
+
+import mmap
+import struct
+import threading
+from pathlib import Path
+from .hand import Hand, Combo
+
+
+__all__ = ['preflop_equity', 'preflop_hand_equity', 'TABLE_VERSION']
+
+
+TABLE_VERSION = 1
+"""Version of the binary table format and content."""
+
+_TABLE_PATH = Path(__file__).parent / 'data' / 'preflop_equity.bin'
+
+# magic, version, number of hands;
+# then 169 x 169 little-endian uint16 equities (equity * 65535) of the row hand against the
+# column hand and 169 x 169 uint8 number of non-conflicting combo matchups between them.
+_MAGIC = b'PFEQ'
+_HEADER = struct.Struct(b'<4sHH')
+_EQUITY = struct.Struct(b'<H')
+_EQUITY_SCALE = 65535
+
+# the order of the hands in the table
+_HANDS = tuple(Hand)
+_HAND_INDEX = {hand: index for index, hand in enumerate(_HANDS)}
+
+
+class _PreflopTable(object):
+    """Memory mapped equity table."""
+
+    def __init__(self, filename):
+        with open(unicode(filename), 'rb') as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, size = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC or version != TABLE_VERSION or size != len(_HANDS):
+            raise ValueError('Invalid preflop equity table: {}'.format(filename))
+
+        self._size = size
+        self._equities_offset = _HEADER.size
+        self._counts_offset = self._equities_offset + size * size * _EQUITY.size
+
+    def equity(self, index1, index2):
+        offset = self._equities_offset + (index1 * self._size + index2) * _EQUITY.size
+        return _EQUITY.unpack_from(self._mmap, offset)[0] / _EQUITY_SCALE
+
+    def matchups(self, index1, index2):
+        return ord(self._mmap[self._counts_offset + index1 * self._size + index2])
+
+
+_table = None
+_table_lock = threading.Lock()
+
+
+def _get_table():
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = _PreflopTable(_TABLE_PATH)
+    return _table
+
+
+def preflop_hand_equity(hand1, hand2):
+    """Equity of hand1 against hand2 all-in preflop, averaged over all of their
+    non-conflicting combo matchups.
+    """
+    return _get_table().equity(_HAND_INDEX[Hand(hand1)], _HAND_INDEX[Hand(hand2)])
+
+
+def preflop_equity(range1, range2):
+    """Equity of range1 against range2 all-in preflop.
+
+    Every non-conflicting combo matchup counts with the same weight. Whole hands are looked up
+    with their number of matchups; for single combos, the matchups are counted one by one and
+    the average equity of their hands is used, which is an approximation: the suits the combos
+    share don't change it. Returns None if there is no possible matchup.
+    """
+    table = _get_table()
+    hands1, combos1 = _split_range(range1)
+    hands2, combos2 = _split_range(range2)
+
+    total_equity = total_matchups = 0
+
+    for index1 in hands1:
+        for index2 in hands2:
+            matchups = table.matchups(index1, index2)
+            if matchups:
+                total_equity += table.equity(index1, index2) * matchups
+                total_matchups += matchups
+
+    # pairs involving single combos; combos of whole hands are expanded only here
+    pairs = [(combos1, _expand(hands2)), (_expand(hands1), combos2), (combos1, combos2)]
+    for first_combos, second_combos in pairs:
+        for combo1, index1 in first_combos:
+            cards1 = {combo1.first, combo1.second}
+            for combo2, index2 in second_combos:
+                if combo2.first in cards1 or combo2.second in cards1:
+                    continue
+                total_equity += table.equity(index1, index2)
+                total_matchups += 1
+
+    if not total_matchups:
+        return None
+    return total_equity / total_matchups
+
+
+def _split_range(range_):
+    """Hand indexes of whole hands and (combo, hand index) pairs of combos not in those hands."""
+    hand_indexes = {_HAND_INDEX[hand] for hand in range_._hands}
+    combos = []
+    for combo in range_._combos:
+        index = _HAND_INDEX[combo.to_hand()]
+        if index not in hand_indexes:
+            combos.append((combo, index))
+    return hand_indexes, combos
+
+
+def _expand(hand_indexes):
+    return [(combo, index) for index in hand_indexes for combo in _HANDS[index].to_combos()]
+
+
+def _generate_table(filename):
+    """Calculate the exact equity table by evaluating every board, and write it to filename.
+
+    Suit permutations of a board give the same sums over whole hands, so only one board from
+    every suit isomorphic class is evaluated, weighted by the size of the class.
+    Takes a few minutes and needs NumPy.
+    """
+    import itertools
+    import collections
+    import numpy as np
+
+    card_indexes = list(range(52))      # index = rank * 4 + suit, same order as iter(Card)
+    all_combos = list(itertools.combinations(card_indexes, 2))
+    combo_hands = np.array([_HAND_INDEX[_make_combo(c1, c2).to_hand()] for c1, c2 in all_combos])
+
+    # sort combos by hand, so sums over hands are sums over contiguous rows
+    order = np.argsort(combo_hands, kind='mergesort')
+    combo_cards = np.array(all_combos)[order]
+    combo_hands = combo_hands[order]
+    hand_starts = np.searchsorted(combo_hands, np.arange(len(_HANDS)))
+    num_combos, num_hands = len(combo_hands), len(_HANDS)
+
+    has_card = np.zeros((52, num_combos), dtype=bool)
+    for card in card_indexes:
+        has_card[card] = (combo_cards == card).any(axis=1)
+
+    # combos sharing a card with each other (in both orders)
+    conflicts = has_card[combo_cards[:, 0]] | has_card[combo_cards[:, 1]]
+    np.fill_diagonal(conflicts, False)
+    conflict_first, conflict_second = np.nonzero(conflicts)
+    conflict_hands = combo_hands[conflict_first] * num_hands + combo_hands[conflict_second]
+
+    # number of non-conflicting combo matchups between hands
+    hand_onehot = np.zeros((num_combos, num_hands))
+    hand_onehot[np.arange(num_combos), combo_hands] = 1
+    matchups = hand_onehot.T.dot((~conflicts).astype(float)).dot(hand_onehot)
+    matchups -= np.diag(np.diag(hand_onehot.T.dot(hand_onehot)))  # combo against itself
+
+    evaluator = _Evaluator(np)
+    boards = collections.Counter()
+    for board in itertools.combinations(card_indexes, 5):
+        suit_masks = [0, 0, 0, 0]
+        for card in board:
+            suit_masks[card & 3] |= 1 << (card >> 2)
+        boards[tuple(sorted(suit_masks, reverse=True))] += 1
+
+    # sum of +1 for wins, -1 for losses of hand1 against hand2 over all boards
+    results = np.zeros((num_hands, num_hands), dtype=np.int64)
+    for suit_masks, weight in boards.items():
+        board = [rank * 4 + suit for suit, mask in enumerate(suit_masks)
+                 for rank in range(13) if mask >> rank & 1]
+        live = ~has_card[board].any(axis=0)
+        live_indexes = np.nonzero(live)[0]
+        cards = np.hstack([combo_cards[live], np.tile(board, (len(live_indexes), 1))])
+        values = np.full(num_combos, -1, dtype=np.int64)
+        values[live] = evaluator.evaluate(cards)
+        live_values, live_hands = values[live], combo_hands[live]
+
+        # for every combo, number of combos of every hand it beats minus which beat it
+        by_value = np.argsort(live_values, kind='mergesort')
+        sorted_values = live_values[by_value]
+        cumulative = np.zeros((len(live_indexes) + 1, num_hands), dtype=np.int32)
+        cumulative[np.arange(1, len(live_indexes) + 1), live_hands[by_value]] = 1
+        cumulative = cumulative.cumsum(axis=0)
+        lower = cumulative[np.searchsorted(sorted_values, live_values, 'left')]
+        higher = cumulative[-1] - cumulative[np.searchsorted(sorted_values, live_values, 'right')]
+        combo_results = np.zeros((num_combos, num_hands), dtype=np.int64)
+        combo_results[live] = lower - higher
+        board_results = np.add.reduceat(combo_results, hand_starts, axis=0)
+
+        # the above counted conflicting combos too, take them out
+        both_live = live[conflict_first] & live[conflict_second]
+        signs = np.sign(values[conflict_first[both_live]] - values[conflict_second[both_live]])
+        board_results -= np.bincount(conflict_hands[both_live], weights=signs,
+                                     minlength=num_hands * num_hands
+                                     ).astype(np.int64).reshape(num_hands, num_hands)
+        results += weight * board_results
+
+    boards_per_matchup = _num_combinations(48, 5)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        equities = 0.5 + results / (2.0 * matchups * boards_per_matchup)
+    equities[matchups == 0] = 0
+
+    with open(unicode(filename), 'wb') as fp:
+        fp.write(_HEADER.pack(_MAGIC, TABLE_VERSION, num_hands))
+        fp.write(np.round(equities * _EQUITY_SCALE).astype('<u2').tobytes())
+        fp.write(matchups.astype('u1').tobytes())
+
+
+def _make_combo(first, second):
+    from .card import Card
+    cards = list(Card)
+    return Combo.from_cards(cards[first], cards[second])
+
+
+def _num_combinations(n, k):
+    result = 1
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+
+class _Evaluator(object):
+    """Vectorized 7 card hand evaluator for generating the tables. Bigger value is better hand.
+
+    Value: category << 20 | five 4 bit rank digits for deciding between the same categories.
+    """
+
+    def __init__(self, np):
+        self.np = np
+        masks = np.arange(1 << 13)
+        bits = (masks[:, None] >> np.arange(13)) & 1
+
+        self.topbit = np.zeros(1 << 13, dtype=np.int64)
+        self.topbit[1:] = np.floor(np.log2(masks[1:])).astype(np.int64)
+
+        # rank digits of the highest n bits of every mask
+        self.top = {}
+        for n in (1, 2, 3, 5):
+            codes = np.zeros(1 << 13, dtype=np.int64)
+            remaining = masks.copy()
+            for _ in range(n):
+                top = self.topbit[remaining]
+                codes = codes << 4 | np.where(remaining > 0, top, 0)
+                remaining = np.where(remaining > 0, remaining & ~(1 << top), 0)
+            self.top[n] = codes
+
+        # highest rank of a straight + 1, 0 if no straight
+        self.straight = np.zeros(1 << 13, dtype=np.int64)
+        for top in range(12, 2, -1):
+            ranks = [12, 0, 1, 2, 3] if top == 3 else list(range(top - 4, top + 1))
+            self.straight[bits[:, ranks].all(axis=1) & (self.straight == 0)] = top + 1
+
+        self.powers = 1 << np.arange(13)
+
+    def evaluate(self, cards):
+        np = self.np
+        ranks, suits = cards >> 2, cards & 3
+        rank_counts = (ranks[:, :, None] == np.arange(13)).sum(axis=1)
+        suit_counts = (suits[:, :, None] == np.arange(4)).sum(axis=1)
+
+        mask1 = (rank_counts >= 1).dot(self.powers)
+        mask2 = (rank_counts >= 2).dot(self.powers)
+        mask3 = (rank_counts >= 3).dot(self.powers)
+        mask4 = (rank_counts == 4).dot(self.powers)
+
+        flush_suit = suit_counts.argmax(axis=1)
+        has_flush = suit_counts.max(axis=1) >= 5
+        flush_mask = np.where(suits == flush_suit[:, None], 1 << ranks, 0).sum(axis=1)
+        flush_mask = np.where(has_flush, flush_mask, 0)
+
+        top, top1, top2, top3, top5 = (self.topbit, self.top[1], self.top[2], self.top[3],
+                                       self.top[5])
+        quads = top[mask4]
+        trips = top[mask3]
+        full_pair = top[mask2 & ~(1 << trips)]
+        pair1 = top[mask2]
+        pair2 = top[mask2 & ~(1 << pair1)]
+        straight_flush = self.straight[flush_mask]
+        straight = self.straight[mask1]
+
+        conditions = [
+            straight_flush > 0,
+            mask4 > 0,
+            (mask3 > 0) & ((mask2 & ~(1 << trips)) > 0),
+            has_flush,
+            straight > 0,
+            mask3 > 0,
+            (mask2 & ~(1 << pair1)) > 0,
+            mask2 > 0,
+        ]
+        values = [
+            8 << 20 | (straight_flush - 1) << 16,
+            7 << 20 | quads << 16 | top1[mask1 & ~(1 << quads)] << 12,
+            6 << 20 | trips << 16 | full_pair << 12,
+            5 << 20 | top5[flush_mask],
+            4 << 20 | (straight - 1) << 16,
+            3 << 20 | trips << 16 | top2[mask1 & ~(1 << trips)] << 8,
+            2 << 20 | pair1 << 16 | pair2 << 12 | top1[mask1 & ~(1 << pair1) & ~(1 << pair2)] << 8,
+            1 << 20 | pair1 << 16 | top3[mask1 & ~(1 << pair1)] << 4,
+        ]
+        return np.select(conditions, values, default=top5[mask1])
+
+
+if __name__ == '__main__':
+    _generate_table(_TABLE_PATH)
@@ -3,23 +3,35 @@ from __future__ import unicode_literals, absolute_import, division, print_functi
 
 import re
 import random
+import bisect
 import itertools
 import functools
 from decimal import Decimal
+from collections import namedtuple
 from pathlib import Path
 from cached_property import cached_property
 from ._common import PokerEnum, _ReprMixin
-from .card import Suit, Rank, Card, BROADWAY_RANKS
+from .card import Suit, Rank, Card, BROADWAY_RANKS, canonize, _RANK_INDEXES, _SUIT_INDEXES
+from .board import classify, classify_range
+from ._masks import iter_bits, get_card_mask
+from .orderings import ORDERINGS
 
 
 __all__ = ['Shape', 'Hand', 'Combo', 'Range', 'PAIR_HANDS', 'OFFSUIT_HANDS', 'SUITED_HANDS']
 
 
-# pregenerated all the possible suit combinations, so we don't have to count them all the time
-_PAIR_SUIT_COMBINATIONS = ('cd', 'ch', 'cs', 'dh', 'ds', 'hs')
-_OFFSUIT_SUIT_COMBINATIONS = ('cd', 'ch', 'cs', 'dc', 'dh', 'ds',
-                              'hc', 'hd', 'hs', 'sc', 'sd', 'sh')
-_SUITED_SUIT_COMBINATIONS = ('cc', 'dd', 'hh', 'ss')
+def _get_suit_indexes(suit_combinations):
+    return tuple((_SUIT_INDEXES[Suit(first)], _SUIT_INDEXES[Suit(second)])
+                 for first, second in suit_combinations)
+
+
+# pregenerated all the possible suit combinations, so we don't have to count them all the time,
+# as suit indexes, so the cards can be looked up by index
+_PAIR_SUIT_COMBINATIONS = _get_suit_indexes(('cd', 'ch', 'cs', 'dh', 'ds', 'hs'))
+_OFFSUIT_SUIT_COMBINATIONS = _get_suit_indexes(('cd', 'ch', 'cs', 'dc', 'dh', 'ds',
+                                                'hc', 'hd', 'hs', 'sc', 'sd', 'sh'))
+_SUITED_SUIT_COMBINATIONS = _get_suit_indexes(('cc', 'dd', 'hh', 'ss'))
+_NUM_NON_PAIRS = 156
 
 
 class Shape(PokerEnum):
@@ -58,6 +70,7 @@ class _HandMeta(type):
             obj._shape = ''
         else:
             obj._shape = random.choice(['s', 'o'])
+        obj._set_index()
         return obj
 
 
@@ -65,7 +78,7 @@ class _HandMeta(type):
 class Hand(_ReprMixin):
     """General hand without a precise suit. Only knows about two ranks and shape."""
     __metaclass__ = _HandMeta
-    __slots__ = ('first', 'second', '_shape')
+    __slots__ = ('first', 'second', '_shape', '_index')
 
     def __new__(cls, hand):
         if isinstance(hand, cls):
@@ -91,6 +104,7 @@ class Hand(_ReprMixin):
             self._shape = shape
 
         self._set_ranks_in_order(first, second)
+        self._set_index()
 
         return self
 
@@ -98,42 +112,33 @@ class Hand(_ReprMixin):
         return '{}{}{}'.format(self.first, self.second, self.shape)
 
     def __hash__(self):
-        return hash(self.first) + hash(self.second) + hash(self.shape)
+        return self._index
 
     def __getstate__(self):
         return {'first': self.first, 'second': self.second, '_shape': self._shape}
 
     def __setstate__(self, state):
         self.first, self.second, self._shape = state['first'], state['second'], state['_shape']
+        self._set_index()
 
     def __eq__(self, other):
         if self.__class__ is not other.__class__:
             return NotImplemented
 
         # AKs != AKo, because AKs is better
-        return (self.first == other.first and
-                self.second == other.second and
-                self.shape.val == other.shape.val)
+        return self._index == other._index
 
     def __lt__(self, other):
         if self.__class__ is not other.__class__:
             return NotImplemented
+        return self._index < other._index
 
-        # pairs are better than non-pairs
-        if not self.is_pair and other.is_pair:
-            return True
-        elif self.is_pair and not other.is_pair:
-            return False
-        elif (not self.is_pair and not other.is_pair and
-                self.first == other.first and self.second == other.second and
-                self._shape != other._shape):
-            # when Rank match, only suit is the deciding factor
-            # so, offsuit hand is 'less' than suited
-            return self._shape == 'o'
-        elif self.first == other.first:
-            return self.second < other.second
-        else:
-            return self.first < other.first
+    @property
+    def order(self):
+        """Sort key (0-168) in ascending order: non-pairs by first then second rank, offsuit
+        before suited, then pairs. Same as the position in ``list(Hand)``.
+        """
+        return self._index
 
     def _set_ranks_in_order(self, first, second):
         # set as Rank objects.
@@ -141,14 +146,35 @@ class Hand(_ReprMixin):
         if self.first < self.second:
             self.first, self.second = self.second, self.first
 
+    def _set_index(self):
+        """Dense index (0-168), the position in list(Hand): non-pairs by ranks, offsuit before
+        suited, then pairs. It's unique so it's a collision free hash.
+        """
+        first, second = _RANK_INDEXES[self.first], _RANK_INDEXES[self.second]
+        if first == second:
+            self._index = _NUM_NON_PAIRS + first
+        else:
+            self._index = (first * (first - 1) // 2 + second) * 2 + (self._shape == 's')
+
+    def _copy(self):
+        # Hands are mutable, the ones in the lookup tables are copied before handing them out
+        hand = object.__new__(self.__class__)
+        hand.first, hand.second, hand._shape = self.first, self.second, self._shape
+        hand._index = self._index
+        return hand
+
     def to_combos(self):
-        first, second = self.first.val, self.second.val
+        # Card index is rank index * 4 + suit index
+        all_cards = Card._all_cards
+        first, second = _RANK_INDEXES[self.first] * 4, _RANK_INDEXES[self.second] * 4
         if self.is_pair:
-            return tuple(Combo(first + s1 + first + s2) for s1, s2 in _PAIR_SUIT_COMBINATIONS)
+            suit_combinations = _PAIR_SUIT_COMBINATIONS
         elif self.is_offsuit:
-            return tuple(Combo(first + s1 + second + s2) for s1, s2 in _OFFSUIT_SUIT_COMBINATIONS)
+            suit_combinations = _OFFSUIT_SUIT_COMBINATIONS
         else:
-            return tuple(Combo(first + s1 + second + s2) for s1, s2 in _SUITED_SUIT_COMBINATIONS)
+            suit_combinations = _SUITED_SUIT_COMBINATIONS
+        return tuple(Combo.from_cards(all_cards[first + s1], all_cards[second + s2])
+                     for s1, s2 in suit_combinations)
 
     @property
     def is_suited_connector(self):
@@ -196,6 +222,7 @@ class Hand(_ReprMixin):
     @shape.setter
     def shape(self, value):
         self._shape = Shape(value).val
+        self._set_index()
 
 
 PAIR_HANDS = tuple(hand for hand in Hand if hand.is_pair)
@@ -230,9 +257,10 @@ class Combo(_ReprMixin):
     @classmethod
     def from_cards(cls, first, second):
         self = super(Combo, cls).__new__(cls)
-        first = first.rank.val + first.suit.val
-        second = second.rank.val + second.suit.val
-        self._set_cards_in_order(first, second)
+        first, second = Card(first), Card(second)
+        if first == second:
+            raise ValueError('Combo can contain only unique cards.')
+        self._set_cards(*((first, second) if first._index > second._index else (second, first)))
         return self
 
     @classmethod
@@ -245,51 +273,49 @@ class Combo(_ReprMixin):
         return ''.join(unicode(self._cards))
 
     def __hash__(self):
-        return sum([hash(card) for card in self._cards])
+        return self._index
 
     def __getstate__(self):
         return {'first': self.first, 'second': self.second}
 
     def __setstate__(self, state):
-        self.first, self.second = state['first'], state['second']
+        self._set_cards(state['first'], state['second'])
 
     def __eq__(self, other):
         if self.__class__ is other.__class__:
-            return self.first == other.first and self.second == other.second
+            return self._index == other._index
         return NotImplemented
 
     def __lt__(self, other):
         if self.__class__ is not other.__class__:
             return NotImplemented
+        return _COMBO_ORDERS[self._index] < _COMBO_ORDERS[other._index]
 
-        # lookup optimization
-        self_is_pair, other_is_pair = self.is_pair, other.is_pair
-        self_first, other_first = self.first, other.first
-
-        if self_is_pair and other_is_pair:
-            if self_first == other_first:
-                return self.second < other.second
-            return self_first < other_first
-
-        elif self_is_pair or other_is_pair:
-            # Pairs are better than non-pairs
-            return self_is_pair < other_is_pair
-
-        else:
-            if self_first.rank == other_first.rank:
-                if self.second.rank == other.second.rank:
-                    # same ranks, suited go first in order by Suit rank
-                    if self.is_suited or other.is_suited:
-                        return self.is_suited < other.is_suited
-                    # both are suited
-                    return self_first.suit < other_first.suit
-                return self.second < other.second
-            return self_first < other_first
+    @property
+    def order(self):
+        """Sort key (0-1325) in ascending order: non-pairs by first then second rank, offsuit
+        before suited, then by the cards; then pairs by the cards.
+        """
+        return _COMBO_ORDERS[self._index]
 
     def _set_cards_in_order(self, *args):
         """Set cards in nondecreasing order"""
-        self._cards = [Card(card_str) for card_str in args]
-        self._cards.sort(reverse=True)
+        self._set_cards(*sorted((Card(card_str) for card_str in args), reverse=True))
+
+    def _set_cards(self, *cards):
+        # the first two cards in nonincreasing order, the setters can get them in any order
+        first, second = sorted((Card(cards[0]), Card(cards[1])), reverse=True)
+        self._cards = [first, second] + [Card(card) for card in cards[2:]]
+        # dense index (0-1325) of the cards with indexes first > second,
+        # it's unique so it's a collision free hash
+        first, second = first._index, second._index
+        self._index = first * (first - 1) // 2 + second
+
+    def _copy(self):
+        # Combos are mutable, the ones in the lookup tables are copied before handing them out
+        combo = super(Combo, self.__class__).__new__(self.__class__)
+        combo._set_cards(*self._cards)
+        return combo
 
     @property
     def cards(self):
@@ -301,7 +327,7 @@ class Combo(_ReprMixin):
 
     @first.setter
     def first(self, value):
-        self._cards[0] = value
+        self._set_cards(value, *self._cards[1:])
 
     @property
     def second(self):
@@ -309,11 +335,26 @@ class Combo(_ReprMixin):
 
     @second.setter
     def second(self, value):
-        self._cards[1] = value
+        self._set_cards(self.first, value, *self._cards[2:])
+
+    def canonize(self):
+        """The Combo in canonical suits and the suit permutation leading to it.
+        See :func:`poker.card.canonize`.
+        """
+        cards, permutation = canonize(self._cards)
+        combo = super(Combo, self.__class__).__new__(self.__class__)
+        combo._set_cards(*cards)
+        return combo, permutation
+
+    def classify(self, board):
+        """Made hand and draws on the board (tuple of Cards).
+        See :func:`poker.board.classify`.
+        """
+        return classify(self, board)
 
     def to_hand(self):
         """Convert combo to :class:`Hand` object, losing suit information."""
-        return Hand('{}{}{}'.format(self.first.rank, self.second.rank, self.shape))
+        return _COMBO_HANDS[self._index]._copy()
 
     @property
     def is_suited_connector(self):
@@ -380,6 +421,7 @@ class _RegexRangeLexer(object):
     rules = (
         # NAME, REGEX, value extractor METHOD NAME
         ('ALL', r"XX", '_get_value'),
+        ('PERCENT', r"\d+(\.\d*)?%$", '_get_percent'),
         ('PAIR', r"{}\1$".format(_rank), '_get_first'),
         ('PAIR_PLUS', r"{}\1\+$".format(_rank), '_get_first'),
         ('PAIR_MINUS', r"{}\1-$".format(_rank), '_get_first'),
@@ -433,6 +475,10 @@ class _RegexRangeLexer(object):
     def _get_value(token):
         return token
 
+    @staticmethod
+    def _get_percent(token):
+        return float(token[:-1])
+
     @staticmethod
     def _get_first(token):
         return token[0]
@@ -503,6 +549,9 @@ class Range(object):
                 # full range, no need to parse any more name
                 break
 
+            elif name == 'PERCENT':
+                self._hands.update(_get_top_hands(value, 'equity'))
+
             elif name == 'PAIR':
                 self._add_pair(value)
 
@@ -630,11 +679,71 @@ class Range(object):
         range_string = Path(filename).open().read()
         return cls(range_string)
 
+    @classmethod
+    def top(cls, percent, ordering='equity'):
+        """The strongest hands by a preflop ordering, e.g. ``Range.top(15)`` is the same as
+        ``Range('15%')``. The cutoff is the number of hands which gets closest to the percent
+        of all the combos.
+
+        :param percent: 0-100
+        :param str ordering: name of one of the :data:`poker.orderings.ORDERINGS`
+        """
+        self = cls()
+        self._hands.update(_get_top_hands(percent, ordering))
+        return self
+
     @classmethod
     def from_objects(cls, iterable):
-        """Make an instance from an iterable of Combos, Hands or both."""
-        range_string = ' '.join(unicode(obj) for obj in iterable)
-        return cls(range_string)
+        """Make an instance from an iterable of Combos, Hands or both.
+        Strings are converted to :class:`Combo` if they are 4 characters long, :class:`Hand`
+        otherwise.
+        """
+        self = cls()
+        for obj in iterable:
+            if isinstance(obj, unicode):
+                obj = Combo(obj) if len(obj) == 4 else Hand(obj)
+            if isinstance(obj, Combo):
+                self._combos.add(obj)
+            elif isinstance(obj, Hand):
+                self._hands.add(obj)
+            else:
+                raise ValueError('{!r} is not a Combo or a Hand.'.format(obj))
+        return self
+
+    @classmethod
+    def from_hands(cls, hands):
+        """Make an instance from an iterable of :class:`Hand`\\ s (or hand strings)."""
+        self = cls()
+        self._hands.update(Hand(hand) for hand in hands)
+        return self
+
+    @classmethod
+    def from_combos(cls, combos):
+        """Make an instance from an iterable of :class:`Combo`\\ s (or combo strings).
+        Combos making up a whole hand are stored as the :class:`Hand`.
+        """
+        mask = 0
+        for combo in combos:
+            mask |= 1 << Combo(combo)._index
+        return cls.from_mask(mask)
+
+    @classmethod
+    def from_mask(cls, mask):
+        """Make an instance from a bitmask of combos, the bit index is the combo index
+        (0-1325, see :attr:`Combo.order` for sorting). Combos making up a whole hand are stored
+        as the :class:`Hand`.
+        """
+        self = cls()
+        # fill the cache of the cached_property
+        self.__dict__['_mask'] = mask
+        for hand, hand_mask in _HAND_MASKS:
+            combos_mask = mask & hand_mask
+            if combos_mask == hand_mask:
+                self._hands.add(hand._copy())
+            elif combos_mask:
+                self._combos.update(_ALL_COMBOS[index]._copy()
+                                    for index in iter_bits(combos_mask))
+        return self
 
     def __eq__(self, other):
         if self.__class__ is other.__class__:
@@ -647,16 +756,13 @@ class Range(object):
         return NotImplemented
 
     def __contains__(self, item):
+        if isinstance(item, unicode):
+            item = Combo(item) if len(item) == 4 else Hand(item)
+
         if isinstance(item, Combo):
-            return item in self._combos or item.to_hand() in self._hands
+            return bool(self._mask >> item._index & 1)
         elif isinstance(item, Hand):
-            return item in self._all_hands
-        elif isinstance(item, unicode):
-            if len(item) == 4:
-                combo = Combo(item)
-                return combo in self._combos or combo.to_hand() in self._hands
-            else:
-                return Hand(item) in self._all_hands
+            return bool(self._mask & _HAND_MASKS[item._index][1])
 
     def __len__(self):
         return self._count_combos()
@@ -680,6 +786,33 @@ class Range(object):
     def __hash__(self):
         return hash(self.combos)
 
+    def classify(self, board):
+        """Number of combos per made hand category and draws on the board (tuple of Cards).
+        See :func:`poker.board.classify_range`.
+        """
+        return classify_range(self._all_combos, board)
+
+    def count_on_board(self, board):
+        """Number of combos which don't contain any of the board cards (card removal).
+
+        :param board: :class:`poker.card.Card`, :class:`Combo`, a string of cards
+                      (e.g. ``'AsKd7c'``) or an iterable of any of these, can be dead cards too
+        """
+        return bin(self._mask & ~_get_blocked_mask(board)).count('1')
+
+    def sampler(self, dead=(), weights=None, seed=None):
+        """Random combo sampler over the live combos of the range.
+        See :class:`poker.sampler.ComboSampler` for the parameters.
+        """
+        from .sampler import ComboSampler
+        return ComboSampler(self.combos, weights=weights, dead=dead, seed=seed)
+
+    def live(self, dead_cards):
+        """New Range without the combos containing any of the dead cards, e.g. the board and
+        the hero's hole cards. Accepts the same types as :meth:`count_on_board`.
+        """
+        return self.from_mask(self._mask & ~_get_blocked_mask(dead_cards))
+
     def to_html(self):
         """Returns a 13x13 HTML table representing the range.
 
@@ -689,30 +822,14 @@ class Range(object):
         Calculating it should not take more than 30ms (which takes calculating a 100% range).
         """
 
-        # note about speed: I tried with functools.lru_cache, and the initial call was 3-4x slower
-        # than without it, and the need for calling this will usually be once, so no need to cache
-
+        # the cells are precomputed in _GRID, a hand is in the range if any of its combos are
+        mask = self._mask
         html = ['<table class="range">']
 
-        for row in reversed(Rank):
+        for row in _GRID:
             html.append('<tr>')
-
-            for col in reversed(Rank):
-                if row > col:
-                    suit, cssclass = 's', 'suited'
-                elif row < col:
-                    suit, cssclass = 'o', 'offsuit'
-                else:
-                    suit, cssclass = '', 'pair'
-
-                html.append('<td class="%s">' % cssclass)
-                hand = Hand(row.val + col.val + suit)
-
-                if hand in self.hands:
-                    html.append(unicode(hand))
-
-                html.append('</td>')
-
+            for cell in row:
+                html.append(cell.html if mask & cell.mask else cell.empty_html)
             html.append('</tr>')
 
         html.append('</table>')
@@ -731,21 +848,13 @@ class Range(object):
         else:
             line = border = lastline = ''
 
-        for row in reversed(Rank):
-            for col in reversed(Rank):
-                if row > col:
-                    suit = 's'
-                elif row < col:
-                    suit = 'o'
-                else:
-                    suit = ''
-
-                hand = Hand(row.val + col.val + suit)
-                hand = unicode(hand) if hand in self.hands else ''
+        mask = self._mask
+        for row in _GRID:
+            for cell in row:
                 table.append(border)
-                table.append(hand.ljust(4))
+                table.append(cell.ascii if mask & cell.mask else '    ')
 
-            if row.val != '2':
+            if row is not _GRID[-1]:
                 table.append(border)
                 table.append('\n')
                 table.append(line)
@@ -783,7 +892,7 @@ class Range(object):
         if not combos:
             return []
 
-        sorted_combos = sorted(combos, reverse=True)
+        sorted_combos = _sort_by_order(combos, 1326)[::-1]
         hands_and_combos = []
         current_combos = []
         last_combo = sorted_combos[0]
@@ -859,11 +968,11 @@ class Range(object):
         """Tuple of hands contained in this range. If only one combo of the same hand is present,
         it will be shown here. e.g. ``Range('2s2c').hands == (Hand('22'),)``
         """
-        return tuple(sorted(self._all_hands))
+        return _sort_by_order(self._all_hands, 169)
 
     @cached_property
     def combos(self):
-        return tuple(sorted(self._all_combos))
+        return _sort_by_order(self._all_combos, 1326)
 
     @cached_property
     def percent(self):
@@ -897,6 +1006,148 @@ class Range(object):
         combo_hands = {combo.to_hand() for combo in self._combos}
         return combo_hands | self._hands
 
+    @cached_property
+    def _mask(self):
+        """Bitmask of all the combos, bit index is the combo index."""
+        mask = 0
+        for hand in self._hands:
+            # _HAND_MASKS is in list(Hand) order
+            mask |= _HAND_MASKS[hand._index][1]
+        for combo in self._combos:
+            mask |= 1 << combo._index
+        return mask
+
+
+_HAND_COMBOS = tuple((hand, hand.to_combos()) for hand in Hand)
+
+_ALL_COMBOS = tuple(sorted((combo for _, combos in _HAND_COMBOS for combo in combos),
+                           key=lambda combo: combo._index))
+
+
+def _make_combo_hands():
+    """Combo index -> Hand."""
+    hands = [None] * len(_ALL_COMBOS)
+    for hand, combos in _HAND_COMBOS:
+        for combo in combos:
+            hands[combo._index] = hand
+    return tuple(hands)
+
+
+_COMBO_HANDS = _make_combo_hands()
+
+
+def _make_combo_orders():
+    """Combo index -> order."""
+    def get_sort_key(combo):
+        first, second = combo.first, combo.second
+        return (combo.is_pair, first.rank._ordinal, second.rank._ordinal, combo.is_suited,
+                first._index, second._index)
+
+    orders = [None] * len(_ALL_COMBOS)
+    for order, combo in enumerate(sorted(_ALL_COMBOS, key=get_sort_key)):
+        orders[combo._index] = order
+    return tuple(orders)
+
+
+_COMBO_ORDERS = _make_combo_orders()
+
+
+def _sort_by_order(objects, num_orders):
+    """Unique Hands or Combos in ascending order, by putting them into the slots of their orders
+    (counting sort).
+    """
+    slots = [None] * num_orders
+    for obj in objects:
+        slots[obj.order] = obj
+    return tuple(obj for obj in slots if obj is not None)
+
+
+_HAND_MASKS = tuple((hand, sum(1 << combo._index for combo in combos))
+                    for hand, combos in _HAND_COMBOS)
+
+
+_GridCell = namedtuple('_GridCell', 'hand name mask num_combos cssclass html empty_html ascii')
+
+
+def _make_grid():
+    """13x13 range grid rows from AA to 22, suited hands above the pairs, offsuit below."""
+    ranks = tuple(Rank)[::-1]
+    grid = []
+    for row in ranks:
+        cells = []
+        for col in ranks:
+            if row > col:
+                shape, cssclass = 's', 'suited'
+            elif row < col:
+                shape, cssclass = 'o', 'offsuit'
+            else:
+                shape, cssclass = '', 'pair'
+            hand = Hand(row.val + col.val + shape)
+            name, mask = unicode(hand), _HAND_MASKS[hand._index][1]
+            html = '<td class="{}">{}</td>'.format(cssclass, name)
+            empty_html = '<td class="{}"></td>'.format(cssclass)
+            cells.append(_GridCell(hand, name, mask, bin(mask).count('1'), cssclass,
+                                   html, empty_html, name.ljust(4)))
+        grid.append(tuple(cells))
+    return tuple(grid)
+
+
+_GRID = _make_grid()
+
+
+def _make_hand_orderings():
+    """Ordering name -> (Hands in order, number of combos of the first n hands)."""
+    hands_by_name = {unicode(hand): hand for hand in Hand}
+    hand_orderings = {}
+    for name, ordering in ORDERINGS.items():
+        hands = tuple(hands_by_name[hand_name] for hand_name in ordering)
+        combo_counts = [0]
+        for hand in hands:
+            combo_counts.append(combo_counts[-1] + len(hand.to_combos()))
+        hand_orderings[name] = hands, tuple(combo_counts)
+    return hand_orderings
+
+
+_HAND_ORDERINGS = _make_hand_orderings()
+
+
+def _get_top_hands(percent, ordering):
+    if not 0 <= percent <= 100:
+        raise ValueError('Percent should be between 0 and 100, not {}.'.format(percent))
+    try:
+        hands, combo_counts = _HAND_ORDERINGS[ordering]
+    except KeyError:
+        raise ValueError('Unknown ordering: {!r}, possible orderings are: {}'
+                         .format(ordering, ', '.join(sorted(_HAND_ORDERINGS))))
+
+    num_combos = percent / 100 * 1326
+    # the most hands with not more combos, or one more if that's closer
+    num_hands = bisect.bisect_right(combo_counts, num_combos) - 1
+    if (num_hands < len(hands) and
+            combo_counts[num_hands + 1] - num_combos < num_combos - combo_counts[num_hands]):
+        num_hands += 1
+    return tuple(hand._copy() for hand in hands[:num_hands])
+
+
+def _make_card_combo_masks():
+    """Card index -> mask of the combos containing the card."""
+    masks = [0] * 52
+    for combo in _ALL_COMBOS:
+        for card in combo.cards:
+            masks[card._index] |= 1 << combo._index
+    return tuple(masks)
+
+
+_CARD_COMBO_MASKS = _make_card_combo_masks()
+
+
+def _get_blocked_mask(cards):
+    """Mask of the combos containing any of the cards (see :func:`poker.deck.get_mask`)."""
+    mask = 0
+    for index in iter_bits(get_card_mask(cards)):
+        mask |= _CARD_COMBO_MASKS[index]
+    return mask
+
 
 if __name__ == '__main__':
     import cProfile
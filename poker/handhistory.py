@@ -6,13 +6,12 @@ from __future__ import unicode_literals, absolute_import, division, print_functi
 """
 
 import io
-import itertools
 from collections import namedtuple
 from datetime import datetime
 import pytz
 from zope.interface import Interface, Attribute
 from cached_property import cached_property
-from .card import Rank
+from .board import get_texture
 
 
 _Player = namedtuple('_Player', 'name, stack, seat, combo')
@@ -87,35 +86,39 @@ class _BaseStreet(object):
         self.cards = None
         self._parse_cards(flop[0])
         self._parse_actions(flop[1:])
-        self._all_combinations = itertools.combinations(self.cards, 2)
 
     @cached_property
+    def texture(self):
+        """All the board texture features as a :class:`poker.board.BoardTexture`."""
+        return get_texture(self.cards)
+
+    @property
     def is_rainbow(self):
-        return all(first.suit != second.suit for first, second in self._all_combinations)
+        return self.texture.is_rainbow
 
-    @cached_property
+    @property
     def is_monotone(self):
-        return all(first.suit == second.suit for first, second in self._all_combinations)
+        return self.texture.is_monotone
 
-    @cached_property
+    @property
     def is_triplet(self):
-        return all(first.rank == second.rank for first, second in self._all_combinations)
+        return self.texture.is_triplet
 
-    @cached_property
+    @property
     def has_pair(self):
-        return any(first.rank == second.rank for first, second in self._all_combinations)
+        return self.texture.has_pair
 
-    @cached_property
+    @property
     def has_straightdraw(self):
-        return any(1 <= diff <= 3 for diff in self._get_differences())
+        return self.texture.has_straightdraw
 
-    @cached_property
+    @property
     def has_gutshot(self):
-        return any(1 <= diff <= 4 for diff in self._get_differences())
+        return self.texture.has_gutshot
 
-    @cached_property
+    @property
     def has_flushdraw(self):
-        return any(first.suit == second.suit for first, second in self._all_combinations)
+        return self.texture.has_flushdraw
 
     @cached_property
     def players(self):
@@ -128,10 +131,6 @@ class _BaseStreet(object):
                 player_names.append(player_name)
         return tuple(player_names)
 
-    def _get_differences(self):
-        return (Rank.difference(first.rank, second.rank)
-                for first, second in self._all_combinations)
-
 
 class _BaseHandHistory(object):
     """Abstract base class for *all* kinds of parser."""
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Independent Chip Model (Malmuth-Harville) tournament equities.
+
+    Places are handed out one after the other, every remaining player getting the next place with
+    the probability of their share of the remaining chips. The exact calculation goes through the
+    sets of players who got the paid places (as bitmasks), summing up the probabilities of all the
+    orders leading to the same set, so every set is calculated once. For large fields, where there
+    are too many sets, finishing orders are sampled (Monte Carlo).
+    Players without chips (busted in the hand) finish after every player with chips.
+"""
+
+import random
+from collections import OrderedDict
+
+
+__all__ = ['icm', 'exact_icm', 'monte_carlo_icm', 'players_icm', 'EXACT_LIMIT', 'TRIALS']
+
+
+EXACT_LIMIT = 500000
+"""Maximum number of steps for calculating equities exactly with :func:`icm`,
+above this Monte Carlo approximation is used.
+"""
+
+TRIALS = 20000
+"""Default number of sampled finishing orders for Monte Carlo approximation."""
+
+
+def icm(stacks, payouts):
+    """ICM equities of the players, in the same order as stacks.
+
+    Calculated exactly if it's feasible (see :data:`EXACT_LIMIT`), approximated otherwise.
+    Payouts are the prizes from first place, there can be fewer payouts than players.
+    """
+    if _count_steps(len(stacks), len(payouts)) <= EXACT_LIMIT:
+        return exact_icm(stacks, payouts)
+    return monte_carlo_icm(stacks, payouts)
+
+
+def exact_icm(stacks, payouts):
+    """Exact ICM equities of the players, in the same order as stacks."""
+    stacks, payouts, num_alive = _prepare(stacks, payouts)
+    total = sum(stacks)
+    equities = [0.] * len(stacks)
+    last_place = num_alive - 1
+
+    # placed players bitmask -> [probability, chips of placed players]
+    placed_sets = {0: [1., 0.]}
+    for place, payout in enumerate(payouts[:num_alive]):
+        next_sets = {}
+        for placed, (probability, placed_chips) in placed_sets.items():
+            remaining_chips = total - placed_chips
+            for player, stack in enumerate(stacks):
+                if not stack or placed >> player & 1:
+                    continue
+                player_probability = probability * stack / remaining_chips
+                equities[player] += player_probability * payout
+                if place < last_place:
+                    next_set = next_sets.setdefault(placed | 1 << player,
+                                                    [0., placed_chips + stack])
+                    next_set[0] += player_probability
+        placed_sets = next_sets
+
+    return _add_busted_payouts(equities, stacks, payouts, num_alive)
+
+
+def monte_carlo_icm(stacks, payouts, trials=None, seed=None):
+    """Approximate ICM equities of the players, in the same order as stacks, by sampling
+    finishing orders. The standard error is about ``payout / sqrt(trials)``.
+    The default number of trials is :data:`TRIALS`.
+    """
+    trials = trials or TRIALS
+    stacks, payouts, num_alive = _prepare(stacks, payouts)
+    players = [player for player, stack in enumerate(stacks) if stack]
+
+    # With exponentially distributed finishing times with the rate of their stacks, players
+    # finish first with the probability of their share of the remaining chips.
+    expovariate = random.Random(seed).expovariate
+    num_places = min(len(payouts), num_alive)
+    totals = [0.] * len(stacks)
+    for _ in range(trials):
+        order = sorted(players, key=lambda player: expovariate(stacks[player]))
+        for place in range(num_places):
+            totals[order[place]] += payouts[place]
+
+    equities = [total / trials for total in totals]
+    return _add_busted_payouts(equities, stacks, payouts, num_alive)
+
+
+def players_icm(players, payouts):
+    """ICM equities of players of a parsed hand history (``hand.players``) by player name,
+    in seating order.
+    """
+    equities = icm([player.stack for player in players], payouts)
+    return OrderedDict((player.name, equity) for player, equity in zip(players, equities))
+
+
+def _prepare(stacks, payouts):
+    stacks = [float(stack or 0) for stack in stacks]
+    payouts = [float(payout) for payout in payouts][:len(stacks)]
+    num_alive = sum(1 for stack in stacks if stack)
+    if not num_alive:
+        raise ValueError('At least one player should have chips.')
+    return stacks, payouts, num_alive
+
+
+def _add_busted_payouts(equities, stacks, payouts, num_alive):
+    """Players without chips finish after the others, sharing the payouts of their places."""
+    busted = [player for player, stack in enumerate(stacks) if not stack]
+    if busted:
+        share = sum(payouts[num_alive:]) / len(busted)
+        for player in busted:
+            equities[player] = share
+    return equities
+
+
+def _count_steps(num_players, num_payouts):
+    steps, placed_sets = 0, 1
+    for placed in range(min(num_players, num_payouts)):
+        steps += placed_sets * (num_players - placed)
+        placed_sets = placed_sets * (num_players - placed) // (placed + 1)
+    return steps
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Preflop orderings of the 169 hands, strongest first, used by :meth:`poker.hand.Range.top`.
+
+    The tables are generated from the preflop equity table of :mod:`poker.equity`
+    with ``python -m poker.orderings``.
+"""
+
+
+__all__ = ['EQUITY', 'EQUITY_VS_TOP20', 'SKLANSKY_CHUBUKOV', 'ORDERINGS']
+
+
+EQUITY = (
+    'AA', 'KK', 'QQ', 'JJ', 'TT', '99', '88', 'AKs', '77', 'AQs', 'AJs', 'AKo', 'ATs', 'AQo',
+    'AJo', 'KQs', '66', 'A9s', 'ATo', 'KJs', 'A8s', 'KTs', 'KQo', 'A7s', 'A9o', 'KJo', '55', 'QJs',
+    'K9s', 'A5s', 'A6s', 'A8o', 'KTo', 'QTs', 'A4s', 'A7o', 'K8s', 'A3s', 'QJo', 'K9o', 'A5o',
+    'A6o', 'Q9s', 'K7s', 'JTs', 'A2s', 'QTo', '44', 'A4o', 'K6s', 'K8o', 'Q8s', 'A3o', 'K5s',
+    'J9s', 'Q9o', 'JTo', 'K7o', 'A2o', 'K4s', 'Q7s', 'K6o', 'K3s', 'T9s', 'J8s', '33', 'Q6s',
+    'Q8o', 'K5o', 'J9o', 'K2s', 'Q5s', 'T8s', 'K4o', 'J7s', 'Q4s', 'Q7o', 'T9o', 'J8o', 'K3o',
+    'Q6o', 'Q3s', '98s', 'T7s', 'J6s', 'K2o', '22', 'Q2s', 'Q5o', 'J5s', 'T8o', 'J7o', 'Q4o',
+    '97s', 'J4s', 'T6s', 'J3s', 'Q3o', '98o', '87s', 'T7o', 'J6o', '96s', 'J2s', 'Q2o', 'T5s',
+    'J5o', 'T4s', '97o', '86s', 'J4o', 'T6o', '95s', 'T3s', '76s', 'J3o', '87o', 'T2s', '85s',
+    '96o', 'J2o', 'T5o', '94s', '75s', 'T4o', '93s', '86o', '65s', '84s', '95o', 'T3o', '92s',
+    '76o', '74s', 'T2o', '54s', '85o', '64s', '83s', '94o', '75o', '82s', '73s', '93o', '65o',
+    '53s', '63s', '84o', '92o', '43s', '74o', '72s', '54o', '64o', '52s', '62s', '83o', '42s',
+    '82o', '73o', '53o', '63o', '32s', '43o', '72o', '52o', '62o', '42o', '32o',
+)
+"""Ordered by all-in equity against a random hand."""
+
+EQUITY_VS_TOP20 = (
+    'AA', 'KK', 'QQ', 'AKs', 'JJ', 'AKo', 'TT', 'AQs', 'AQo', 'AJs', '99', 'AJo', 'ATs', '88',
+    'ATo', '77', 'A9s', 'KQs', '66', 'A9o', 'A8s', '55', 'KQo', 'KJs', '44', 'A7s', '33', 'A8o',
+    'A5s', '22', 'A6s', 'A4s', 'A3s', 'KTs', 'KJo', 'A2s', 'A7o', 'QJs', 'A5o', 'A6o', 'A4o',
+    'KTo', 'A3o', 'A2o', 'JTs', 'K9s', 'QTs', 'T9s', 'QJo', 'J9s', '98s', 'K8s', 'T8s', 'Q9s',
+    '87s', '76s', 'K6s', 'K7s', '65s', 'J8s', 'K5s', '86s', '97s', 'JTo', 'Q8s', '54s', 'K9o',
+    'K4s', 'QTo', 'T7s', 'K3s', '75s', 'K2s', '96s', 'Q6s', '64s', 'J7s', 'T6s', '85s', 'Q5s',
+    'T9o', 'Q7s', '53s', 'Q4s', 'J6s', '43s', 'J5s', 'Q3s', '74s', 'J9o', '98o', '95s', 'Q2s',
+    '63s', 'J4s', 'T8o', '87o', 'Q9o', '52s', 'K8o', 'T5s', '84s', 'J3s', 'T4s', '76o', 'K6o',
+    'J2s', '65o', 'T3s', 'K7o', '42s', 'J8o', 'T2s', '86o', 'K5o', '97o', '73s', '32s', '62s',
+    '94s', '54o', '93s', 'Q8o', 'K4o', '92s', 'T7o', '82s', '83s', 'K3o', '75o', '96o', 'K2o',
+    '64o', 'Q6o', '72s', 'J7o', 'T6o', '85o', '53o', 'Q5o', 'Q7o', 'Q4o', 'J6o', '43o', 'J5o',
+    '74o', 'Q3o', '95o', '63o', 'Q2o', 'J4o', '52o', 'T5o', '84o', 'J3o', 'T4o', 'J2o', '42o',
+    'T3o', 'T2o', '73o', '32o', '62o', '94o', '93o', '92o', '82o', '83o', '72o',
+)
+"""Ordered by all-in equity against the top 20% of the hands by :data:`EQUITY`."""
+
+SKLANSKY_CHUBUKOV = (
+    'AA', 'KK', 'AKs', 'QQ', 'AKo', 'JJ', 'AQs', 'TT', 'AQo', '99', 'AJs', '88', 'ATs', 'AJo',
+    '77', '66', 'ATo', 'A9s', '55', 'A8s', 'KQs', '44', 'A9o', 'A7s', 'KJs', 'A5s', 'A8o', 'A6s',
+    'A4s', '33', 'KTs', 'A7o', 'A3s', 'KQo', 'A2s', 'A5o', 'A6o', 'A4o', 'KJo', 'QJs', 'A3o', '22',
+    'K9s', 'A2o', 'KTo', 'QTs', 'K8s', 'K7s', 'JTs', 'K9o', 'K6s', 'QJo', 'Q9s', 'K5s', 'K8o',
+    'K4s', 'QTo', 'K7o', 'K3s', 'K2s', 'Q8s', 'K6o', 'J9s', 'K5o', 'Q9o', 'JTo', 'K4o', 'Q7s',
+    'T9s', 'Q6s', 'K3o', 'J8s', 'Q5s', 'K2o', 'Q8o', 'Q4s', 'J9o', 'Q3s', 'T8s', 'J7s', 'Q7o',
+    'Q2s', 'Q6o', '98s', 'Q5o', 'J8o', 'T9o', 'J6s', 'T7s', 'J5s', 'Q4o', 'J4s', 'J7o', 'Q3o',
+    '97s', 'T8o', 'J3s', 'T6s', 'Q2o', 'J2s', '87s', 'J6o', '98o', 'T7o', '96s', 'J5o', 'T5s',
+    'T4s', '86s', 'J4o', 'T6o', '97o', 'T3s', '76s', '95s', 'J3o', 'T2s', '87o', '85s', '96o',
+    'T5o', 'J2o', '75s', '94s', 'T4o', '65s', '86o', '93s', '84s', '95o', 'T3o', '76o', '92s',
+    '74s', '54s', 'T2o', '85o', '64s', '83s', '94o', '75o', '82s', '73s', '93o', '65o', '53s',
+    '63s', '84o', '92o', '43s', '74o', '72s', '54o', '64o', '52s', '62s', '83o', '42s', '82o',
+    '73o', '53o', '63o', '32s', '43o', '72o', '52o', '62o', '42o', '32o',
+)
+"""Ordered by Sklansky-Chubukov number: the biggest stack (in big blinds) with which pushing
+from the small blind heads-up is still better than folding even if the big blind knew the hand.
+Ties are broken by :data:`EQUITY`.
+"""
+
+ORDERINGS = {
+    'equity': EQUITY,
+    'equity_vs_top20': EQUITY_VS_TOP20,
+    'sklansky_chubukov': SKLANSKY_CHUBUKOV,
+}
+"""Ordering name -> ordering, names accepted by :meth:`poker.hand.Range.top`."""
+
+
+def _generate_orderings():
+    """Calculate the orderings from the preflop equity table."""
+    from .equity import _get_table, _HANDS
+
+    table = _get_table()
+    indexes = range(len(_HANDS))
+    equities = [[table.equity(row, col) for col in indexes] for row in indexes]
+    matchups = [[table.matchups(row, col) for col in indexes] for row in indexes]
+
+    def equity_against(row, opponents):
+        total = sum(matchups[row][col] for col in opponents)
+        return sum(matchups[row][col] * equities[row][col] for col in opponents) / total
+
+    def order_by(values, tie_order=None):
+        tie_order = tie_order or list(indexes)
+        ordered = sorted(indexes, key=lambda index: (-values[index], tie_order.index(index)))
+        return ordered
+
+    equity = order_by([equity_against(row, indexes) for row in indexes])
+
+    top20, combos = [], 0
+    for index in equity:
+        combos += len(_HANDS[index].to_combos())
+        top20.append(index)
+        if combos >= 0.2 * 1326:
+            break
+    equity_vs_top20 = order_by([equity_against(row, top20) for row in indexes], equity)
+
+    sklansky_chubukov = order_by([_sklansky_chubukov_number(row, equities, matchups)
+                                  for row in indexes], equity)
+
+    def names(ordering):
+        return tuple(unicode(_HANDS[index]) for index in ordering)
+
+    return {'equity': names(equity), 'equity_vs_top20': names(equity_vs_top20),
+            'sklansky_chubukov': names(sklansky_chubukov)}
+
+
+def _sklansky_chubukov_number(row, equities, matchups, limit=1000.):
+    """Biggest stack (before posting, in big blinds) with which the small blind's push with the
+    hand is at least as good as folding, when the big blind calls exactly with the hands which
+    are profitable against it. :data:`limit` if it's always good.
+    """
+    def push_is_better(stack):
+        total = push_value = 0
+        for col, num_matchups in enumerate(matchups[row]):
+            caller_equity = 1 - equities[row][col]
+            if caller_equity * 2 * stack > stack - 1:
+                value = equities[row][col] * 2 * stack
+            else:
+                value = stack + 1
+            push_value += num_matchups * value
+            total += num_matchups
+        return push_value / total >= stack - 0.5
+
+    low, high = 1., limit
+    if push_is_better(high):
+        return high
+    for _ in range(60):
+        middle = (low + high) / 2
+        if push_is_better(middle):
+            low = middle
+        else:
+            high = middle
+    return low
+
+
+if __name__ == '__main__':
+    for name, ordering in sorted(_generate_orderings().items()):
+        print(name, ordering)
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Push/fold Nash equilibrium solver.
+
+    Model: every player has the same stack, posts the ante and the blinds, the first player in
+    either pushes all-in or folds; after a push, the next players either call or fold, and the
+    first caller goes to showdown with the pusher (everybody else folds). Showdowns use the
+    hand against hand average equities of :mod:`poker.equity`, weighted by the number of combo
+    matchups, so the card removal between the two hands is counted, but the suits of the
+    matchups are averaged. The probability of a call is card removal correct for the hand of the
+    player deciding.
+    Strategies are probabilities per hand (169 hands), found by iterated best responses, averaged
+    over the iterations (fictitious play). Results can be in chips or in ICM equities.
+
+    Needs NumPy.
+"""
+
+import numpy as np
+from .hand import Range
+from .strategy import Strategy
+from .equity import _get_table, _HANDS
+from .icm import exact_icm
+
+
+__all__ = ['solve', 'ITERATIONS']
+
+
+ITERATIONS = 300
+"""Default number of best response iterations."""
+
+# in order of action, the last ones play
+_POSITIONS = ('UTG', 'UTG1', 'UTG2', 'UTG3', 'UTG4', 'CO', 'BTN', 'SB', 'BB')
+_SMALL_BLIND, _BIG_BLIND = 0.5, 1.
+
+
+def solve(stacks, num_players=2, ante=0, payouts=None, iterations=None,
+          name='Push/fold Nash equilibrium'):
+    """Solve push/fold equilibria for every stack depth.
+
+    :param stacks: stack depths in big blinds, every one becomes a situation
+    :param int num_players: 2-9
+    :param ante: in big blinds
+    :param payouts: if given, the players maximize their ICM equities (with the players at the
+                    table as the field), chip EV otherwise
+    :param int iterations: number of best response iterations, default is :data:`ITERATIONS`
+    :return: :class:`poker.strategy.Strategy` with a ``"<stack> BB"`` situation with the pushing
+             ranges when folded to the position, and ``"<stack> BB vs <position> push"``
+             situations with the calling ranges
+    """
+    if not 2 <= num_players <= len(_POSITIONS):
+        raise ValueError('Number of players should be between 2 and {}.'.format(len(_POSITIONS)))
+
+    positions = _POSITIONS[-num_players:]
+    equities, matchups = _load_equities()
+    lines = ['[strategy]', 'name = {}'.format(name), 'inaction = PUSH', 'outaction = FOLD']
+
+    for stack in stacks:
+        game = _Game(stack, num_players, ante, payouts, equities, matchups)
+        pushes, calls = game.solve(iterations or ITERATIONS)
+        situation = '{:g} BB'.format(stack)
+
+        lines.extend(['', '[{}]'.format(situation)])
+        lines.extend(_format_ranges(positions, enumerate(pushes)))
+        for pusher, position in enumerate(positions[:-1]):
+            lines.extend(['', '[{} vs {} push]'.format(situation, position),
+                          'inaction = CALL', 'outaction = FOLD'])
+            lines.extend(_format_ranges(positions, calls[pusher].items()))
+
+    return Strategy('\n'.join(lines) + '\n', source='<pushfold>')
+
+
+def _load_equities():
+    table = _get_table()
+    indexes = range(len(_HANDS))
+    equities = np.array([[table.equity(row, col) for col in indexes] for row in indexes])
+    matchups = np.array([[table.matchups(row, col) for col in indexes] for row in indexes],
+                        dtype=float)
+    return equities, matchups
+
+
+def _format_ranges(positions, strategies):
+    lines = []
+    for player, strategy in strategies:
+        hands = [hand for hand, frequency in zip(_HANDS, strategy) if frequency >= 0.5]
+        if hands:
+            range_ = ' '.join(Range.from_objects(hands).rep_pieces)
+            lines.append('{} = {}'.format(positions[player], range_))
+    return lines
+
+
+class _Game(object):
+    """Push/fold game for one stack depth. Players are indexed in order of action,
+    the last one is the big blind.
+    """
+
+    def __init__(self, stack, num_players, ante, payouts, equities, matchups):
+        self.num_players = num_players
+        self.stack = float(stack)
+        self.posts = [float(ante)] * num_players
+        self.posts[-1] += _BIG_BLIND
+        self.posts[-2] += _SMALL_BLIND
+        self.payouts = payouts
+
+        self.equities = equities
+        self.matchups = matchups
+        # matchups weighted with equities, so range equity is a matrix product
+        self.weighted_equities = matchups * equities
+        # every combo has 1225 possible opponent combos
+        self.hand_matchups = matchups.sum(axis=1)
+        self.hand_combos = self.hand_matchups / 1225
+        self._outcomes = {}
+
+    def solve(self, iterations):
+        num_players, num_hands = self.num_players, len(self.hand_combos)
+        pushes = np.zeros((num_players - 1, num_hands))
+        calls = [{caller: np.zeros(num_hands) for caller in range(pusher + 1, num_players)}
+                 for pusher in range(num_players - 1)]
+
+        for iteration in range(iterations):
+            step = 1 / (iteration + 2)
+            for pusher in range(num_players - 1):
+                for caller in calls[pusher]:
+                    best = self._best_call(pushes, calls, pusher, caller)
+                    calls[pusher][caller] += (best - calls[pusher][caller]) * step
+            for pusher in range(num_players - 1):
+                best = self._best_push(pushes, calls, pusher)
+                pushes[pusher] += (best - pushes[pusher]) * step
+
+        return pushes, calls
+
+    def _best_push(self, pushes, calls, pusher):
+        # probability of getting here and of every outcome is averaged over the hands of the
+        # players acting before, only the pusher's hand counts for card removal
+        fold_value = self._folded_to_value(pushes, calls, pusher + 1)[pusher]
+
+        push_value = np.zeros(len(self.hand_combos))
+        nobody_called = np.ones(len(self.hand_combos))
+        for caller in range(pusher + 1, self.num_players):
+            call_range = calls[pusher][caller]
+            called_matchups = self.matchups.dot(call_range)
+            call_probability = called_matchups / self.hand_matchups
+            equity = _divide(self.weighted_equities.dot(call_range), called_matchups)
+            win, lose = self._showdown_values(pusher, caller, pusher)
+            push_value += nobody_called * call_probability * (equity * win + (1 - equity) * lose)
+            nobody_called *= 1 - call_probability
+        push_value += nobody_called * self._steal_values(pusher)[pusher]
+
+        return (push_value > fold_value).astype(float)
+
+    def _best_call(self, pushes, calls, pusher, caller):
+        push_range = pushes[pusher]
+        pushed_matchups = self.matchups.dot(push_range)
+        equity = _divide(self.weighted_equities.dot(push_range), pushed_matchups)
+        win, lose = self._showdown_values(pusher, caller, caller)
+        call_value = equity * win + (1 - equity) * lose
+        fold_value = self._pushed_value(pushes, calls, pusher, caller + 1)[caller]
+        return (call_value > fold_value).astype(float)
+
+    def _folded_to_value(self, pushes, calls, player):
+        """Expected values of every player when everybody folded before player."""
+        if player == self.num_players - 1:
+            return self._walk_values()
+        push_probability = self.hand_combos.dot(pushes[player]) / 1326
+        return (push_probability * self._pushed_value(pushes, calls, player, player + 1) +
+                (1 - push_probability) * self._folded_to_value(pushes, calls, player + 1))
+
+    def _pushed_value(self, pushes, calls, pusher, player):
+        """Expected values of every player when pusher pushed and everybody folded before
+        player."""
+        if player == self.num_players:
+            return self._steal_values(pusher)
+
+        push_range, call_range = pushes[pusher], calls[pusher][player]
+        pushed_combos = self.hand_combos.dot(push_range) * 1225
+        called_matchups = push_range.dot(self.matchups).dot(call_range)
+        call_probability = _divide(called_matchups, pushed_combos)
+        equity = _divide(push_range.dot(self.weighted_equities).dot(call_range), called_matchups)
+
+        pusher_wins = self._showdown_outcome(pusher, player, pusher)
+        caller_wins = self._showdown_outcome(pusher, player, player)
+        called_value = equity * pusher_wins + (1 - equity) * caller_wins
+        return (call_probability * called_value +
+                (1 - call_probability) * self._pushed_value(pushes, calls, pusher, player + 1))
+
+    def _showdown_values(self, pusher, caller, player):
+        """Values of player for winning and losing the showdown."""
+        other = caller if player == pusher else pusher
+        return (self._showdown_outcome(pusher, caller, player)[player],
+                self._showdown_outcome(pusher, caller, other)[player])
+
+    def _showdown_outcome(self, pusher, caller, winner):
+        key = pusher, caller, winner
+        if key not in self._outcomes:
+            self._outcomes[key] = self._values(self._showdown_stacks(pusher, caller, winner))
+        return self._outcomes[key]
+
+    def _showdown_stacks(self, pusher, caller, winner):
+        stacks = [self.stack - post for post in self.posts]
+        pot = sum(self.posts) - self.posts[pusher] - self.posts[caller] + 2 * self.stack
+        stacks[pusher] = stacks[caller] = 0
+        stacks[winner] = pot
+        return stacks
+
+    def _steal_values(self, pusher):
+        key = pusher, None, pusher
+        if key not in self._outcomes:
+            stacks = [self.stack - post for post in self.posts]
+            stacks[pusher] = self.stack + sum(self.posts) - self.posts[pusher]
+            self._outcomes[key] = self._values(stacks)
+        return self._outcomes[key]
+
+    def _walk_values(self):
+        return self._steal_values(self.num_players - 1)
+
+    def _values(self, stacks):
+        if self.payouts is None:
+            return np.array(stacks) - self.stack
+        return np.array(exact_icm(stacks, self.payouts))
+
+
+def _divide(numerator, denominator):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.where(denominator > 0, numerator / np.where(denominator > 0, denominator, 1), 0)
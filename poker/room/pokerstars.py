@@ -3,6 +3,7 @@ from __future__ import unicode_literals, absolute_import, division, print_functi
 
 import re
 import logging
+import calendar
 from itertools import ifilter
 from decimal import Decimal
 from datetime import datetime
@@ -11,6 +12,7 @@ from lxml import etree
 import pytz
 from pathlib import Path
 from zope.interface import implementer
+from cached_property import cached_property
 from .. import handhistory as hh
 from ..card import Card
 from ..hand import Combo
@@ -397,16 +399,46 @@ class LabelNotFoundError(ValueError):
     """Label not found in the player notes."""
 
 
+def _make_timestamp(update):
+    """Unix timestamp str from a datetime, naive datetimes are taken as UTC."""
+    return str(calendar.timegm(update.utctimetuple()))
+
+
+def _parse_update(timestamp):
+    """UTC datetime from the update attribute of a note."""
+    if not timestamp:
+        return None
+    return datetime.utcfromtimestamp(int(timestamp)).replace(tzinfo=pytz.UTC)
+
+
+def _make_parser():
+    return etree.XMLParser(recover=True, resolve_entities=False)
+
+
+def _get_first(index, key):
+    """First indexed element, None if there isn't any."""
+    elements = index.get(key)
+    return elements[0] if elements else None
+
+
+def _remove_indexed(index, key, element):
+    elements = index[key]
+    elements.remove(element)
+    if not elements:
+        del index[key]
+
+
 class Notes(object):
     """Class for parsing pokerstars XML notes."""
 
     _color_re = re.compile('^[0-9A-F]{6}$')
+    _merge_policies = ('newer', 'theirs', 'ours', 'append')
 
     def __init__(self, notes):
         # notes need to be a unicode object
         self.raw = notes
-        parser = etree.XMLParser(recover=True, resolve_entities=False)
-        self.root = etree.XML(notes.encode('utf-8'), parser)
+        self.root = etree.XML(notes.encode('utf-8'), _make_parser())
+        self._build_indexes()
 
     def __unicode__(self):
         return str(self).decode('utf-8')
@@ -416,8 +448,59 @@ class Notes(object):
 
     @classmethod
     def from_file(cls, filename):
-        """Make an instance from a XML file."""
-        return cls(Path(filename).open().read())
+        """Make an instance from a XML file. The file is parsed as bytes directly,
+        the :attr:`raw` text is only read when needed.
+        """
+        self = cls.__new__(cls)
+        self._filename = filename
+        with Path(filename).open('rb') as fp:
+            self.root = etree.parse(fp, _make_parser()).getroot()
+        self._build_indexes()
+        return self
+
+    @classmethod
+    def iter_file(cls, filename):
+        """Iterate over a notes XML file without keeping it in memory.
+        Yields :class:`_Label` and :class:`_Note` tuples in the order of the file,
+        so every label comes before the notes.
+        """
+        label_names = {}
+        with Path(filename).open('rb') as fp:
+            elements = etree.iterparse(fp, tag=('label', 'note'), recover=True,
+                                       resolve_entities=False)
+            for _, element in elements:
+                if element.tag == 'label':
+                    label = _Label(element.get('id'), element.get('color'), element.text)
+                    label_names[label.id] = label.name
+                    yield label
+                else:
+                    yield _Note(element.get('player'), label_names.get(element.get('label')),
+                                _parse_update(element.get('update')), element.text)
+
+                # free the memory of already processed elements
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+    @cached_property
+    def raw(self):
+        """The original XML text."""
+        return Path(self._filename).open(encoding='utf-8').read()
+
+    def _build_indexes(self):
+        """Index notes by player name and labels by id and name, so lookups don't have to search
+        the whole XML tree. Every method changing the tree keeps these in sync.
+        Duplicates are kept in document order, lookups find the first one, same as searching
+        in the tree.
+        """
+        self._notes = {}
+        for note in self.root.findall('note'):
+            self._notes.setdefault(note.get('player'), []).append(note)
+
+        self._labels_by_id, self._labels_by_name = {}, {}
+        for label in self.root.findall('labels/label'):
+            self._labels_by_id.setdefault(label.get('id'), []).append(label)
+            self._labels_by_name.setdefault(label.text, []).append(label)
 
     @property
     def players(self):
@@ -451,16 +534,89 @@ class Notes(object):
 
     def add_note(self, player, text, label=None, update=None):
         """Add a note to the xml. If update param is None, it will be the current time."""
-        if label is not None and (label not in self.label_names):
+        if label is not None and (label not in self._labels_by_name):
             raise LabelNotFoundError('Invalid label: {}'.format(label))
         if update is None:
             update = datetime.utcnow()
         # converted to timestamp, rounded to ones
-        update = update.strftime('%s')
+        update = _make_timestamp(update)
         label_id = self._get_label_id(label)
         new_note = etree.Element('note', player=player, label=label_id, update=update)
         new_note.text = text
         self.root.append(new_note)
+        self._notes.setdefault(player, []).append(new_note)
+
+    def bulk_upsert(self, notes):
+        """Add or replace many notes in one pass.
+
+        notes is an iterable of :class:`_Note` tuples, labels are given by name. Existing notes
+        of the same players are overwritten. If update is None, it will be the current time.
+        All labels are checked before changing anything.
+        """
+        notes = list(notes)
+        for note in notes:
+            if note.label is not None and note.label not in self._labels_by_name:
+                raise LabelNotFoundError('Invalid label: {}'.format(note.label))
+
+        now = _make_timestamp(datetime.utcnow())
+        for player, label, update, text in notes:
+            label_id = self._get_label_id(label)
+            update = _make_timestamp(update) if update is not None else now
+            self._upsert_note(player, label_id, update, text)
+
+    def merge(self, other, policy='newer'):
+        """Merge notes from another :class:`Notes` instance into this one.
+
+        Labels are matched by name, labels missing from here are added with their color.
+        For players having a note in both, policy decides what happens:
+
+        ``'newer'``: the more recently updated note is kept
+        ``'theirs'``: the other note overwrites this one
+        ``'ours'``: this note is kept, only new players are added
+        ``'append'``: the other text is appended in a new line, if it's not there yet
+        """
+        if policy not in self._merge_policies:
+            raise ValueError('Invalid merge policy: {}'.format(policy))
+
+        for label in other.root.findall('labels/label'):
+            if label.text not in self._labels_by_name:
+                self.add_label(label.text, label.get('color'))
+
+        for other_note in other.root.findall('note'):
+            player = other_note.get('player')
+            # skip duplicates, only the note found by player name counts
+            if other._find_note(player) is not other_note:
+                continue
+
+            other_label = other_note.get('label')
+            if other_label != '-1':
+                other_label = self._find_label(other._labels_by_id[other_label][0].text).get('id')
+            other_update = other_note.get('update')
+
+            note = _get_first(self._notes, player)
+            if note is None:
+                self._upsert_note(player, other_label, other_update, other_note.text)
+            elif policy == 'theirs' or (policy == 'newer' and
+                                        int(other_update or 0) > int(note.get('update') or 0)):
+                self._upsert_note(player, other_label, other_update, other_note.text)
+            elif policy == 'append':
+                text, other_text = note.text or '', other_note.text or ''
+                if other_text not in text:
+                    note.text = text + '\n' + other_text if text else other_text
+                    if int(other_update or 0) > int(note.get('update') or 0):
+                        note.attrib['update'] = other_update
+                if note.get('label') == '-1':
+                    note.attrib['label'] = other_label
+
+    def _upsert_note(self, player, label_id, update, text):
+        note = _get_first(self._notes, player)
+        if note is None:
+            note = etree.SubElement(self.root, 'note', player=player)
+            self._notes[player] = [note]
+        note.attrib['label'] = label_id
+        if update is not None:
+            note.attrib['update'] = update
+        note.text = text
 
     def append_note(self, player, text):
         """Append text to an already existing note."""
@@ -484,28 +640,20 @@ class Notes(object):
 
     def del_note(self, player):
         """Delete a note by player name."""
-        self.root.remove(self._find_note(player))
+        note = self._find_note(player)
+        note.getparent().remove(note)
+        _remove_indexed(self._notes, player, note)
 
     def _find_note(self, player):
-        # if player name contains a double quote, the search phrase would be invalid.
-        # &quot; entitiy is searched with ", e.g. &quot;bootei&quot; is searched with '"bootei"'
-        quote = "'" if '"' in player else '"'
-        note = self.root.find('note[@player={0}{1}{0}]'.format(quote, player))
-        if note is None:
+        try:
+            return self._notes[player][0]
+        except KeyError:
             raise NoteNotFoundError(player)
-        return note
 
     def _get_note_data(self, note):
-        labels = {label.get('id'): label.text for label in self.root.iter('label')}
         label = note.get('label')
-        label = labels[label] if label != "-1" else None
-        timestamp = note.get('update')
-        if timestamp:
-            timestamp = int(timestamp)
-            update = datetime.utcfromtimestamp(timestamp).replace(tzinfo=pytz.UTC)
-        else:
-            update = None
-        return _Note(note.get('player'), label, update, note.text)
+        label = self._labels_by_id[label][0].text if label != "-1" else None
+        return _Note(note.get('player'), label, _parse_update(note.get('update')), note.text)
 
     def get_label(self, name):
         """Find the label by name."""
@@ -526,23 +674,33 @@ class Notes(object):
         new_label.text = name
 
         labels_tag.append(new_label)
+        self._labels_by_id.setdefault(new_id, []).append(new_label)
+        self._labels_by_name.setdefault(name, []).append(new_label)
 
     def del_label(self, name):
         """Delete a label by name."""
         labels_tag = self.root[0]
-        labels_tag.remove(self._find_label(name))
+        label = self._find_label(name)
+        labels_tag.remove(label)
+        _remove_indexed(self._labels_by_name, name, label)
+        _remove_indexed(self._labels_by_id, label.get('id'), label)
 
     def _find_label(self, name):
-        labels_tag = self.root[0]
         try:
-            return labels_tag.xpath('label[text()="%s"]' % name)[0]
-        except IndexError:
+            return self._labels_by_name[name][0]
+        except KeyError:
             raise LabelNotFoundError(name)
 
     def _get_label_id(self, name):
         return self._find_label(name).get('id') if name else '-1'
 
     def save(self, filename):
-        """Save the note XML to a file."""
-        with open(filename, 'w') as fp:
-            fp.write(str(self))
+        """Save the note XML to a file. Elements are written one by one,
+        without serializing the whole document into memory first.
+        """
+        with etree.xmlfile(unicode(filename), encoding='UTF-8') as xf:
+            xf.write_declaration()
+            with xf.element(self.root.tag, self.root.attrib):
+                xf.write(self.root.text or '')
+                for element in self.root:
+                    xf.write(element)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Random combos from a range, for Monte Carlo simulations.
+
+    Sampling uses Walker's alias method: one uniform index and one uniform number per sample,
+    whatever the weights are. Combos conflicting with cards known only at sampling time
+    (e.g. the combo sampled for the other player) are rejected and sampled again.
+"""
+
+import random
+from .deck import get_mask
+
+
+__all__ = ['ComboSampler']
+
+
+# after this many rejections, check whether there is a combo without the excluded cards at all
+_CHECK_AFTER = 100
+
+
+class ComboSampler(object):
+    """Samples combos, usually made by :meth:`poker.hand.Range.sampler`.
+
+    :param combos: iterable of :class:`poker.hand.Combo`\\ s
+    :param weights: optional mapping of :class:`poker.hand.Combo` or :class:`poker.hand.Hand`
+                    to relative weight, the rest of the combos have weight 1
+    :param dead: cards which can't be in a sampled combo (see :func:`poker.deck.get_mask`)
+    :param seed: seed for the random number generator, for reproducible samples
+    """
+
+    def __init__(self, combos, weights=None, dead=(), seed=None):
+        dead_mask = get_mask(dead)
+        self.combos = tuple(combo for combo in combos if not get_mask(combo) & dead_mask)
+        if not self.combos:
+            raise ValueError('There are no live combos to sample from.')
+
+        self._card_masks = tuple(get_mask(combo) for combo in self.combos)
+        combo_weights = [_get_weight(combo, weights) for combo in self.combos]
+        self._probabilities, self._aliases = _make_alias_table(combo_weights)
+        # card masks of the combos which can be sampled at all
+        self._positive_masks = tuple(card_mask for card_mask, weight
+                                     in zip(self._card_masks, combo_weights) if weight > 0)
+        self._random = random.Random(seed)
+        # NumPy random state and arrays for sample_many, made on first use
+        self._random_state = self._tables = None
+
+    def __len__(self):
+        return len(self.combos)
+
+    def sample(self, exclude=()):
+        """One random combo which doesn't contain any of the excluded cards.
+
+        :param exclude: cards (see :func:`poker.deck.get_mask`) or a card mask
+        """
+        exclude_mask = exclude if isinstance(exclude, (int, long)) else get_mask(exclude)
+        random_, num_combos = self._random.random, len(self.combos)
+        tries = 0
+        while True:
+            index = int(random_() * num_combos)
+            if random_() >= self._probabilities[index]:
+                index = self._aliases[index]
+            if not self._card_masks[index] & exclude_mask:
+                return self.combos[index]
+
+            tries += 1
+            if (tries == _CHECK_AFTER and
+                    all(card_mask & exclude_mask for card_mask in self._positive_masks)):
+                raise ValueError('Every combo with positive weight contains an excluded card.')
+
+    def sample_many(self, num_samples, exclude=()):
+        """Many independent samples at once. Needs NumPy.
+
+        :param int num_samples: number of samples
+        :param exclude: cards excluded from every sample, or a ``numpy.ndarray`` of card masks
+                        (``uint64``, e.g. from :func:`poker.deck.to_masks`), one for every
+                        sample, e.g. the other players' combos and the boards
+        :return: ``numpy.ndarray`` of card indexes (``uint8``) with ``(num_samples, 2)`` shape,
+                 first card is the bigger, indexes are the same as in :mod:`poker.deck`
+        """
+        import numpy as np
+
+        tables = self._get_tables(np)
+        card_masks, positive_masks = tables['card_masks'], tables['positive_masks']
+        if isinstance(exclude, np.ndarray):
+            exclude_masks = exclude.astype(np.uint64)
+            if exclude_masks.shape != (num_samples,):
+                raise ValueError('There should be one exclude mask for every sample.')
+        else:
+            exclude_masks = np.full(num_samples, get_mask(exclude), dtype=np.uint64)
+
+        indexes = np.empty(num_samples, dtype=np.intp)
+        pending = np.arange(num_samples)
+        rounds = 0
+        while len(pending):
+            sampled = self._sample_indexes(np, tables, len(pending))
+            indexes[pending] = sampled
+            # rejection, only the conflicting samples are drawn again
+            conflicting = (card_masks[sampled] & exclude_masks[pending]) != 0
+            pending = pending[conflicting]
+
+            rounds += 1
+            if rounds == _CHECK_AFTER and len(pending):
+                live = (positive_masks[np.newaxis, :] & exclude_masks[pending][:, np.newaxis]) == 0
+                if not live.any(axis=1).all():
+                    raise ValueError('Every combo with positive weight contains an excluded card.')
+        return tables['cards'][indexes]
+
+    def _sample_indexes(self, np, tables, num_samples):
+        indexes = self._random_state.randint(len(self.combos), size=num_samples)
+        keep = self._random_state.random_sample(num_samples) < tables['probabilities'][indexes]
+        return np.where(keep, indexes, tables['aliases'][indexes])
+
+    def _get_tables(self, np):
+        if self._random_state is None:
+            self._random_state = np.random.RandomState(self._random.getrandbits(32))
+            self._tables = {
+                'probabilities': np.array(self._probabilities),
+                'aliases': np.array(self._aliases, dtype=np.intp),
+                'card_masks': np.array(self._card_masks, dtype=np.uint64),
+                'positive_masks': np.array(self._positive_masks, dtype=np.uint64),
+                'cards': np.array([[card._index for card in combo.cards[:2]]
+                                   for combo in self.combos], dtype=np.uint8),
+            }
+        return self._tables
+
+
+def _get_weight(combo, weights):
+    if not weights:
+        return 1.
+    weight = weights.get(combo)
+    if weight is None:
+        weight = weights.get(combo.to_hand(), 1.)
+    if weight < 0:
+        raise ValueError('Weight of {} is negative.'.format(combo))
+    return float(weight)
+
+
+def _make_alias_table(weights):
+    """Walker's alias table (Vose's construction): column i is kept with probabilities[i],
+    otherwise it's aliases[i].
+    """
+    total = sum(weights)
+    if not total:
+        raise ValueError('At least one combo should have a positive weight.')
+
+    num_columns = len(weights)
+    scaled = [weight * num_columns / total for weight in weights]
+    probabilities, aliases = [1.] * num_columns, list(range(num_columns))
+    small = [index for index, value in enumerate(scaled) if value < 1]
+    large = [index for index, value in enumerate(scaled) if value >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probabilities[less], aliases[less] = scaled[less], more
+        scaled[more] -= 1 - scaled[less]
+        (small if scaled[more] < 1 else large).append(more)
+    # the rest are 1 up to rounding errors
+    return tuple(probabilities), tuple(aliases)
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals, absolute_import, division, print_function
 
+import json
+import struct
+import hashlib
+from binascii import hexlify, unhexlify
 from collections import namedtuple, Mapping, Iterable, OrderedDict as odict
 from pathlib import Path
 from configparser import ConfigParser
-from .hand import Range
+from ._common import _write_file_atomically
+from .hand import Range, Combo
 from .constants import Position
 
 
@@ -13,67 +18,199 @@ _Situation = namedtuple('_Situation', 'utg utg1 utg2 utg3 utg4 co btn sb bb '
 _Spot = namedtuple('_Spot', 'position range posindex')
 _POSITIONS = {'utg', 'utg1', 'utg2', 'utg3', 'utg4', 'co', 'btn', 'sb', 'bb'}
 
+# Compiled strategy cache: header, JSON with the values of the situations, combo masks.
+_CACHE_SUFFIX = '.bin'
+_CACHE_MAGIC = b'PSTB'
+_CACHE_VERSION = 1
+_CACHE_HEADER = struct.Struct(b'<4sH20sI')
+_MASK_SIZE = 166   # 1326 combo bits
+
 
 class Strategy(Mapping):
+    """Preflop strategy parsed from an INI-like ``.strategy`` file.
+    Ranges of a situation are parsed the first time the situation is accessed.
+    """
+
     def __init__(self, strategy, source='<string>'):
-        self._config = ConfigParser(default_section='strategy', interpolation=None)
-        self._config.read_string(strategy, source)
-
-        self._situations = odict()
-        for name in self._config.sections():
-            # configparser set non-specified values to '', we want default to None
-            values = dict.fromkeys(_Situation._fields, None)
-            for key, val in self._config[name].items():
-                # filter out fields not implemented, otherwise it would
+        config = ConfigParser(default_section='strategy', interpolation=None)
+        config.read_string(strategy, source)
+
+        self._defaults = dict(config['strategy'])
+        # situation name -> (values, ranges), ranges are unparsed strings or combo masks
+        self._sections = odict()
+        for name in config.sections():
+            values, ranges = {}, {}
+            for key, val in config[name].items():
+                # configparser set non-specified values to '', we want default to None;
+                # fields not implemented are filtered out, otherwise it would
                 # cause TypeError for _Situation constructor
                 if (not val) or (key not in _Situation._fields):
                     continue
                 elif key in _POSITIONS:
-                    values[key] = Range(val)
+                    ranges[key] = val
                 else:
                     values[key] = val
-            self._situations[name] = _Situation(**values)
+            self._sections[name] = values, ranges
+
+        self._init_caches()
 
-        self._tuple = tuple(self._situations.values())
+    def _init_caches(self):
+        self._names = tuple(self._sections)
+        self._situations = {}
+        self._index = {}
 
     @classmethod
-    def from_file(cls, filename):
+    def from_file(cls, filename, cache=False):
+        """Load a strategy file.
+
+        :param filename: str or Path
+        :param bool cache: Use a compiled ``<filename>.bin`` next to the file if it was made from
+                           the same content (by SHA-1 hash), create or refresh it otherwise.
+        """
         # Path accept str or Path
-        strategy = Path(filename).open(encoding='utf-8').read()
-        return cls(strategy, source=filename)
+        path = Path(filename)
+        with path.open('rb') as fp:
+            source = fp.read()
+        if not cache:
+            return cls(source.decode('utf-8'), source=filename)
+
+        digest = hashlib.sha1(source).digest()
+        cache_path = path.with_name(path.name + _CACHE_SUFFIX)
+        self = cls._load_cache(cache_path, digest)
+        if self is None:
+            self = cls(source.decode('utf-8'), source=filename)
+            self._write_cache(cache_path, digest)
+        return self
+
+    @classmethod
+    def _load_cache(cls, cache_path, digest):
+        try:
+            with cache_path.open('rb') as fp:
+                data = fp.read()
+        except (IOError, OSError):
+            return None
+
+        header_size = _CACHE_HEADER.size
+        if len(data) < header_size:
+            return None
+        magic, version, cached_digest, json_size = _CACHE_HEADER.unpack_from(data)
+        if (magic, version, cached_digest) != (_CACHE_MAGIC, _CACHE_VERSION, digest):
+            return None
+
+        contents = json.loads(data[header_size:header_size + json_size].decode('utf-8'))
+        masks_start = header_size + json_size
+
+        def get_mask(index):
+            start = masks_start + index * _MASK_SIZE
+            return int(hexlify(data[start:start + _MASK_SIZE][::-1]), 16)
+
+        self = cls.__new__(cls)
+        self._defaults = contents['defaults']
+        self._sections = odict()
+        for name, values, ranges in contents['situations']:
+            ranges = {position: get_mask(index) for position, index in ranges.items()}
+            self._sections[name] = values, ranges
+        self._init_caches()
+        return self
+
+    def _write_cache(self, cache_path, digest):
+        situations, masks = [], []
+        for name in self._names:
+            values, _ = self._sections[name]
+            ranges = {}
+            for position, mask in self._get_index(name).items():
+                ranges[position] = len(masks)
+                masks.append(unhexlify('{:0{}x}'.format(mask, _MASK_SIZE * 2))[::-1])
+            situations.append([name, values, ranges])
+
+        contents = json.dumps({'defaults': self._defaults, 'situations': situations})
+        contents = contents.encode('utf-8')
+        header = _CACHE_HEADER.pack(_CACHE_MAGIC, _CACHE_VERSION, digest, len(contents))
+        data = header + contents + b''.join(masks)
+
+        try:
+            _write_file_atomically(cache_path, data)
+        except (IOError, OSError):
+            pass
 
     def __getattr__(self, name):
         # Strategy uses only _Situation._fields, but this way .strategy files are more flexible,
         # because can contain extra values without breaking anything
-        return self._config['strategy'][name]
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self._defaults[name]
+
+    def _get_situation(self, name):
+        situation = self._situations.get(name)
+        if situation is None:
+            values, ranges = self._sections[name]
+            situation = dict.fromkeys(_Situation._fields, None)
+            situation.update(values)
+            for position, range_ in ranges.items():
+                situation[position] = (Range(range_) if isinstance(range_, unicode)
+                                       else Range.from_mask(range_))
+            situation = self._situations[name] = _Situation(**situation)
+        return situation
+
+    def _get_index(self, name):
+        """Position name -> combo mask of the range, for constant time lookups."""
+        index = self._index.get(name)
+        if index is None:
+            index = {}
+            for position, range_ in self._sections[name][1].items():
+                if isinstance(range_, unicode):
+                    range_ = getattr(self._get_situation(name), position)._mask
+                index[position] = range_
+            self._index[name] = index
+        return index
 
     def __iter__(self):
-        return iter(self._situations)
+        return iter(self._names)
 
     def items(self):
-        return self._situations.items()
+        return [(name, self._get_situation(name)) for name in self._names]
 
     def keys(self):
-        return self._situations.keys()
+        return list(self._names)
 
     def get(self, key, default=None):
-        return self._situations.get(key, default)
+        return self._get_situation(key) if key in self._sections else default
 
     def __getitem__(self, key):
         if isinstance(key, unicode):
-            return self._situations.__getitem__(key)
+            return self._get_situation(key)
         elif isinstance(key, int):
-            return self._tuple[key]
+            return self._get_situation(self._names[key])
         raise TypeError('You can lookup by int or str')
 
     def values(self):
-        return self._situations.values()
+        return [self._get_situation(name) for name in self._names]
 
     def __contains__(self, key):
-        return self._situations.__contains__(key)
+        return key in self._sections
 
     def __len__(self):
-        return len(self._situations)
+        return len(self._sections)
+
+    def lookup(self, situation, position, combo):
+        """What to do with the combo in the position: the ``inaction`` of the situation if the
+        combo is in the range of the position, ``outaction`` if it's not.
+        None if the position has no range in the situation.
+
+        :param situation: name or index of the situation
+        :param position: :class:`poker.constants.Position` or position name
+        :param combo: :class:`poker.hand.Combo` or str
+        """
+        if isinstance(situation, int):
+            situation = self._names[situation]
+        if not isinstance(position, Position):
+            position = Position(position)
+        mask = self._get_index(situation).get(position.name.lower())
+        if mask is None:
+            return None
+        values = self._sections[situation][0]
+        in_range = mask >> Combo(combo)._index & 1
+        return values.get('inaction') if in_range else values.get('outaction')
 
     def get_first_spot(self, situation=0):
         situation = self[situation]
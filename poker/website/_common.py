@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+"""
+    Shared HTTP plumbing for the website scrapers.
+
+    Every scraper goes through one connection pooled :class:`requests.Session`, so repeated
+    requests to the same host reuse TCP connections instead of opening a new one each time.
+    Concurrent work is done on a bounded thread pool; Python 2 has no asyncio, but the scrapers
+    are I/O bound, so threads give the same throughput.
+    GET responses can optionally be cached on disk and revalidated with conditional requests.
+"""
+
+import io
+import json
+import time
+import hashlib
+import threading
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.packages.urllib3.util.retry import Retry
+from .._common import _write_file_atomically
+
+
+__all__ = ['configure', 'get_session', 'get', 'open_url', 'post', 'map_concurrently',
+           'run_async', 'TIMEOUT', 'RETRIES', 'CONCURRENCY']
+
+
+TIMEOUT = 30
+"""Default timeout in seconds for connecting and reading."""
+
+RETRIES = 3
+"""How many times a failed connection or a 5xx response is retried."""
+
+CONCURRENCY = 10
+"""Default number of simultaneous requests, also the size of the connection pool."""
+
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+_lock = threading.Lock()
+_session = None
+_pool = None
+_cache = None
+_unset = object()
+
+
+def _make_retry(retries):
+    # backoff: 0s, 0.6s, 1.2s, ... between retries. False allowed methods means every method,
+    # the only POST we do (2+2 user search) is idempotent.
+    kwargs = dict(total=retries, backoff_factor=0.3, status_forcelist=_RETRY_STATUSES,
+                  raise_on_status=False)
+    try:
+        return Retry(allowed_methods=False, **kwargs)
+    except TypeError:
+        # urllib3 before 1.26
+        return Retry(method_whitelist=False, **kwargs)
+
+
+def _make_session(concurrency=CONCURRENCY, retries=RETRIES):
+    retry = _make_retry(retries)
+    adapter = HTTPAdapter(pool_connections=concurrency, pool_maxsize=concurrency,
+                          max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session():
+    """The shared, connection pooled :class:`requests.Session`."""
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = _make_session(CONCURRENCY, RETRIES)
+    return _session
+
+
+def configure(session=_unset, timeout=_unset, retries=_unset, concurrency=_unset,
+              cache_dir=_unset, cache_ttl=0):
+    """Change the settings of the shared session. Only the given settings are changed.
+
+    The shared session is replaced with a new one built from the settings, or with the given one.
+    If cache_dir is set, GET responses are stored there and revalidated with
+    ``If-None-Match`` and ``If-Modified-Since`` headers; within cache_ttl seconds after
+    downloading they are served from disk without any request. ``cache_dir=None`` turns it off.
+    """
+    global _session, _pool, _cache, TIMEOUT, RETRIES, CONCURRENCY
+    with _lock:
+        if timeout is not _unset:
+            TIMEOUT = timeout
+        if retries is not _unset:
+            RETRIES = retries
+        if concurrency is not _unset:
+            CONCURRENCY = concurrency
+            # the shared thread pool is made again with the new size on next use,
+            # the work already given to the old one is finished
+            if _pool is not None:
+                _pool.close()
+                _pool = None
+        if cache_dir is not _unset:
+            _cache = _DiskCache(cache_dir, cache_ttl) if cache_dir is not None else None
+        _session = _make_session(CONCURRENCY, RETRIES) if session is _unset else session
+
+
+def get(url, **kwargs):
+    """GET through the shared session with the default timeout, using the cache if configured."""
+    kwargs.setdefault('timeout', TIMEOUT)
+    cache = _cache
+    if cache is None or kwargs.get('stream') or kwargs.get('params'):
+        return get_session().get(url, **kwargs)
+    return cache.get(get_session(), url, **kwargs)
+
+
+def open_url(url, **kwargs):
+    """File-like object of the response body, which can be read while still downloading.
+    When the cache is configured, the response is read from the cache.
+    """
+    if _cache is None:
+        response = get(url, stream=True, **kwargs)
+        response.raw.decode_content = True
+        return response.raw
+    return io.BytesIO(get(url, **kwargs).content)
+
+
+def post(url, data=None, **kwargs):
+    """POST through the shared session with the default timeout."""
+    kwargs.setdefault('timeout', TIMEOUT)
+    return get_session().post(url, data, **kwargs)
+
+
+def map_concurrently(func, iterable, concurrency=None):
+    """Call func with every item, at most concurrency (default: :data:`CONCURRENCY`) at the
+    same time. Results are in the order of iterable. The first exception raised by func is
+    reraised.
+    """
+    items = list(iterable)
+    if not items:
+        return []
+    if concurrency is None:
+        concurrency = CONCURRENCY
+    pool = ThreadPool(min(concurrency, len(items)))
+    try:
+        return pool.map(func, items, chunksize=1)
+    finally:
+        pool.terminate()
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ThreadPool(CONCURRENCY)
+    return _pool
+
+
+def run_async(func, *args, **kwargs):
+    """Run func in the background on the shared thread pool.
+    Returns a :class:`multiprocessing.pool.AsyncResult`, call ``.get(timeout)`` for the result.
+    """
+    return _get_pool().apply_async(func, args, kwargs)
+
+
+class _DiskCache(object):
+    """Stores GET responses on disk, one body and one metadata file per URL."""
+
+    def __init__(self, directory, ttl=0):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        if not self.directory.exists():
+            self.directory.mkdir(parents=True)
+
+    def get(self, session, url, **kwargs):
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        meta = self._load_meta(key)
+
+        if meta is not None and time.time() - meta['fetched'] < self.ttl:
+            return self._make_response(key, meta)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if meta is not None:
+            if meta['etag']:
+                headers['If-None-Match'] = meta['etag']
+            if meta['last_modified']:
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = session.get(url, headers=headers, **kwargs)
+
+        if response.status_code == 304 and meta is not None:
+            meta['fetched'] = time.time()
+            self._write(key + '.json', json.dumps(meta).encode('utf-8'))
+            return self._make_response(key, meta)
+
+        elif response.status_code == 200:
+            self._store(key, url, response)
+
+        return response
+
+    def _load_meta(self, key):
+        meta_path = self.directory / (key + '.json')
+        if not meta_path.exists() or not (self.directory / (key + '.body')).exists():
+            return None
+        with meta_path.open('rb') as fp:
+            return json.loads(fp.read().decode('utf-8'))
+
+    def _store(self, key, url, response):
+        meta = {
+            'url': url,
+            'fetched': time.time(),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'encoding': response.encoding,
+            'headers': dict(response.headers),
+        }
+        self._write(key + '.body', response.content)
+        self._write(key + '.json', json.dumps(meta).encode('utf-8'))
+
+    def _write(self, filename, data):
+        _write_file_atomically(self.directory / filename, data)
+
+    def _make_response(self, key, meta):
+        response = requests.Response()
+        with (self.directory / (key + '.body')).open('rb') as fp:
+            response._content = fp.read()
+        response.status_code = 200
+        response.url = meta['url']
+        response.encoding = meta['encoding']
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.from_cache = True
+        return response
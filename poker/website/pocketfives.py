@@ -2,12 +2,12 @@
 from __future__ import unicode_literals, absolute_import, division, print_function
 
 from collections import namedtuple
-import requests
 from lxml import etree
 from .._common import _make_float
+from . import _common
 
 
-__all__ = ['get_ranked_players', 'WEBSITE_URL', 'RANKINGS_URL']
+__all__ = ['get_ranked_players', 'get_ranked_players_async', 'WEBSITE_URL', 'RANKINGS_URL']
 
 
 WEBSITE_URL = 'http://www.pocketfives.com'
@@ -31,7 +31,7 @@ _Player = namedtuple('_Player',
 def get_ranked_players():
     """Get the list of the first 100 ranked players."""
 
-    rankings_page = requests.get(RANKINGS_URL)
+    rankings_page = _common.get(RANKINGS_URL)
     root = etree.HTML(rankings_page.text)
     player_rows = root.xpath('//div[@id="ranked"]//tr')
 
@@ -48,3 +48,10 @@ def get_ranked_players():
             average_score = _make_float(player_row[8]),
             previous_rank = player_row[9],
         )
+
+
+def get_ranked_players_async():
+    """Download the ranked players in the background.
+    Returns an AsyncResult, ``.get()`` gives the list of players.
+    """
+    return _common.run_async(lambda: list(get_ranked_players()))
@@ -1,14 +1,19 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals, absolute_import, division, print_function
 
+import re
+from decimal import Decimal
+from datetime import datetime
+from contextlib import closing
 from collections import namedtuple
 from dateutil.parser import parse as parse_date
-import requests
+from dateutil.tz import tzoffset, tzutc
 from lxml import etree
+from . import _common
 
 
-__all__ = ['get_current_tournaments', 'get_status', 'WEBSITE_URL', 'TOURNAMENTS_XML_URL',
-           'STATUS_URL']
+__all__ = ['get_current_tournaments', 'get_current_tournaments_async', 'get_status',
+           'get_status_async', 'WEBSITE_URL', 'TOURNAMENTS_XML_URL', 'STATUS_URL']
 
 
 WEBSITE_URL = 'http://www.pokerstars.eu'
@@ -26,20 +31,91 @@ _Tournament = namedtuple('_Tournament',
 """Named tuple for upcoming pokerstars tournaments."""
 
 
-def get_current_tournaments():
-    """Get the next 200 tournaments from pokerstars."""
+_amount_re = re.compile(r'\d+(?:\.\d+)?')
+_tz_cache = {}
 
-    schedule_page = requests.get(TOURNAMENTS_XML_URL)
-    root = etree.XML(schedule_page.content)
 
-    for tour in root.iter('{*}tournament'):
-        yield _Tournament(
-            start_date = parse_date(tour.findtext('{*}start_date')),
-            name = tour.findtext('{*}name'),
-            game = tour.findtext('{*}game'),
-            buyin = tour.findtext('{*}buy_in_fee'),
-            players = int(tour.get('players'))
-        )
+def _parse_feed_date(date_string):
+    """Fast parser for the fixed ISO 8601 format of the feed: 2014-08-16T08:02:00-04:00
+    Falls back to dateutil for anything else.
+    """
+    if len(date_string) != 25 or date_string[10] != 'T' or date_string[19] not in '+-':
+        return parse_date(date_string)
+
+    offset = date_string[19:]
+    tz = _tz_cache.get(offset)
+    if tz is None:
+        seconds = int(offset[1:3]) * 3600 + int(offset[4:6]) * 60
+        tz = tzutc() if seconds == 0 else tzoffset(None, -seconds if offset[0] == '-' else seconds)
+        _tz_cache[offset] = tz
+
+    return datetime(int(date_string[:4]), int(date_string[5:7]), int(date_string[8:10]),
+                    int(date_string[11:13]), int(date_string[14:16]), int(date_string[17:19]),
+                    tzinfo=tz)
+
+
+def _get_buyin_total(buyin):
+    """Sum of buy-in and fee, e.g. 0.55 for '$0.50 + $0.05'."""
+    return sum(Decimal(amount) for amount in _amount_re.findall(buyin.replace(',', '')))
+
+
+def get_current_tournaments(game=None, min_buyin=None, max_buyin=None,
+                            start_after=None, start_before=None):
+    """Get the next 200 tournaments from pokerstars.
+
+    The feed is parsed while downloading and only tournaments matching every given filter
+    are made. game is compared with the game name (e.g. ``"Hold'em"``), buy-ins are
+    buy-in + fee in any currency, start dates are timezone aware datetimes.
+    """
+    # min_buyin and max_buyin can be given as float or str too
+    min_buyin = Decimal(str(min_buyin)) if min_buyin is not None else None
+    max_buyin = Decimal(str(max_buyin)) if max_buyin is not None else None
+
+    with closing(_common.open_url(TOURNAMENTS_XML_URL)) as stream:
+        for _, tour in etree.iterparse(stream, tag='{*}tournament'):
+            tournament = _make_tournament(tour, game, min_buyin, max_buyin,
+                                          start_after, start_before)
+            # free the memory of already processed elements
+            tour.clear()
+            while tour.getprevious() is not None:
+                del tour.getparent()[0]
+
+            if tournament is not None:
+                yield tournament
+
+
+def _make_tournament(tour, game, min_buyin, max_buyin, start_after, start_before):
+    tour_game = tour.findtext('{*}game')
+    if game is not None and tour_game != unicode(game):
+        return None
+
+    buyin = tour.findtext('{*}buy_in_fee')
+    if min_buyin is not None or max_buyin is not None:
+        total = _get_buyin_total(buyin)
+        if ((min_buyin is not None and total < min_buyin) or
+                (max_buyin is not None and total > max_buyin)):
+            return None
+
+    start_date = _parse_feed_date(tour.findtext('{*}start_date'))
+    if ((start_after is not None and start_date < start_after) or
+            (start_before is not None and start_date > start_before)):
+        return None
+
+    return _Tournament(
+        start_date = start_date,
+        name = tour.findtext('{*}name'),
+        game = tour_game,
+        buyin = buyin,
+        players = int(tour.get('players'))
+    )
+
+
+def get_current_tournaments_async(**filters):
+    """Download the tournament list in the background.
+    Takes the same filters as :func:`get_current_tournaments`.
+    Returns an AsyncResult, ``.get()`` gives the list of tournaments.
+    """
+    return _common.run_async(lambda: list(get_current_tournaments(**filters)))
 
 
 _Status = namedtuple('_Status',
@@ -68,7 +144,7 @@ _SiteStatus = namedtuple('_SiteStatus',
 def get_status():
     """Get pokerstars status: players online, number of tables, etc."""
 
-    res = requests.get(STATUS_URL)
+    res = _common.get(STATUS_URL)
     status = res.json()['tournaments']['summary']
 
     # move all sites under sites attribute, including play money
@@ -81,3 +157,8 @@ def get_status():
     updated = parse_date(status.pop('updated'))
 
     return _Status(sites=sites, updated=updated, **status)
+
+
+def get_status_async():
+    """Download the status in the background. Returns an AsyncResult of :class:`_Status`."""
+    return _common.run_async(get_status)
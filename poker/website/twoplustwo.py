@@ -5,11 +5,11 @@ import re
 from datetime import datetime, timedelta
 from collections import namedtuple
 from lxml import etree
-import requests
 import parsedatetime
 from dateutil.tz import tzoffset
 from pytz import UTC
 from .._common import _make_float, _make_int
+from . import _common
 
 
 __all__ = ['search_userid', 'ForumMember', 'FORUM_URL', 'FORUM_MEMBER_URL', 'AJAX_USERSEARCH_URL']
@@ -38,7 +38,7 @@ def search_userid(username):
             'fragment': username
             }
 
-    response = requests.post(AJAX_USERSEARCH_URL, data, headers=headers)
+    response = _common.post(AJAX_USERSEARCH_URL, data, headers=headers)
     root = etree.fromstring(response.content)
 
     try:
@@ -64,16 +64,32 @@ class ForumMember(object):
     """Download and store a member data from the Two Plus Two forum."""
 
     _tz_re = re.compile('GMT (.*?)\.')
+
+    # Find every box containing member data in one pass over the element containing the stats,
+    # not the whole document; the attributes are looked up relative to their box.
+    _find_stats_container = etree.XPath('//div[@id="collapseobj_stats"]/..')
+    _find_boxes = etree.XPath(
+        './/td[@id="username_box" or @id="profilepic_cell"] | '
+        './/div[@id="collapseobj_aboutme" or @id="collapseobj_stats"] | '
+        './/ul[@id="public_usergroup_list"] | .//img[@id="user_avatar"] | '
+        './/div[@class="smallfont" and @align="center"]'
+    )
+    # the timezone is in the footer of the page, which can be outside of the stats container
+    _find_timezone = etree.XPath('//div[@class="smallfont" and @align="center"]')
     _attributes = (
-        ('username', '//td[@id="username_box"]/h1/text()', unicode),
-        ('rank', '//td[@id="username_box"]/h2/text()', unicode),
-        ('profile_picture', '//td[@id="profilepic_cell"]/img/@src', unicode),
-        ('location', '//div[@id="collapseobj_aboutme"]/div/ul/li/dl/dd[1]/text()', unicode),
-        ('total_posts', '//div[@id="collapseobj_stats"]/div/fieldset[1]/ul/li[1]/text()', _make_int),
-        ('posts_per_day', '//div[@id="collapseobj_stats"]/div/fieldset[1]/ul/li[2]/text()', float),
-        ('public_usergroups', '//ul[@id="public_usergroup_list"]/li/text()', tuple),
-        ('avatar', '//img[@id="user_avatar"]/@src', unicode),
+        ('username', 'username_box', etree.XPath('h1/text()'), unicode),
+        ('rank', 'username_box', etree.XPath('h2/text()'), unicode),
+        ('profile_picture', 'profilepic_cell', etree.XPath('img/@src'), unicode),
+        ('location', 'collapseobj_aboutme', etree.XPath('div/ul/li/dl/dd[1]/text()'), unicode),
+        ('total_posts', 'collapseobj_stats', etree.XPath('div/fieldset[1]/ul/li[1]/text()'),
+         _make_int),
+        ('posts_per_day', 'collapseobj_stats', etree.XPath('div/fieldset[1]/ul/li[2]/text()'),
+         float),
+        ('public_usergroups', 'public_usergroup_list', etree.XPath('li/text()'), tuple),
+        ('avatar', 'user_avatar', etree.XPath('@src'), unicode),
     )
+    _activity_ul = etree.XPath('div/fieldset[2]/ul')
+    _last_activity_li = etree.XPath('div/fieldset[2]/ul/li[1]')
 
     def __init__(self, username):
         self.id = search_userid(username)
@@ -90,50 +106,96 @@ class ForumMember(object):
         self._download_and_parse()
         return self
 
+    @classmethod
+    def from_userids(cls, userids, concurrency=None):
+        """Download many members at the same time over the shared connection pool.
+        Returns a list of members in the order of userids.
+        """
+        return _common.map_concurrently(cls.from_userid, userids, concurrency)
+
+    @classmethod
+    def fetch_many(cls, usernames, concurrency=None, skip_missing=False):
+        """Download many members by username. Userids are searched and profiles are downloaded
+        at the same time over the shared connection pool, every profile right after its userid
+        is found. Returns a list of members in the order of usernames.
+        If skip_missing is True, not found or ambiguous usernames give None instead of raising.
+        """
+        def fetch(username):
+            try:
+                return cls(username)
+            except (UserNotFoundError, AmbiguousUserNameError):
+                if not skip_missing:
+                    raise
+                return None
+
+        return _common.map_concurrently(fetch, usernames, concurrency)
+
     def _download_and_parse(self):
         root = self._download_page()
-        self._parse_attributes(root)
-        tz = self._get_timezone(root)
-        self._parse_last_activity(root, tz)
-        self._parse_join_date(root)
+        boxes = self._get_boxes(root)
+        self._parse_attributes(boxes)
+        tz = self._get_timezone(boxes)
+        self._parse_last_activity(boxes, tz)
+        self._parse_join_date(boxes)
 
     @property
     def profile_url(self):
         return '{}/{}/'.format(FORUM_MEMBER_URL, self.id)
 
     def _download_page(self):
-        stats_page = requests.get(self.profile_url)
+        stats_page = _common.get(self.profile_url)
         self.download_date = datetime.now(UTC)
         return etree.HTML(stats_page.text)
 
-    def _parse_attributes(self, root):
-        for attname, xpath, type_ in self._attributes:
-            if type_ != tuple:
-                try:
-                    setattr(self, attname, type_(root.xpath(xpath)[0]))
-                except IndexError:
-                    setattr(self, attname, None)
+    def _get_boxes(self, root):
+        """Map box ids to elements; the timezone div has no id, it's stored as 'timezone'."""
+        containers = self._find_stats_container(root)
+        boxes = {}
+        for element in self._find_boxes(containers[0] if containers else root):
+            if self._is_timezone_box(element):
+                box_id = 'timezone'
             else:
-                setattr(self, attname, type_(root.xpath(xpath)))
+                box_id = element.get('id')
+            if box_id is not None:
+                boxes.setdefault(box_id, element)
+
+        if 'timezone' not in boxes and containers:
+            timezones = self._find_timezone(root)
+            if timezones:
+                boxes['timezone'] = timezones[0]
+        return boxes
 
+    @staticmethod
+    def _is_timezone_box(element):
+        return (element.tag == 'div' and element.get('class') == 'smallfont' and
+                element.get('align') == 'center')
+
+    def _parse_attributes(self, boxes):
+        for attname, box_id, xpath, type_ in self._attributes:
+            box = boxes.get(box_id)
+            values = xpath(box) if box is not None else []
+            if type_ != tuple:
+                setattr(self, attname, type_(values[0]) if values else None)
+            else:
+                setattr(self, attname, type_(values))
 
-    def _get_timezone(self, root):
+    def _get_timezone(self, boxes):
         """Find timezone informatation on bottom of the page."""
-        tz_str = root.xpath('//div[@class="smallfont" and @align="center"]')[0].text
+        tz_str = boxes['timezone'].text
         hours = int(self._tz_re.search(tz_str).group(1))
         return tzoffset(tz_str, hours * 60)
 
-    def _parse_last_activity(self, root, tz):
+    def _parse_last_activity(self, boxes, tz):
         try:
-            li = root.xpath('//div[@id="collapseobj_stats"]/div/fieldset[2]/ul/li[1]')[0]
+            li = self._last_activity_li(boxes['collapseobj_stats'])[0]
             date_str = li[0].tail.strip()
             time_str = li[1].text.strip()
             self.last_activity = self._parse_date(date_str + ' ' + time_str, tz)
-        except IndexError:
+        except (KeyError, IndexError):
             self.last_activity = None
 
-    def _parse_join_date(self, root):
-        ul = root.xpath('//div[@id="collapseobj_stats"]/div/fieldset[2]/ul')[0]
+    def _parse_join_date(self, boxes):
+        ul = self._activity_ul(boxes['collapseobj_stats'])[0]
         try:
             join_date = ul.xpath('li[2]/text()')[0]
         except IndexError:
@@ -18,6 +18,14 @@ install_requires = [
 ]
 
 
+extras_require = {
+    'pushfold': ['numpy'],
+    'deck': ['numpy'],
+    'enumerate': ['numpy'],
+    'sampler': ['numpy'],
+}
+
+
 console_scripts = [
     'poker = poker.commands:poker',
 ]
@@ -42,7 +50,9 @@ setup(
     url = "https://github.com/pokerregion/poker",
     license = "MIT",
     packages = find_packages(),
+    package_data = {'poker': ['data/*.bin']},
     install_requires = install_requires,
+    extras_require = extras_require,
     entry_points = {'console_scripts': console_scripts},
     tests_require = ['pytest', 'coverage', 'coveralls'],
 )
@@ -264,6 +264,11 @@ class TestHandWithFlopOnly:
     def test_flop(self, hand):
         assert isinstance(hand.flop, _Street)
 
+    def test_flop_texture_can_be_read_repeatedly(self, hand):
+        first_read = [hand.flop.is_rainbow, hand.flop.has_pair, hand.flop.has_gutshot]
+        second_read = [hand.flop.is_rainbow, hand.flop.has_pair, hand.flop.has_gutshot]
+        assert first_read == second_read == [True, True, True]
+
 
 class TestAllinPreflopHand:
     hand_text = stars_hands.HAND2
@@ -5,7 +5,7 @@ from pathlib import Path
 from datetime import datetime
 from pytz import UTC
 import pytest
-from poker.room.pokerstars import Notes, _Note, _Label, NoteNotFoundError
+from poker.room.pokerstars import Notes, _Note, _Label, NoteNotFoundError, LabelNotFoundError
 
 
 @pytest.fixture
@@ -152,3 +152,162 @@ def test_delete_label(notes):
         _Label(id='1', color='30FF97', name='SHARK'),
         _Label(id='3', color='E1FF80', name='GENERAL'),
      )
+
+
+def test_deleted_note_not_found(notes):
+    notes.del_note('regplayer')
+    with pytest.raises(NoteNotFoundError):
+        notes.get_note('regplayer')
+
+
+def test_added_label_can_be_used(notes):
+    notes.add_label('YETI', 'FF0000')
+    notes.add_note('Walkman', 'is a yeti', label='YETI')
+    assert notes.get_note('Walkman').label == 'YETI'
+
+
+def test_deleted_label_can_not_be_used(notes):
+    notes.del_label('REG')
+    with pytest.raises(LabelNotFoundError):
+        notes.add_note('Walkman', 'is a reg', label='REG')
+
+
+def test_player_name_with_both_quotes(notes):
+    notes.add_note('"it\'s me"', 'strange name')
+    assert notes.get_note_text('"it\'s me"') == 'strange name'
+
+
+@pytest.fixture
+def duplicate_notes():
+    return Notes("""<?xml version="1.0" encoding="UTF-8"?>
+<notes version="1">
+    <labels>
+        <label id="0" color="E1FF80">REG</label>
+        <label id="1" color="FF0000">REG</label>
+    </labels>
+    <note player="regplayer" label="0" update="1386954394">first note</note>
+    <note player="regplayer" label="1" update="1410722450">second note</note>
+    <group>
+        <note player="nestedplayer" label="-1" update="1410722450">nested note</note>
+    </group>
+</notes>""")
+
+
+def test_duplicate_note_is_found_after_deleting_the_first(duplicate_notes):
+    assert duplicate_notes.get_note_text('regplayer') == 'first note'
+    duplicate_notes.del_note('regplayer')
+    assert duplicate_notes.get_note_text('regplayer') == 'second note'
+    duplicate_notes.del_note('regplayer')
+    with pytest.raises(NoteNotFoundError):
+        duplicate_notes.get_note('regplayer')
+
+
+def test_duplicate_label_is_found_after_deleting_the_first(duplicate_notes):
+    assert duplicate_notes.get_label('REG').id == '0'
+    duplicate_notes.del_label('REG')
+    assert duplicate_notes.get_label('REG').id == '1'
+
+
+def test_only_top_level_notes_are_indexed(duplicate_notes):
+    with pytest.raises(NoteNotFoundError):
+        duplicate_notes.get_note('nestedplayer')
+
+
+def test_bulk_upsert(notes):
+    update = datetime(2015, 1, 2, 3, 4, 5, tzinfo=UTC)
+    notes.bulk_upsert([
+        _Note(player='regplayer', label='SHARK', update=update, text='not a reg'),
+        _Note(player='Walkman', label=None, update=update, text='new note'),
+    ])
+
+    assert notes.get_note('regplayer') == _Note('regplayer', 'SHARK', update, 'not a reg')
+    assert notes.get_note('Walkman') == _Note('Walkman', None, update, 'new note')
+    assert notes.players[-1] == 'Walkman'
+
+
+def test_bulk_upsert_invalid_label_changes_nothing(notes):
+    with pytest.raises(LabelNotFoundError):
+        notes.bulk_upsert([
+            _Note(player='Walkman', label=None, update=None, text='new note'),
+            _Note(player='regplayer', label='YETI', update=None, text='not a reg'),
+        ])
+    assert 'Walkman' not in notes.players
+
+
+@pytest.fixture
+def other_notes():
+    return Notes("""<?xml version="1.0" encoding="UTF-8"?>
+<notes version="1">
+    <labels>
+        <label id="0" color="E1FF80">REG</label>
+        <label id="1" color="FF0000">YETI</label>
+    </labels>
+    <note player="regplayer" label="1" update="1386954394">older note</note>
+    <note player="sharkplayer" label="0" update="1410722450">newer note</note>
+    <note player="Walkman" label="1" update="1410722450">new player</note>
+</notes>""")
+
+
+def test_merge_newer(notes, other_notes):
+    notes.merge(other_notes)
+
+    assert notes.get_note_text('regplayer') == 'river big bet 99'
+    assert notes.get_note('sharkplayer').text == 'newer note'
+    assert notes.get_note('sharkplayer').label == 'REG'
+    assert notes.get_note('Walkman').label == 'YETI'
+    assert notes.get_label('YETI') == _Label(id='4', color='FF0000', name='YETI')
+
+
+def test_merge_theirs(notes, other_notes):
+    notes.merge(other_notes, policy='theirs')
+    assert notes.get_note('regplayer').text == 'older note'
+    assert notes.get_note('regplayer').label == 'YETI'
+
+
+def test_merge_ours(notes, other_notes):
+    notes.merge(other_notes, policy='ours')
+    assert notes.get_note_text('regplayer') == 'river big bet 99'
+    assert notes.get_note_text('sharkplayer') == 'plays GTO'
+    assert notes.get_note_text('Walkman') == 'new player'
+
+
+def test_merge_append(notes, other_notes):
+    notes.merge(other_notes, policy='append')
+    notes.merge(other_notes, policy='append')
+
+    assert notes.get_note_text('regplayer') == 'river big bet 99\nolder note'
+    assert notes.get_note('regplayer').label == 'FISH'
+    assert notes.get_note('sharkplayer').update == datetime(2014, 9, 14, 19, 20, 50, tzinfo=UTC)
+
+
+def test_merge_invalid_policy(notes, other_notes):
+    with pytest.raises(ValueError):
+        notes.merge(other_notes, policy='mine')
+
+
+def test_save(notes, tmpdir):
+    notes.add_note('Walkman', 'is a big fish', label='FISH')
+    filename = str(tmpdir.join('notes.xml'))
+    notes.save(filename)
+
+    saved = Notes.from_file(filename)
+    assert saved.notes == notes.notes
+    assert saved.labels == notes.labels
+
+
+def test_iter_file(notes):
+    filedir = Path(__file__).parent
+    items = list(Notes.iter_file(filedir / 'notes.W2lkm2n.xml'))
+
+    assert tuple(items[:4]) == notes.labels
+    assert tuple(items[4:]) == notes.notes
+
+
+def test_from_file_same_as_from_str(notes):
+    filedir = Path(__file__).parent
+    notes_unicode = (filedir / 'notes.W2lkm2n.xml').open().read()
+    from_str = Notes(notes_unicode)
+
+    assert from_str.notes == notes.notes
+    assert from_str.labels == notes.labels
+    assert notes.raw == notes_unicode
@@ -2,7 +2,7 @@
 from __future__ import unicode_literals, absolute_import, division, print_function
 
 from pathlib import Path
-from poker import Strategy, Range
+from poker import Strategy, Range, Combo
 from poker.constants import Position
 from poker.strategy import _Situation
 import pytest
@@ -87,3 +87,68 @@ def test_values():
 
 def test_get_first_position():
     assert strategy.get_first_spot().position == Position.UTG
+
+
+def test_lookup():
+    assert strategy.lookup('10 BB', Position.UTG, Combo('AhKh')) == 'PUSH'
+    assert strategy.lookup('10 BB', Position.UTG, Combo('7h2d')) == 'FOLD'
+    assert strategy.lookup('10 BB', Position.SB, Combo('7h2d')) == 'PUSH'
+
+
+def test_lookup_by_situation_index_and_strings():
+    assert strategy.lookup(1, 'CO', 'Ac3c') == 'PUSH'
+    assert strategy.lookup(1, 'UTG', 'Ac3c') == 'FOLD'
+    assert strategy.lookup(2, 'sb', '5d5c') == 'PUSH'
+
+
+def test_lookup_position_without_range():
+    assert strategy.lookup('10 BB', Position.BB, Combo('AhAs')) is None
+
+
+def test_lookup_unknown_situation_raises_KeyError():
+    with pytest.raises(KeyError):
+        strategy.lookup('20 BB', Position.UTG, Combo('AhAs'))
+
+
+def test_ranges_are_parsed_lazily():
+    lazy_strategy = Strategy.from_file(filedir / 'push.strategy')
+    assert lazy_strategy._situations == {}
+    assert lazy_strategy['11 BB'] == elevenBB
+    assert list(lazy_strategy._situations) == ['11 BB']
+
+
+def test_lookup_does_not_need_other_situations():
+    lazy_strategy = Strategy.from_file(filedir / 'push.strategy')
+    assert lazy_strategy.lookup('12 BB', 'CO', 'AhKd') == 'PUSH'
+    assert list(lazy_strategy._situations) == ['12 BB']
+
+
+class TestCompiledCache:
+    @pytest.fixture
+    def strategy_file(self, tmpdir):
+        filename = tmpdir.join('push.strategy')
+        filename.write_binary((filedir / 'push.strategy').open('rb').read())
+        return Path(unicode(filename))
+
+    def test_cache_file_is_created(self, strategy_file):
+        Strategy.from_file(strategy_file, cache=True)
+        assert strategy_file.with_name('push.strategy.bin').exists()
+
+    def test_cached_strategy_is_the_same(self, strategy_file):
+        Strategy.from_file(strategy_file, cache=True)
+        cached = Strategy.from_file(strategy_file, cache=True)
+        assert cached._situations == {}
+        assert tuple(cached) == ('10 BB', '11 BB', '12 BB')
+        assert tuple(cached.values()) == (tenBB, elevenBB, twelveBB)
+        assert cached.name == 'Preflop PUSH'
+        assert cached.lookup('10 BB', 'SB', '7h2d') == 'PUSH'
+        assert cached.lookup('10 BB', 'BB', '7h2d') is None
+
+    def test_cache_is_rebuilt_when_source_changes(self, strategy_file):
+        Strategy.from_file(strategy_file, cache=True)
+        content = strategy_file.open(encoding='utf-8').read()
+        with strategy_file.open('w', encoding='utf-8') as fp:
+            fp.write(content.replace('SB = 55- A2+', 'SB = 22+'))
+        changed = Strategy.from_file(strategy_file, cache=True)
+        assert changed['12 BB'].sb == Range('22+')
+        assert Strategy.from_file(strategy_file, cache=True)['12 BB'].sb == Range('22+')
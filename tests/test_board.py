@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import itertools
+import pytest
+from poker.card import Card, Rank
+from poker.hand import Combo, Range
+from poker.board import BoardTexture, get_texture, MadeHand, HandStrength, classify
+
+
+def _make_board(board):
+    return tuple(Card(board[i:i + 2]) for i in range(0, len(board), 2))
+
+
+def _pairwise_texture(cards):
+    """Texture with the definitions of the features, comparing every two cards."""
+    pairs = list(itertools.combinations(cards, 2))
+    differences = [Rank.difference(first.rank, second.rank) for first, second in pairs]
+    return BoardTexture(
+        is_rainbow=all(first.suit != second.suit for first, second in pairs),
+        is_monotone=all(first.suit == second.suit for first, second in pairs),
+        is_triplet=all(first.rank == second.rank for first, second in pairs),
+        has_pair=any(first.rank == second.rank for first, second in pairs),
+        has_straightdraw=any(1 <= diff <= 3 for diff in differences),
+        has_gutshot=any(1 <= diff <= 4 for diff in differences),
+        has_flushdraw=any(first.suit == second.suit for first, second in pairs),
+    )
+
+
+def test_all_flops_match_definitions():
+    for flop in itertools.combinations(Card, 3):
+        assert get_texture(flop) == _pairwise_texture(flop)
+
+
+@pytest.mark.parametrize('board', ['2s6d6hKc', 'AsKsQsJs', '7d3cJd9h2c', '2c3d4h5s6c'])
+def test_turn_and_river(board):
+    cards = _make_board(board)
+    assert get_texture(cards) == _pairwise_texture(cards)
+
+
+def test_flop_texture():
+    assert get_texture(_make_board('2s6d6h')) == BoardTexture(
+        is_rainbow=True, is_monotone=False, is_triplet=False, has_pair=True,
+        has_straightdraw=False, has_gutshot=True, has_flushdraw=False)
+    assert get_texture(_make_board('KhQhJh')).is_monotone
+    assert get_texture(_make_board('7s7d7c')).is_triplet
+
+
+@pytest.mark.parametrize(('combo', 'board', 'made_hand'), [
+    ('AsKd', 'Kh7c2d', MadeHand.TOP_PAIR),
+    ('QsQd', 'Kh7c2d', MadeHand.POCKET_PAIR_BELOW_TOP_PAIR),
+    ('AsAd', 'Kh7c2d', MadeHand.OVERPAIR),
+    ('6s6d', 'Kh7c2d', MadeHand.WEAK_PAIR),
+    ('As7d', 'Kh7c2d', MadeHand.MIDDLE_PAIR),
+    ('As2d', 'Kh7c2d', MadeHand.WEAK_PAIR),
+    ('7s7d', 'Kh7c2d', MadeHand.SET),
+    ('Ks7d', 'Kh7c2d', MadeHand.TWO_PAIR),
+    ('KsQs', 'KhKc2d', MadeHand.TRIPS),
+    ('AsQd', 'KhKc2d', MadeHand.ACE_HIGH),
+    ('QsJd', 'Kh7c2d', MadeHand.NO_MADE_HAND),
+    ('Ad5c', '4h3c2d', MadeHand.STRAIGHT),
+    ('AhTh', 'Qh7h2h', MadeHand.FLUSH),
+    ('2s2c', 'Kh2h2d', MadeHand.QUADS),
+    ('KsKc', 'Kh7h7d', MadeHand.FULL_HOUSE),
+    ('9h8h', 'Th7h6h', MadeHand.STRAIGHT_FLUSH),
+])
+def test_made_hands(combo, board, made_hand):
+    assert classify(Combo(combo), _make_board(board)).made_hand == made_hand
+
+
+@pytest.mark.parametrize(('combo', 'board', 'made_hand'), [
+    ('3c2c', 'AdKdQdJdTd', MadeHand.STRAIGHT_FLUSH),
+    ('AsAd', '9h8h7h6h5h', MadeHand.STRAIGHT_FLUSH),
+    ('AsAd', '9c8d7h6s5h', MadeHand.STRAIGHT),
+    ('Ac3c', 'QhJcTd9s8s', MadeHand.STRAIGHT),
+    ('KsQd', 'Ah9h7h4h2h', MadeHand.FLUSH),
+])
+def test_hand_made_by_the_board_alone_counts(combo, board, made_hand):
+    # the hole cards don't play, but a pair or high card is not the best hand
+    assert classify(Combo(combo), _make_board(board)).made_hand == made_hand
+
+
+@pytest.mark.parametrize(('combo', 'board', 'strength'), [
+    ('AhKh', 'Qh7h2d', HandStrength(MadeHand.ACE_HIGH, True, False, False)),
+    ('9s8s', '7h6c2d', HandStrength(MadeHand.NO_MADE_HAND, False, True, False)),
+    ('9s5s', '7h6c2d', HandStrength(MadeHand.NO_MADE_HAND, False, False, True)),
+    ('9h8h', '7h6h2d', HandStrength(MadeHand.NO_MADE_HAND, True, True, False)),
+    # double gutshot
+    ('9s7s', 'Jh8c5d', HandStrength(MadeHand.NO_MADE_HAND, False, True, False)),
+    # no draws on the river
+    ('AhKh', 'Qh7h2d3c4s', HandStrength(MadeHand.ACE_HIGH, False, False, False)),
+])
+def test_draws(combo, board, strength):
+    assert Combo(combo).classify(_make_board(board)) == strength
+
+
+def test_range_strength():
+    strength = Range('XX').classify(_make_board('Kh7c2d'))
+    assert strength.combos == 1176
+    assert sum(strength.made_hands.values()) == 1176
+    assert strength.made_hands[MadeHand.SET] == 9
+    assert strength.made_hands[MadeHand.OVERPAIR] == 6
+    assert strength.made_hands[MadeHand.TWO_PAIR] == 27
+    assert strength.flushdraws == strength.oesds == strength.gutshots == 0
+
+
+def test_range_strength_skips_blocked_combos():
+    strength = Range('KK AK').classify(_make_board('Kh7h2d'))
+    assert strength.combos == 3 + 12
+    assert strength.made_hands == {MadeHand.SET: 3, MadeHand.TOP_PAIR: 12}
+    assert strength.flushdraws == 0
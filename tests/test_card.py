@@ -2,8 +2,9 @@
 from __future__ import unicode_literals, absolute_import, division, print_function
 
 import pickle
+import itertools
 import pytest
-from poker.card import Card, Rank, Suit
+from poker.card import Card, Rank, Suit, canonize, permute_suits
 
 
 def test_only_cards_with_same_rank_are_equal():
@@ -142,9 +143,46 @@ def test_hash():
     assert hash(card1) == hash(card2)
 
 
+def test_hashes_are_dense_indexes():
+    assert [hash(card) for card in Card] == list(range(52))
+
+
 def test_putting_them_in_set_doesnt_raise_Exception():
     {Card('As'), Card('Kc')}
 
 
 def test_pickable():
     assert pickle.loads(pickle.dumps(Card('2s'))) == Card('2s')
+
+
+def test_canonize_isomorphic_boards_are_equal():
+    board1, _ = canonize((Card('As'), Card('Ks'), Card('7d')))
+    board2, _ = canonize((Card('7c'), Card('Kh'), Card('Ah')))
+    assert board1 == board2 == (Card('As'), Card('Ks'), Card('7h'))
+
+
+def test_canonize_different_boards_are_different():
+    board1, _ = canonize((Card('As'), Card('Ks'), Card('7d')))
+    board2, _ = canonize((Card('As'), Card('Kd'), Card('7s')))
+    assert board1 != board2
+
+
+def test_canonize_permutation_maps_all_suits():
+    cards = (Card('Ah'), Card('Kh'), Card('7c'))
+    canonical, permutation = canonize(cards)
+    assert sorted(permutation) == sorted(Suit)
+    assert sorted(permutation.values()) == sorted(Suit)
+    assert tuple(sorted(permute_suits(cards, permutation), reverse=True)) == canonical
+    # hole cards can be mapped the same way as the board
+    assert permute_suits((Card('Qh'), Card('Qd')), permutation) == (Card('Qs'), Card('Qd'))
+
+
+def test_number_of_canonical_flops():
+    flops = {canonize(flop)[0] for flop in itertools.combinations(Card, 3)}
+    assert len(flops) == 1755
+
+
+def test_card_canonize():
+    card, permutation = Card('5d').canonize()
+    assert card == Card('5s')
+    assert permutation[Suit('d')] == Suit('s')
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+from poker.hand import Hand, Range
+from poker.charts import ranges_to_html
+
+
+def test_one_table_for_every_range():
+    html = ranges_to_html([Range('AA'), Range('KK'), {'QQ': 1}])
+    assert html.startswith('<!DOCTYPE html>')
+    assert html.endswith('</body></html>')
+    assert html.count('<table class="range">') == 3
+    assert html.count('<td') == 3 * 169
+
+
+def test_range_weights_are_the_part_of_combos():
+    html = ranges_to_html([Range('AA AsKs')], color=(0, 0, 0))
+    assert '<td class="pair" style="background-color:rgba(0,0,0,1.00)">AA</td>' in html
+    assert '<td class="suited" style="background-color:rgba(0,0,0,0.25)">AKs</td>' in html
+    assert '<td class="offsuit"></td>' in html
+
+
+def test_mapping_weights():
+    html = ranges_to_html([{Hand('KK'): 0.5, 'AKo': 2, '72o': 0}], color=(1, 2, 3))
+    assert '<td class="pair" style="background-color:rgba(1,2,3,0.50)">KK</td>' in html
+    assert '<td class="offsuit" style="background-color:rgba(1,2,3,1.00)">AKo</td>' in html
+    assert '>72o<' not in html
+
+
+def test_titles_are_escaped():
+    html = ranges_to_html([Range('AA'), Range('KK')], titles=['UTG <open>', 'BTN'])
+    assert '<h2>UTG &lt;open&gt;</h2>' in html
+    assert html.index('<h2>BTN</h2>') > html.index('<h2>UTG')
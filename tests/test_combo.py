@@ -3,7 +3,7 @@ from __future__ import unicode_literals, absolute_import, division, print_functi
 
 import pickle
 import pytest
-from poker.card import Card
+from poker.card import Card, Suit
 from poker.hand import Shape, Hand, Combo
 
 
@@ -144,6 +144,46 @@ def test_hash():
     combination2 = Combo('2c2s')
     assert hash(combination1) == hash(combination2)
 
+
+def test_hashes_are_unique_dense_indexes():
+    hashes = {hash(combo) for hand in Hand for combo in hand.to_combos()}
+    assert hashes == set(range(1326))
+
+
+def test_orders_are_unique_and_follow_hand_order():
+    combos = [combo for hand in Hand for combo in hand.to_combos()]
+    assert {combo.order for combo in combos} == set(range(1326))
+    assert Combo('Ac2d').order < Combo('Ac2c').order < Combo('2d2c').order < Combo('AsAh').order
+    assert Combo('KsQh').order < Combo('AdKh').order
+    assert sorted(combos, key=lambda combo: combo.order) == sorted(combos)
+
+
+def test_changing_card_changes_equality():
+    combo = Combo('AsKc')
+    combo.second = Card('Kd')
+    assert combo == Combo('AsKd')
+    assert hash(combo) == hash(Combo('AsKd'))
+
+    # cards set lower than the second or higher than the first are put in order
+    combo.first = Card('2c')
+    assert combo == Combo('Kd2c')
+    assert hash(combo) == hash(Combo('Kd2c'))
+    assert combo.to_hand() == Hand('K2o')
+    combo.second = 'Ah'
+    assert combo == Combo('AhKd')
+    assert hash(combo) == hash(Combo('AhKd'))
+    assert combo.to_hand() == Hand('AKo')
+
+
+def test_setting_a_higher_card_keeps_index_unique():
+    combo = Combo('AsKd')
+    combo.first = Card('2c')
+    assert combo != Combo('4h2c')
+    assert combo.first == Card('Kd') and combo.second == Card('2c')
+    assert {combo, Combo('4h2c')} == {Combo('Kd2c'), Combo('4h2c')}
+    assert combo.to_hand() == Hand('K2o')
+
+
 def test_putting_them_in_set_doesnt_raise_Exception():
     {Combo('AsAh'), Combo('2s2c')}
 
@@ -160,6 +200,11 @@ def test_from_cards():
     assert repr(combination) == b"Combo('A♠K♥')"
 
 
+def test_from_cards_with_the_same_card_raises_ValueError():
+    with pytest.raises(ValueError):
+        Combo.from_cards(Card('As'), Card('As'))
+
+
 def test_shape_property():
     assert Combo('2s2c').shape == Shape.PAIR
     assert Combo('AsKs').shape == Shape.SUITED
@@ -172,9 +217,41 @@ def test_to_hand_converter_method():
     assert Combo('7s6s').to_hand() == Hand('76s')
 
 
+def test_to_hand_of_every_combo_is_its_hand():
+    for hand in Hand:
+        assert all(combo.to_hand() == hand for combo in hand.to_combos())
+
+
+def test_changing_the_converted_hand_doesnt_change_other_conversions():
+    hand = Combo('AsKd').to_hand()
+    hand.shape = 's'
+    assert Combo('AhKc').to_hand() == Hand('AKo')
+
+
+def test_to_hand_after_changing_cards():
+    combo = Combo('AsKd')
+    combo.first = Card('2c')
+    assert combo.to_hand() == Hand('K2o')
+    combo.second = Card('Ks')
+    assert combo.to_hand() == Hand('KK')
+
+
 def test_pairs_are_not_offsuits():
     assert Combo('2s2c').is_offsuit is False
 
 
 def test_pickable():
     assert pickle.loads(pickle.dumps(Combo('AsKc'))) == Combo('AsKc')
+
+
+def test_canonize():
+    assert {Combo(combo).canonize()[0] for combo in ('AhKh', 'AcKc', 'AdKd', 'AsKs')} == \
+        {Combo('AsKs')}
+    assert Combo('AdKc').canonize()[0] == Combo('AsKh')
+    assert Combo('7c7d').canonize()[0] == Combo('7s7h')
+
+
+def test_canonize_returns_permutation():
+    combo, permutation = Combo('AdKc').canonize()
+    assert permutation[Suit('d')] == Suit('s')
+    assert permutation[Suit('c')] == Suit('h')
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import pytest
+from poker.card import Card
+from poker.hand import Combo
+from poker.deck import Deck, get_mask, to_masks, FULL_MASK
+
+
+def test_new_deck_has_all_the_cards():
+    deck = Deck()
+    assert len(deck) == 52
+    assert deck.mask == FULL_MASK
+    assert deck.cards == tuple(Card)
+
+
+def test_dead_cards_are_not_in_the_deck():
+    deck = Deck(dead='AsKd')
+    assert len(deck) == 50
+    assert 'As' not in deck
+    assert Card('Kd') not in deck
+    assert 'Kc' in deck
+
+
+def test_get_mask_accepts_cards_combos_and_strings():
+    mask = (1 << Card('As')._index) | (1 << Card('2c')._index)
+    assert get_mask(Card('As')) | get_mask(Card('2c')) == mask
+    assert get_mask(Combo('As2c')) == mask
+    assert get_mask('As2c') == mask
+    assert get_mask([Card('As'), '2c']) == mask
+    assert get_mask(()) == 0
+
+
+def test_dealt_cards_are_removed():
+    deck = Deck(seed=1)
+    cards = deck.deal(5)
+    assert len(cards) == len(set(cards)) == 5
+    assert len(deck) == 47
+    assert not any(card in deck for card in cards)
+
+
+def test_deals_are_reproducible_with_seed():
+    assert Deck(seed=42).deal(7) == Deck(seed=42).deal(7)
+
+
+def test_excluded_cards_are_not_dealt_but_stay_in_the_deck():
+    deck = Deck(seed=2)
+    combo = Combo('AhAd')
+    for _ in range(10):
+        deck.reset()
+        assert not set(deck.deal(5, exclude=combo)) & set(combo.cards)
+        assert 'Ah' in deck and 'Ad' in deck
+
+
+def test_deal_the_last_cards_and_too_many():
+    deck = Deck(dead=list(Card)[:40], seed=3)
+    assert set(deck.deal(12)) == set(list(Card)[40:])
+    with pytest.raises(ValueError):
+        deck.deal()
+
+
+def test_remove_and_reset():
+    deck = Deck(dead='2c', seed=4)
+    deck.remove('AsKsQs')
+    assert len(deck) == 48
+    deck.deal(2)
+    deck.reset()
+    assert len(deck) == 51
+    assert '2c' not in deck
+
+
+def test_deal_mask():
+    deck = Deck(seed=5)
+    mask = deck.deal_mask(3)
+    assert bin(mask).count('1') == 3
+    assert deck.mask == FULL_MASK & ~mask
+
+
+class TestDealMany:
+    def test_shape_and_unique_cards(self):
+        deck = Deck(dead='AsAh', seed=6)
+        deals = deck.deal_many(1000, 5)
+        assert deals.shape == (1000, 5)
+        assert all(len(set(deal)) == 5 for deal in deals.tolist())
+        assert len(deck) == 50
+
+    def test_excluded_and_dead_cards_are_not_dealt(self):
+        deck = Deck(dead='AsAh', seed=7)
+        deals = deck.deal_many(2000, 3, exclude=Combo('KsKh'))
+        forbidden = {Card(card)._index for card in ('As', 'Ah', 'Ks', 'Kh')}
+        assert not set(deals.ravel().tolist()) & forbidden
+        assert len(set(deals.ravel().tolist())) == 48
+
+    def test_to_masks(self):
+        deals = Deck(seed=8).deal_many(100, 4)
+        masks = to_masks(deals)
+        assert [int(mask) for mask in masks] == \
+            [sum(1 << index for index in deal) for deal in deals.tolist()]
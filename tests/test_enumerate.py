@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import itertools
+import pytest
+from poker.card import Card
+from poker.hand import Combo
+from poker.deck import get_mask
+from poker.enumerate import (runout_cards, runouts, canonical_runouts, count_runouts,
+                             _combinations)
+
+
+@pytest.mark.parametrize('n, k', [(5, 0), (5, 1), (5, 3), (6, 6), (20, 4)])
+def test_combinations_are_the_same_as_itertools(n, k):
+    assert [tuple(row) for row in _combinations(n, k).tolist()] == \
+        list(itertools.combinations(range(n), k))
+
+
+def test_turns_and_rivers_on_flop():
+    cards = runout_cards('AsKs7s')
+    assert cards.shape == (1176, 2)
+    board_mask = get_mask('AsKs7s')
+    assert not any(board_mask & int(mask) for mask in runouts('AsKs7s'))
+
+
+def test_dead_cards_do_not_come():
+    cards = runout_cards('AsKd7c', dead=Combo('QhQc'))
+    assert cards.shape == (1081, 2)
+    dead = {Card('Qh')._index, Card('Qc')._index}
+    assert not set(cards.ravel().tolist()) & dead
+
+
+def test_runouts_are_masks_of_runout_cards():
+    cards, masks = runout_cards('AsKd7c2h'), runouts('AsKd7c2h')
+    assert [int(mask) for mask in masks] == [1 << index for index in cards.ravel().tolist()]
+
+
+def test_count_runouts():
+    assert count_runouts('AsKd7c') == 1176
+    assert count_runouts('AsKd7c', dead='QhQc') == 1081
+    assert count_runouts(num_cards=3) == 22100
+    assert count_runouts('AsKd7c2h3h') == 1
+
+
+def test_too_many_cards_raise_ValueError():
+    with pytest.raises(ValueError):
+        runout_cards(dead=list(Card)[:50], num_cards=3)
+
+
+class TestCanonicalRunouts:
+    def test_canonical_flops(self):
+        masks, weights = canonical_runouts(num_cards=3)
+        assert len(masks) == 1755
+        assert weights.sum() == 22100
+
+    def test_monotone_flop_turns(self):
+        # 10 spades one by one, the other suits are interchangeable: 13 classes of 3 cards
+        masks, weights = canonical_runouts('AsKs7s', num_cards=1)
+        assert len(masks) == 23
+        assert sorted(weights.tolist()) == [1] * 10 + [3] * 13
+
+    def test_weights_add_up_to_all_runouts(self):
+        masks, weights = canonical_runouts('Ah8h2c')
+        assert weights.sum() == count_runouts('Ah8h2c')
+        assert len(masks) < count_runouts('Ah8h2c')
+
+    def test_dead_cards_break_symmetry(self):
+        masks, weights = canonical_runouts('AsKd7c', dead='QhQc')
+        assert len(masks) == 1081
+        assert set(weights.tolist()) == {1}
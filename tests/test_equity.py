@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import pytest
+from poker.hand import Hand, Range
+from poker.equity import preflop_equity, preflop_hand_equity
+
+
+@pytest.mark.parametrize(('hand1', 'hand2', 'equity'), (
+    ('AA', 'KK', 0.82),
+    ('KK', 'AKo', 0.70),
+    ('QQ', 'AKs', 0.54),
+    ('22', 'AKo', 0.53),
+    ('AA', '72o', 0.88),
+    ('JTs', '22', 0.54),
+))
+def test_hand_equities(hand1, hand2, equity):
+    assert preflop_hand_equity(hand1, hand2) == pytest.approx(equity, abs=0.01)
+
+
+def test_hand_equities_are_symmetric():
+    for hand1 in (Hand('AA'), Hand('AKs'), Hand('T9o'), Hand('32o')):
+        for hand2 in Hand:
+            equity = preflop_hand_equity(hand1, hand2) + preflop_hand_equity(hand2, hand1)
+            assert equity == pytest.approx(1, abs=0.0001)
+
+
+def test_same_hand_is_even():
+    assert preflop_hand_equity('AKo', 'AKo') == pytest.approx(0.5, abs=0.0001)
+    assert preflop_hand_equity('33', '33') == pytest.approx(0.5, abs=0.0001)
+
+
+def test_whole_hands_equal_hand_equity():
+    assert preflop_equity(Range('AA'), Range('KK')) == preflop_hand_equity('AA', 'KK')
+
+
+def test_range_is_weighted_by_combos():
+    aa_kk = preflop_hand_equity('AA', 'KK')
+    aa_aks = preflop_hand_equity('AA', 'AKs')
+    # AA vs KK: 36 matchups, AA vs AKs: 6 * 2 = 12 (only 2 aces left)
+    expected = (aa_kk * 36 + aa_aks * 12) / 48
+    assert preflop_equity(Range('AA'), Range('KK AKs')) == pytest.approx(expected)
+
+
+def test_card_removal_of_single_combos():
+    # only AdAc is left against AsAh
+    assert preflop_equity(Range('AsAh'), Range('AA')) == pytest.approx(0.5, abs=0.0001)
+    # As blocks half of the AA combos, but none of the KK combos
+    expected = (preflop_hand_equity('AKs', 'AA') * 3 + preflop_hand_equity('AKs', 'KK') * 3) / 6
+    assert preflop_equity(Range('AsKs'), Range('AA KK')) == pytest.approx(expected)
+
+
+def test_single_combos_get_the_average_equity_of_their_hands():
+    # approximation, the suits shared by the combos are not taken into account
+    expected = preflop_hand_equity('AKs', 'QJs')
+    assert preflop_equity(Range('AhKh'), Range('QhJh')) == pytest.approx(expected)
+    assert preflop_equity(Range('AhKh'), Range('QsJs')) == pytest.approx(expected)
+
+
+def test_mixed_hands_and_combos():
+    equity = preflop_equity(Range('QQ+ AKs'), Range('JJ AhKd'))
+    assert 0.5 < equity < 1
+    assert preflop_equity(Range('JJ AhKd'), Range('QQ+ AKs')) == pytest.approx(1 - equity)
+
+
+def test_no_possible_matchup():
+    assert preflop_equity(Range('AsKs'), Range('AsQs')) is None
+    assert preflop_equity(Range(), Range('AA')) is None
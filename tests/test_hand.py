@@ -170,6 +170,23 @@ def test_hash():
     assert hash(hand1) == hash(hand2)
 
 
+def test_hashes_are_dense_indexes():
+    assert [hash(hand) for hand in Hand] == list(range(169))
+
+
+def test_order_is_the_position_in_ascending_order():
+    assert [hand.order for hand in Hand] == list(range(169))
+    assert Hand('AKo').order < Hand('AKs').order < Hand('22').order
+    assert sorted(Hand, key=lambda hand: hand.order, reverse=True)[0] == Hand('AA')
+
+
+def test_changing_shape_changes_hash():
+    hand = Hand('AKo')
+    hand.shape = 's'
+    assert hand == Hand('AKs')
+    assert hash(hand) == hash(Hand('AKs'))
+
+
 def test_putting_them_in_set_doesnt_raise_Exception():
     {Hand('22'), Hand('AKo')}
 
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import itertools
+from decimal import Decimal
+import pytest
+from poker.icm import icm, exact_icm, monte_carlo_icm, players_icm
+from poker.handhistory import _Player
+
+
+def _brute_force_icm(stacks, payouts):
+    """Sum over every finishing order."""
+    equities = [0.] * len(stacks)
+    for order in itertools.permutations(range(len(stacks))):
+        probability, remaining = 1., sum(stacks)
+        for player in order:
+            probability *= stacks[player] / remaining
+            remaining -= stacks[player]
+        for place, payout in enumerate(payouts):
+            equities[order[place]] += probability * payout
+    return equities
+
+
+def test_equal_stacks_share_equally():
+    assert exact_icm([1000, 1000], [65, 35]) == [50, 50]
+
+
+def test_chip_leader_gets_less_than_chip_share():
+    equities = exact_icm([8000, 1000, 1000], [50, 30, 20])
+    assert equities[0] < 0.8 * 100
+    assert sum(equities) == pytest.approx(100)
+
+
+@pytest.mark.parametrize(('stacks', 'payouts'), [
+    ([5000, 3000, 2000], [0.5, 0.3, 0.2]),
+    ([1500, 3200, 800, 4500, 2000, 100], [50, 30, 20]),
+    ([10, 20, 30, 40, 50, 60, 70], [40, 25, 15, 10, 6, 4]),
+])
+def test_exact_equals_brute_force(stacks, payouts):
+    assert exact_icm(stacks, payouts) == pytest.approx(_brute_force_icm(stacks, payouts))
+
+
+def test_busted_players_get_nothing_without_payouts_left():
+    equities = exact_icm([0, 3000, 1000], [70, 30])
+    assert equities[0] == 0
+    assert equities[1] + equities[2] == pytest.approx(100)
+
+
+def test_busted_players_finish_last():
+    equities = exact_icm([0, 3000, 1000], [70, 30, 10])
+    assert equities[0] == 10
+    assert sum(equities) == pytest.approx(110)
+    assert exact_icm([0, 0, 1000], [50, 30, 20]) == [25, 25, 50]
+    assert monte_carlo_icm([0, 0, 1000], [50, 30, 20], trials=10) == [25, 25, 50]
+
+
+def test_more_payouts_than_players():
+    assert exact_icm([100], [60, 40]) == [60]
+
+
+def test_no_chips_raises_ValueError():
+    with pytest.raises(ValueError):
+        exact_icm([0, 0], [1])
+
+
+def test_monte_carlo_is_close_to_exact():
+    stacks, payouts = [1500, 3200, 800, 4500, 2000, 100], [50, 30, 20]
+    approximated = monte_carlo_icm(stacks, payouts, trials=20000, seed=1)
+    assert approximated == pytest.approx(exact_icm(stacks, payouts), abs=1)
+
+
+def test_large_field_is_approximated():
+    stacks = [1000 + 100 * player for player in range(40)]
+    payouts = [10] * 25
+    equities = icm(stacks, payouts)
+    assert sum(equities) == pytest.approx(250)
+    assert equities[-1] > equities[0]
+
+
+def test_players_icm():
+    players = [
+        _Player(name='Alice', stack=Decimal(3000), seat=1, combo=None),
+        _Player(name='Bob', stack=Decimal(1000), seat=2, combo=None),
+    ]
+    equities = players_icm(players, [70, 30])
+    assert list(equities) == ['Alice', 'Bob']
+    assert equities['Alice'] == pytest.approx(60)
+    assert equities['Bob'] == pytest.approx(40)
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import pytest
+from poker.hand import Hand
+from poker.orderings import ORDERINGS, _generate_orderings
+
+
+@pytest.mark.parametrize('name', sorted(ORDERINGS))
+def test_orderings_contain_every_hand_once(name):
+    assert sorted(Hand(hand) for hand in ORDERINGS[name]) == list(Hand)
+
+
+def test_orderings_are_the_same_as_generated():
+    assert _generate_orderings() == ORDERINGS
+
+
+def test_strongest_and_weakest_hands():
+    for ordering in ORDERINGS.values():
+        assert ordering[0] == 'AA'
+        assert ordering[-1] in ('32o', '72o')
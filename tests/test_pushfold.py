@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import pytest
+from poker import Strategy, Combo
+from poker.pushfold import solve
+
+
+@pytest.fixture(scope='module')
+def heads_up():
+    return solve([5, 10, 20])
+
+
+def test_returns_strategy_with_situations(heads_up):
+    assert isinstance(heads_up, Strategy)
+    assert list(heads_up) == ['5 BB', '5 BB vs SB push', '10 BB', '10 BB vs SB push',
+                              '20 BB', '20 BB vs SB push']
+    assert heads_up.inaction == 'PUSH'
+    assert heads_up['10 BB'].bb is None
+    assert heads_up['10 BB vs SB push'].inaction == 'CALL'
+    assert heads_up['10 BB vs SB push'].sb is None
+
+
+def test_heads_up_nash_ranges(heads_up):
+    # well known heads-up push/fold equilibrium at 10 big blinds
+    assert heads_up['10 BB'].sb.percent == pytest.approx(58, abs=2)
+    assert heads_up['10 BB vs SB push'].bb.percent == pytest.approx(37, abs=2)
+    assert Combo('AsKs') in heads_up['10 BB'].sb
+    assert Combo('7h2d') not in heads_up['10 BB vs SB push'].bb
+
+
+def test_shorter_stacks_play_wider(heads_up):
+    assert heads_up['5 BB'].sb > heads_up['10 BB'].sb > heads_up['20 BB'].sb
+    assert heads_up['5 BB vs SB push'].bb > heads_up['10 BB vs SB push'].bb
+
+
+def test_multiway():
+    strategy = solve([10], num_players=3, ante=0.1, iterations=100)
+    assert strategy['10 BB'].sb > strategy['10 BB'].btn
+    assert strategy['10 BB vs BTN push'].bb is not None
+    assert strategy['10 BB vs BTN push'].sb is not None
+
+
+def test_icm_calls_tighter_than_chip_ev():
+    chips = solve([10], num_players=3, iterations=100)
+    icm = solve([10], num_players=3, payouts=[50, 30, 20], iterations=100)
+    assert icm['10 BB vs BTN push'].bb < chips['10 BB vs BTN push'].bb
+
+
+def test_invalid_number_of_players():
+    with pytest.raises(ValueError):
+        solve([10], num_players=10)
@@ -218,6 +218,77 @@ class TestNumberOfCombos:
         assert len(Range('XX')) == 1326
 
 
+class TestCountOnBoard:
+    """Number of combos left after removing the ones with board cards."""
+
+    def test_pairs_on_board(self):
+        assert Range('AA KK').count_on_board([Card('As'), Card('Kd'), Card('7c')]) == 6
+
+    def test_card_strings_and_unaffected_hands(self):
+        assert Range('AKs QQ').count_on_board(['Ah', '2c', '3d']) == 3 + 6
+
+    def test_empty_board(self):
+        assert Range('XX').count_on_board(()) == 1326
+
+    def test_full_range_on_flop(self):
+        assert Range('XX').count_on_board(['As', 'Kd', '7c']) == 1176
+
+
+class TestLive:
+    """Range without the combos blocked by dead cards."""
+
+    def test_board_and_hero_combo(self):
+        live = Range('AA KK AKs').live([Combo('AhKh'), Card('Ad'), Card('7c')])
+        assert live == Range('AsAc KsKd KsKc KdKc AsKs AcKc')
+        assert len(live) == 1 + 3 + 2
+
+    def test_string_of_cards(self):
+        assert Range('QQ+').live('AsKd7c') == Range('QQ AhAd AhAc AdAc KsKh KsKc KhKc')
+
+    def test_whole_hands_stay_hands(self):
+        live = Range('22 AKo').live('Qs')
+        assert live._hands == {Hand('22'), Hand('AKo')}
+        assert not live._combos
+
+    def test_nothing_left(self):
+        assert Range('AsAh').live(Card('As')) == Range()
+
+    def test_count_is_the_same_as_count_on_board(self):
+        range_ = Range('22+ A2s+ K9o+')
+        assert len(range_.live('Ah9c3d')) == range_.count_on_board('Ah9c3d')
+
+
+class TestTop:
+    """Strongest hands by preflop orderings."""
+
+    def test_top_equity_hands(self):
+        assert Range.top(1) == Range('KK+')
+        assert Range.top(15) == Range('55+ A5s+ K9s+ QJs A9o+ KJo+')
+
+    def test_percent_in_range_string(self):
+        assert Range('15%') == Range.top(15)
+        assert Range('2.5% 22') == Range('99+ 22')
+
+    def test_cutoff_is_the_closest_number_of_combos(self):
+        # AA is 0.45%, AA KK is 0.9%
+        assert Range.top(0.2) == Range()
+        assert Range.top(0.3) == Range('AA')
+        assert Range.top(0.7) == Range('KK+')
+
+    def test_every_combo(self):
+        assert Range.top(100) == Range('XX')
+        assert Range.top(0) == Range()
+
+    def test_sklansky_chubukov_ordering(self):
+        assert Range.top(3, ordering='sklansky_chubukov') == Range('JJ+ AKs AKo')
+
+    def test_invalid_arguments_raise_ValueError(self):
+        with pytest.raises(ValueError):
+            Range.top(101)
+        with pytest.raises(ValueError):
+            Range.top(10, ordering='unknown')
+
+
 class TestComposeHands:
     """Test different constructors and composition of hands."""
 
@@ -230,6 +301,36 @@ class TestComposeHands:
         assert range.combos == DEUCE_COMBOS
         assert range.hands == (Hand('22'),)
 
+    def test_from_objects_with_strings(self):
+        assert Range.from_objects(['AKs', Hand('QQ'), 'AsAh']) == Range('AKs QQ AsAh')
+
+    def test_from_objects_with_other_type_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            Range.from_objects([Card('As')])
+
+    def test_from_hands(self):
+        assert Range.from_hands([Hand('AA'), 'KK', 'AKs']) == Range('KK+ AKs')
+
+    def test_from_combos_makes_whole_hands(self):
+        range = Range.from_combos(DEUCE_COMBOS + ('AsKs',))
+        assert range == Range('22 AsKs')
+        assert range._hands == {Hand('22')}
+        assert range._combos == {Combo('AsKs')}
+
+    def test_from_mask(self):
+        range = Range('JJ+ AKo AsKs 7h6h')
+        assert Range.from_mask(range._mask) == range
+        assert Range.from_mask(0) == Range()
+
+    def test_changing_objects_of_a_range_doesnt_change_other_ranges(self):
+        mask = Range('AsKs KK')._mask
+        range = Range.from_mask(mask)
+        range.combos[0].second = Card('2c')
+        range.hands[0].shape = 's'
+        assert Range.from_mask(mask) == Range('AsKs KK')
+        Range.top(1).hands[0].shape = 's'
+        assert Range.top(1) == Range('KK+')
+
     @pytest.mark.xfail
     def test_from_percent(self):
         assert Range.from_percent(0.9) == Range('KK+')
@@ -446,10 +547,35 @@ class TestContains:
     def test_str_in_range(self):
         assert 'AKo' in Range('AQo+')
 
+    def test_combo_of_a_hand_in_range(self):
+        assert Combo('AsKd') in Range('AQo+')
+        assert 'AsKs' not in Range('AQo+')
+
+    def test_hand_with_one_combo_in_range(self):
+        assert Hand('AKs') in Range('AsKs')
+        assert 'AKo' not in Range('AsKs')
+
     def test_wrong_str_in_range_raises_ValueError(self):
         with pytest.raises(ValueError):
             assert 'AKl' in Range('AQo+')
 
 
+class TestGrid:
+    def test_html_cells(self):
+        html = Range('AA AsKs 72o').to_html()
+        assert html.startswith('<table class="range"><tr><td class="pair">AA</td>'
+                               '<td class="suited">AKs</td><td class="suited"></td>')
+        assert html.count('<td') == 169
+        assert html.count('</tr>') == 13
+        assert '<td class="offsuit">72o</td>' in html
+
+    def test_ascii_cells(self):
+        lines = Range('AA AKo 22').to_ascii().split('\n')
+        assert len(lines) == 13
+        assert lines[0].startswith('AA      ')
+        assert lines[1].startswith('AKo ')
+        assert lines[-1].endswith('22  ')
+
+
 def test_pickable():
     assert pickle.loads(pickle.dumps(Range('Ako 22+'))) == Range('AKo 22+')
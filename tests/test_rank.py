@@ -70,6 +70,18 @@ def test_invalid_rank_raises_InvalidRank_Exception():
         Rank('L')
 
 
+def test_lookup_by_number_and_unhashable_value():
+    assert Rank(10) is Rank.TEN
+    with pytest.raises(ValueError):
+        Rank(['A'])
+
+
+def test_sorting_follows_definition_order():
+    assert sorted(Rank, reverse=True) == list(Rank)[::-1]
+    assert sorted([Rank('K'), Rank('2'), Rank('A'), Rank('T')]) == \
+        [Rank('2'), Rank('T'), Rank('K'), Rank('A')]
+
+
 def test_passing_Rank_instance_to__init__():
     r1 = Rank('A')
     r2 = Rank(r1)
@@ -11,6 +11,11 @@ def test_all():
     assert list(lexer) == [('ALL', 'XX')]
 
 
+def test_percent():
+    assert list(_RegexRangeLexer('15%')) == [('PERCENT', 15.)]
+    assert list(_RegexRangeLexer('2.5%')) == [('PERCENT', 2.5)]
+
+
 def test_pair_simple():
     lexer = _RegexRangeLexer('44')
     assert list(lexer) == [('PAIR', '4')]
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import collections
+import pytest
+from poker.card import Card
+from poker.hand import Hand, Combo, Range
+from poker.deck import to_masks
+from poker.sampler import ComboSampler, _make_alias_table
+
+
+def test_alias_table_probabilities():
+    weights = [1., 2., 3., 0., 4.]
+    probabilities, aliases = _make_alias_table(weights)
+    # probability of every column: kept in own column and from the aliased ones
+    totals = [0.] * len(weights)
+    for column, (probability, alias) in enumerate(zip(probabilities, aliases)):
+        totals[column] += probability / len(weights)
+        totals[alias] += (1 - probability) / len(weights)
+    assert totals == pytest.approx([weight / 10 for weight in weights])
+
+
+def test_dead_cards_are_removed():
+    sampler = Range('AA KK').sampler(dead='AhKd')
+    assert len(sampler) == 3 + 3
+    assert all('Ah' not in unicode(combo) for combo in sampler.combos)
+
+
+def test_samples_are_from_the_range_and_reproducible():
+    range_ = Range('QQ+ AKs')
+    samples = [range_.sampler(seed=1).sample() for _ in range(3)]
+    assert samples[0] == samples[1] == samples[2]
+    sampler = range_.sampler(seed=2)
+    assert all(sampler.sample() in range_ for _ in range(100))
+
+
+def test_weights_by_hand():
+    sampler = Range('AA KK').sampler(weights={Hand('KK'): 3}, seed=3)
+    counts = collections.Counter(sampler.sample().to_hand() for _ in range(8000))
+    assert counts[Hand('KK')] / 8000 == pytest.approx(0.75, abs=0.02)
+
+
+def test_excluded_cards_are_rejected():
+    sampler = Range('AA').sampler(seed=4)
+    for _ in range(50):
+        assert Card('As') not in sampler.sample(exclude='As').cards
+
+
+def test_no_possible_combo_raises_ValueError():
+    with pytest.raises(ValueError):
+        Range('AsAh').sampler(dead='As')
+    with pytest.raises(ValueError):
+        Range('AsAh').sampler().sample(exclude=[Card('Ah')])
+    with pytest.raises(ValueError):
+        Range('AsAh').sampler().sample_many(10, exclude='Ah')
+
+
+def test_only_zero_weight_combos_left_raises_ValueError():
+    sampler = ComboSampler([Combo('AsKs'), Combo('2c2d')], weights={Combo('2c2d'): 0})
+    assert sampler.sample(exclude='Ah') == Combo('AsKs')
+    with pytest.raises(ValueError):
+        sampler.sample(exclude='As')
+    with pytest.raises(ValueError):
+        sampler.sample_many(10, exclude='As')
+
+
+class TestSampleMany:
+    def test_shape_and_cards(self):
+        samples = Range('AKs').sampler(seed=5).sample_many(1000)
+        assert samples.shape == (1000, 2)
+        combos = {Combo.from_cards(*(list(Card)[index] for index in row))
+                  for row in samples.tolist()}
+        assert combos == set(Range('AKs').combos)
+
+    def test_conflicts_with_other_samples_are_rejected(self):
+        hero = Range('XX').sampler(seed=6).sample_many(20000)
+        villain = Range('AA KK QQ AKs').sampler(seed=7).sample_many(20000,
+                                                                    exclude=to_masks(hero))
+        assert not (to_masks(hero) & to_masks(villain)).any()
+
+    def test_weighted_frequencies(self):
+        sampler = ComboSampler([Combo('AsKs'), Combo('2c2d')], weights={Combo('2c2d'): 4},
+                               seed=8)
+        samples = sampler.sample_many(50000)
+        assert (samples[:, 0] == Card('As')._index).mean() == pytest.approx(0.2, abs=0.01)
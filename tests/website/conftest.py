@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import hashlib
+import threading
+from urlparse import parse_qs
+from pathlib import Path
+from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+from SocketServer import ThreadingMixIn
+import pytest
+from poker.website import _common
+
+
+PAGES_DIR = Path(__file__).parent / 'pages'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the saved pages with an ETag, failing paths in server.failures with 503
+    as many times as set.
+    """
+
+    # keep-alive, so connection reuse can be observed
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self, path=None):
+        self.server.requests.append((self.command, self.path, self.client_address, self.headers))
+        path = path or self.path.split('?')[0].strip('/')
+
+        if self.server.failures.get(path):
+            self.server.failures[path] -= 1
+            return self._send(503, b'')
+
+        page = PAGES_DIR / path
+        if not page.is_file():
+            return self._send(404, b'')
+        with page.open('rb') as fp:
+            body = fp.read()
+
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get('If-None-Match') == etag:
+            return self._send(304, b'', etag)
+        self._send(200, body, etag)
+
+    def do_POST(self):
+        """2+2 user search, answered with usersearch/<fragment>.xml"""
+        form = parse_qs(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        self.do_GET('usersearch/%s.xml' % form['fragment'][0])
+
+    def _send(self, status, body, etag=None):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def http_server():
+    server = _Server(('127.0.0.1', 0), _Handler)
+    server.requests = []
+    server.failures = {}
+    server.url = 'http://127.0.0.1:%d' % server.server_address[1]
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def website_settings():
+    """Restore the shared session settings after the test."""
+    saved = _common.TIMEOUT, _common.RETRIES, _common.CONCURRENCY, _common._cache
+    yield _common
+    _common.TIMEOUT, _common.RETRIES, _common.CONCURRENCY, _common._cache = saved
+    _common._session = None
+    if _common._pool is not None:
+        _common._pool.close()
+        _common._pool = None
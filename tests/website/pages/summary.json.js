@@ -0,0 +1,15 @@
+{"tournaments": {"summary": {
+    "updated": "2014-08-16T10:15:00-04:00",
+    "tables": 16427,
+    "next_update": 60,
+    "players": 110430,
+    "clubs": 324575,
+    "club_members": 1738003,
+    "active_tournaments": 7853,
+    "total_tournaments": 15066,
+    "site": [
+        {"id": ".FR", "tables": 1048, "players": 6386, "active_tournaments": 435},
+        {"id": ".IT", "tables": 944, "players": 5543, "active_tournaments": 512}
+    ],
+    "play_money": {"tables": 2516, "players": 16301, "active_tournaments": 1077}
+}}}
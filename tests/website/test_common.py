@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+import threading
+import time
+from datetime import datetime
+from dateutil.tz import tzoffset
+from poker.website import _common, pokerstars
+
+
+def test_get_status(http_server, monkeypatch):
+    monkeypatch.setattr(pokerstars, 'STATUS_URL', http_server.url + '/summary.json.js')
+    status = pokerstars.get_status()
+
+    assert status.players == 110430
+    assert status.tables == 16427
+    assert status.updated == datetime(2014, 8, 16, 10, 15, tzinfo=tzoffset(None, -14400))
+    assert [site.id for site in status.sites] == ['.FR', '.IT', 'Play Money']
+
+
+def test_get_status_async(http_server, monkeypatch):
+    monkeypatch.setattr(pokerstars, 'STATUS_URL', http_server.url + '/summary.json.js')
+    result = pokerstars.get_status_async()
+    assert result.get(timeout=5).players == 110430
+
+
+def test_get_current_tournaments_async(http_server, monkeypatch):
+    monkeypatch.setattr(pokerstars, 'TOURNAMENTS_XML_URL', http_server.url + '/all.xml')
+    tournaments = pokerstars.get_current_tournaments_async().get(timeout=5)
+
+    assert len(tournaments) == 4
+    assert tournaments[0].name == "Copernicus' FL Omaha H/L Freeroll"
+    assert tournaments[1].players == 80
+
+
+def test_connection_is_reused(http_server):
+    _common.get(http_server.url + '/all.xml')
+    _common.get(http_server.url + '/all.xml')
+
+    client_addresses = {address for _, _, address, _ in http_server.requests}
+    assert len(http_server.requests) == 2
+    assert len(client_addresses) == 1
+
+
+def test_server_errors_are_retried(http_server):
+    http_server.failures['all.xml'] = 2
+    response = _common.get(http_server.url + '/all.xml')
+
+    assert response.status_code == 200
+    assert len(http_server.requests) == 3
+
+
+def test_map_concurrently_keeps_order():
+    results = _common.map_concurrently(lambda x: x * 2, range(20), concurrency=4)
+    assert results == list(range(0, 40, 2))
+
+
+def _get_max_running(map_work):
+    running, max_running = [0], [0]
+    lock = threading.Lock()
+
+    def work(item):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return item
+
+    map_work(work)
+    return max_running[0]
+
+
+def test_map_concurrently_is_bounded():
+    assert _get_max_running(lambda work: _common.map_concurrently(work, range(30),
+                                                                  concurrency=3)) == 3
+
+
+def test_configured_concurrency_is_the_default(website_settings):
+    website_settings.configure(concurrency=2)
+    assert _get_max_running(lambda work: _common.map_concurrently(work, range(30))) == 2
+
+
+def test_configured_concurrency_resizes_the_shared_pool(website_settings):
+    _common.run_async(int).get(timeout=5)
+    website_settings.configure(concurrency=2)
+
+    def map_work(work):
+        results = [_common.run_async(work, item) for item in range(30)]
+        return [result.get(timeout=5) for result in results]
+
+    assert _get_max_running(map_work) == 2
+
+
+def test_retry_settings():
+    retry = _common._make_retry(5)
+    assert retry.total == 5
+    assert retry.is_retry('POST', 503)
+
+
+def test_cache_files_are_overwritten(tmpdir):
+    cache = _common._DiskCache(str(tmpdir))
+    cache._write('page.body', b'old')
+    cache._write('page.body', b'new')
+    assert tmpdir.listdir() == [tmpdir.join('page.body')]
+    assert tmpdir.join('page.body').read_binary() == b'new'
+
+
+def test_cached_page_is_revalidated(http_server, website_settings, tmpdir):
+    website_settings.configure(cache_dir=str(tmpdir))
+    first = _common.get(http_server.url + '/all.xml')
+    second = _common.get(http_server.url + '/all.xml')
+
+    assert second.content == first.content
+    assert second.from_cache
+    assert len(http_server.requests) == 2
+    assert http_server.requests[1][3]['If-None-Match'] == first.headers['ETag']
+
+
+def test_cached_page_is_not_downloaded_within_ttl(http_server, website_settings, tmpdir):
+    website_settings.configure(cache_dir=str(tmpdir), cache_ttl=60)
+    url = http_server.url + '/summary.json.js'
+    first = _common.get(url).json()
+    second = _common.get(url).json()
+
+    assert first == second
+    assert len(http_server.requests) == 1
+
+
+def test_configure_replaces_session(website_settings):
+    session = _common.get_session()
+    website_settings.configure(timeout=5)
+
+    assert _common.get_session() is not session
+    assert _common.TIMEOUT == 5
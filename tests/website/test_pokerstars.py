@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+from datetime import datetime
+from dateutil.parser import parse as parse_date
+from dateutil.tz import tzoffset
+import pytest
+from poker.constants import Game
+from poker.website import pokerstars
+from poker.website.pokerstars import get_current_tournaments, _parse_feed_date
+
+
+@pytest.fixture
+def feed(http_server, monkeypatch):
+    monkeypatch.setattr(pokerstars, 'TOURNAMENTS_XML_URL', http_server.url + '/all.xml')
+    return http_server
+
+
+@pytest.mark.parametrize('date_string', (
+    '2014-08-16T08:02:00-04:00',
+    '2014-12-31T23:59:59+05:30',
+    '2014-08-16T08:02:00+00:00',
+    '2014-08-16T08:02:00Z',
+    '2014-08-16 08:02',
+))
+def test_parse_feed_date_same_as_dateutil(date_string):
+    parsed = _parse_feed_date(date_string)
+    assert parsed == parse_date(date_string)
+    assert parsed.utcoffset() == parse_date(date_string).utcoffset()
+
+
+def test_tournaments(feed):
+    tournaments = list(get_current_tournaments())
+
+    assert len(tournaments) == 4
+    assert tournaments[0] == pokerstars._Tournament(
+        start_date=datetime(2014, 8, 16, 8, 2, tzinfo=tzoffset(None, -14400)),
+        name="Copernicus' FL Omaha H/L Freeroll", game='Omaha', buyin='$0 + $0', players=2509
+    )
+
+
+def test_filter_game(feed):
+    assert [t.players for t in get_current_tournaments(game='Omaha')] == [2509]
+    assert [t.players for t in get_current_tournaments(game=Game.HOLDEM)] == [80, 14, 45]
+
+
+def test_filter_buyin(feed):
+    assert [t.players for t in get_current_tournaments(min_buyin=1)] == [45]
+    assert [t.players for t in get_current_tournaments(max_buyin='0.55')] == [2509, 80, 14]
+    assert [t.players for t in get_current_tournaments(min_buyin=0.1, max_buyin=1)] == [80, 14]
+
+
+def test_filter_start_window(feed):
+    start = datetime(2014, 8, 16, 8, 10, tzinfo=tzoffset(None, -14400))
+    end = datetime(2014, 8, 16, 8, 20, tzinfo=tzoffset(None, -14400))
+
+    assert [t.players for t in get_current_tournaments(start_after=start)] == [14, 45]
+    assert [t.players for t in get_current_tournaments(start_after=start,
+                                                       start_before=end)] == [14]
+
+
+def test_tournaments_from_cache(feed, website_settings, tmpdir):
+    website_settings.configure(cache_dir=str(tmpdir), cache_ttl=60)
+
+    assert len(list(get_current_tournaments())) == 4
+    assert len(list(get_current_tournaments(game='Omaha'))) == 1
+    assert len(feed.requests) == 1
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals, absolute_import, division, print_function
+
+from datetime import date
+import pytest
+from lxml import etree
+from poker.website import twoplustwo
+from poker.website.twoplustwo import ForumMember, UserNotFoundError
+
+
+@pytest.fixture
+def forum(http_server, monkeypatch):
+    monkeypatch.setattr(twoplustwo, 'FORUM_MEMBER_URL', http_server.url + '/members')
+    monkeypatch.setattr(twoplustwo, 'AJAX_USERSEARCH_URL', http_server.url + '/ajax.php')
+    return http_server
+
+
+def test_parse_member(forum):
+    member = ForumMember('Walkman_')
+
+    assert member.id == '115014'
+    assert member.username == 'Walkman_ '
+    assert member.rank == 'enthusiast'
+    assert member.location == 'Hungary'
+    assert member.total_posts == 92
+    assert member.posts_per_day == 0.04
+    assert member.public_usergroups == ('Marketplace Approved',)
+    assert member.join_date == date(2008, 3, 10)
+    assert member.last_activity.date() == date(2014, 8, 25)
+    assert member.profile_picture.endswith('profilepic115014_1.gif')
+    assert member.avatar.endswith('avatar115014_1.gif')
+
+
+def test_missing_stats_box_means_no_last_activity():
+    root = etree.HTML('<div id="collapseobj_aboutme"></div>'
+                      '<div class="smallfont" align="center">All times are GMT -4. </div>')
+    member = object.__new__(ForumMember)
+    boxes = member._get_boxes(root)
+    assert sorted(boxes) == ['collapseobj_aboutme', 'timezone']
+    member._parse_last_activity(boxes, member._get_timezone(boxes))
+    assert member.last_activity is None
+
+
+def test_boxes_are_searched_in_the_stats_container():
+    root = etree.HTML('<div><div id="collapseobj_stats"></div><ul id="public_usergroup_list">'
+                      '</ul></div><img id="user_avatar" src="outside.gif">'
+                      '<div class="smallfont" align="center">All times are GMT -4. </div>')
+    boxes = object.__new__(ForumMember)._get_boxes(root)
+    assert sorted(boxes) == ['collapseobj_stats', 'public_usergroup_list', 'timezone']
+
+
+def test_fetch_many(forum):
+    members = ForumMember.fetch_many(['Walkman_', 'Walkman_'])
+    assert [member.id for member in members] == ['115014', '115014']
+
+
+def test_fetch_many_raises_for_missing_user(forum):
+    with pytest.raises(UserNotFoundError):
+        ForumMember.fetch_many(['Walkman_', 'nosuchuser'])
+
+
+def test_fetch_many_skip_missing(forum):
+    members = ForumMember.fetch_many(['nosuchuser', 'Walkman_', 'Walk'], skip_missing=True)
+
+    assert members[0] is None
+    assert members[1].username == 'Walkman_ '
+    assert members[2] is None